@@ -5,7 +5,7 @@ import python_lib_for_me as pyl
 import tweepy
 
 from twitter_app.util import const_util
-from twitter_app.util.twitter_api_v1_1 import twitter_api_auth_util
+from twitter_app.util.twitter_api_v1_1 import twitter_api_auth_util, twitter_api_pool_util
 
 
 def do_logic_that_generate_api_by_oauth_1_user(
@@ -91,6 +91,32 @@ def do_logic_that_generate_api_by_oauth_2_app(
     return api
 
 
+def do_logic_that_generate_api_pool(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    use_app_context: bool = False,
+) -> twitter_api_pool_util.TwitterApiPool:
+    """ロジック実行(TwitterAPI認証)(APIプール)"""
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+        clg.log_inf(f"ロジック実行(TwitterAPI認証)を開始します。")
+
+        twitter_api_auth_info: twitter_api_auth_util.TwitterApiAuthInfo = __get_twitter_api_auth_info(use_debug_mode)
+        api_pool: twitter_api_pool_util.TwitterApiPool = twitter_api_auth_util.generate_api_pool(
+            use_debug_mode, api, twitter_api_auth_info, True, use_app_context=use_app_context
+        )
+    except Exception as e:
+        raise (e)
+    finally:
+        if clg is not None:
+            clg.log_inf(f"ロジック実行(TwitterAPI認証)を終了します。")
+
+    return api_pool
+
+
 def __get_twitter_api_auth_info(
     use_debug_mode: bool,
 ) -> twitter_api_auth_util.TwitterApiAuthInfo:
@@ -1,5 +1,6 @@
+import os
 from enum import IntEnum, auto
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import pandas as pd
 import python_lib_for_me as pyl
@@ -8,6 +9,7 @@ from tweepy.models import ResultSet
 
 from twitter_app import util
 from twitter_app.util import const_util, pandas_util
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util
 from twitter_app.util.twitter_api_v1_1.standard import twitter_developer_util, twitter_users_util
 
 
@@ -16,16 +18,23 @@ class EnumOfProc(IntEnum):
     EXPORT_FOLLOWER = auto()
 
 
+class EnumOfFetchEngine(IntEnum):
+    LIST = auto()  # GET friends/list, followers/list
+    IDS_AND_LOOKUP = auto()  # GET friends/ids, followers/ids -> GET users/lookup
+
+
 def do_logic(
     use_debug_mode: bool,
     api: tweepy.API,
     enum_of_proc: EnumOfProc,
     user_id: str,
     num_of_followxxs: int,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
 ) -> None:
     """ロジック実行"""
 
     clg: Optional[pyl.CustomLogger] = None
+    followxx_file_path: str = ""
 
     try:
         # ロガーの取得
@@ -35,95 +44,310 @@ def do_logic(
         # Pandasオプション設定
         pd.set_option("display.unicode.east_asian_width", True)
 
-        # フォロイー(フォロワー)の個別処理
-        followxx_pages: list[ResultSet] = []
+        # フォロイー(フォロワー)ファイルパスフォーマットの決定
         followxx_file_path_format: str = ""
         if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
-            # 想定処理時間の表示
-            util.show_estimated_proc_time(
-                use_debug_mode,
-                num_of_followxxs,
-                twitter_users_util.EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
-            )
+            followxx_file_path_format = const_util.FOLLOWEE_FILE_PATH
+        elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
+            followxx_file_path_format = const_util.FOLLOWER_FILE_PATH
 
-            # レート制限の表示
-            twitter_developer_util.show_rate_limit_of_friends_list(use_debug_mode, api)
+        # フォロイー(フォロワー)ファイルパスの生成
+        user_info: Any = twitter_users_util.get_user_info(use_debug_mode, api, user_id, util.UserStore())
+        followxx_file_path = followxx_file_path_format.format(user_info.screen_name, user_info.name)
 
-            # フォロイーページの取得
-            followxx_pages = twitter_users_util.get_followee_pages(
-                use_debug_mode,
-                api,
-                user_id,
-                num_of_data=num_of_followxxs,
+        # エクスポートチェックポイントの読み込み(同じユーザのエクスポートが中断されている場合は続きから再開する)
+        export_checkpoint: Optional[util.ExportCheckpoint] = util.load_export_checkpoint(
+            use_debug_mode, followxx_file_path
+        )
+        if export_checkpoint is not None and export_checkpoint.user_id != user_id:
+            export_checkpoint = None
+        num_of_existing_rows: int = 0
+        num_of_consumed_followxxs: int = 0
+        page_cursor: twitter_users_util.PageCursor = twitter_users_util.PageCursor()
+        if export_checkpoint is not None:
+            num_of_existing_rows = export_checkpoint.num_of_rows
+            num_of_consumed_followxxs = export_checkpoint.num_of_consumed_data
+            page_cursor = twitter_users_util.PageCursor(export_checkpoint.next_cursor, num_of_consumed_followxxs)
+            pandas_util.truncate_list_member_file(use_debug_mode, followxx_file_path, num_of_existing_rows)
+            clg.log_inf(
+                f"中断されたエクスポートを再開します。" + f"(書き込み済み行数：{num_of_existing_rows}、中断日時：{export_checkpoint.update_datetime})"
             )
 
-            # フォロイーファイルパスフォーマットの決定
-            followxx_file_path_format = const_util.FOLLOWEE_FILE_PATH
+        # フォロイー(フォロワー)ファイルストリーム書き込みの生成
+        followxx_file_writer: pandas_util.ListMemberFileStreamWriter = pandas_util.ListMemberFileStreamWriter(
+            use_debug_mode, followxx_file_path, num_of_existing_rows=num_of_existing_rows
+        )
+
+        # 取得対象数の算出(再開する場合は取得済みの分を除く)(補完できなかったユーザも取得済みとする)
+        num_of_target_followxxs: int = num_of_followxxs
+        if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
+            num_of_target_followxxs = min(num_of_followxxs, user_info.friends_count)
         elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
-            # 想定処理時間の表示
-            util.show_estimated_proc_time(
-                use_debug_mode,
-                num_of_followxxs,
-                twitter_users_util.EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
-            )
+            num_of_target_followxxs = min(num_of_followxxs, user_info.followers_count)
+        num_of_target_followxxs = max(num_of_target_followxxs - num_of_consumed_followxxs, 0)
+
+        # 取得方式の決定(レート制限の1期間で取得しきれない場合はID取得後にユーザ情報を補完する)
+        # (再開する場合はカーソルの互換性を保つために中断前の取得方式を引き継ぐ)
+        enum_of_fetch_engine: EnumOfFetchEngine = EnumOfFetchEngine.LIST
+        if export_checkpoint is not None:
+            enum_of_fetch_engine = EnumOfFetchEngine[export_checkpoint.fetch_engine]
+        else:
+            enum_of_fetch_engine = __select_fetch_engine(enum_of_proc, num_of_target_followxxs)
+        clg.log_inf(f"取得方式：{enum_of_fetch_engine.name} (取得対象数：{num_of_target_followxxs}人)")
 
-            # レート制限の表示
-            twitter_developer_util.show_rate_limit_of_followers_list(use_debug_mode, api)
+        # 想定処理時間の表示
+        __show_estimated_proc_time(use_debug_mode, enum_of_proc, enum_of_fetch_engine, num_of_target_followxxs)
 
-            # フォロワーページの取得
-            followxx_pages = twitter_users_util.get_follower_pages(
+        # レート制限の表示
+        __show_rate_limit(use_debug_mode, api, enum_of_proc, enum_of_fetch_engine)
+
+        # フォロイー(フォロワー)ページの取得(イテレータ)(最終ページまで取得済みの場合は取得しない)
+        followxx_pages: Iterator[ResultSet] = iter([])
+        if page_cursor.cursor != 0:
+            followxx_pages = __iter_followxx_pages(
                 use_debug_mode,
                 api,
+                enum_of_proc,
+                enum_of_fetch_engine,
                 user_id,
-                num_of_data=num_of_followxxs,
+                max(num_of_followxxs - num_of_consumed_followxxs, 0),
+                page_cursor,
+                util.ProgressReporter(
+                    use_debug_mode,
+                    api,
+                    __select_endpoint_of_page(enum_of_proc, enum_of_fetch_engine),
+                    num_of_data=num_of_target_followxxs,
+                    api_pool=api_pool,
+                ),
+                api_pool,
             )
 
-            # フォロワーファイルパスフォーマットの決定
-            followxx_file_path_format = const_util.FOLLOWER_FILE_PATH
+        # フォロイー(フォロワー)ファイルへの追記(ページの到着ごと)
+        saved_next_cursor: int = page_cursor.cursor
+        for followxxs_by_page in followxx_pages:
+            followxx_file_writer.write_users(followxxs_by_page)
+
+            # エクスポートチェックポイントの保存(次ページの取得位置が進んだ場合)
+            if page_cursor.next_cursor != saved_next_cursor:
+                util.save_export_checkpoint(
+                    use_debug_mode,
+                    followxx_file_path,
+                    util.ExportCheckpoint(
+                        user_id,
+                        enum_of_fetch_engine.name,
+                        page_cursor.next_cursor,
+                        followxx_file_writer.num_of_rows,
+                        (
+                            page_cursor.num_of_consumed_data
+                            if enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP
+                            else followxx_file_writer.num_of_rows
+                        ),
+                    ),
+                )
+                saved_next_cursor = page_cursor.next_cursor
+
+        # エクスポートチェックポイントの削除(エクスポート完了)
+        util.delete_export_checkpoint(use_debug_mode, followxx_file_path)
 
         # フォロイー(フォロワー)ページの件数が0件の場合
-        if len(followxx_pages) == 0:
+        if followxx_file_writer.num_of_rows == 0:
             clg.log_wrn(f"フォロイー(フォロワー)ページの件数が0件です。(user_id:{user_id})")
         else:
-            # フォロイー(フォロワー)データフレームの初期化
-            followxx_df: pd.DataFrame = pd.DataFrame(columns=const_util.LIST_MEMBER_HEADER)
-
-            # フォロイー(フォロワー)データフレームへの格納
-            for followxxs_by_page in followxx_pages:
-                # followxx: tweepy.models.User
-                for followxx in followxxs_by_page:
-                    # ユーザ情報データフレームの格納
-                    user_info_df = pd.DataFrame(
-                        [
-                            [
-                                followxx.screen_name,
-                                followxx.name,
-                                const_util.ACCOUNT_URL.format(followxx.screen_name),
-                            ]
-                        ],
-                        columns=const_util.LIST_MEMBER_HEADER,
-                    )
-                    followxx_df = pd.concat([followxx_df, user_info_df], ignore_index=True)
-
-            # フォロイー(フォロワー)ファイルパスの生成
-            user_info: Any = twitter_users_util.get_user_info(use_debug_mode, api, user_id)
-            followxx_file_path: str = followxx_file_path_format.format(user_info.screen_name, user_info.name)
-
-            # フォロイー(フォロワー)データフレームの保存
-            clg.log_inf(f"フォロイー(フォロワー)(追加分先頭n行)：\n{followxx_df.head(5)}")
-            clg.log_inf(f"フォロイー(フォロワー)(追加分末尾n行)：\n{followxx_df.tail(5)}")
+            clg.log_inf(f"フォロイー(フォロワー)(追加分先頭n行)：\n{followxx_file_writer.head_df}")
+            clg.log_inf(f"フォロイー(フォロワー)(追加分末尾n行)：\n{followxx_file_writer.tail_df}")
             clg.log_inf(f"フォロイー(フォロワー)ファイルパス：\n{followxx_file_path}")
-            pandas_util.save_list_member_df(use_debug_mode, followxx_df, followxx_file_path)
 
         # レート制限の表示
-        if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
-            twitter_developer_util.show_rate_limit_of_friends_list(use_debug_mode, api)
-        elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
-            twitter_developer_util.show_rate_limit_of_followers_list(use_debug_mode, api)
+        __show_rate_limit(use_debug_mode, api, enum_of_proc, enum_of_fetch_engine)
     except Exception as e:
+        # フォロイー(フォロワー)ファイルの削除(チェックポイントがない場合は書き込み途中のファイルを残さない)
+        if followxx_file_path != "" and os.path.isfile(followxx_file_path) is True:
+            if os.path.isfile(const_util.EXPORT_CHECKPOINT_FILE_PATH.format(followxx_file_path)) is True:
+                if clg is not None:
+                    clg.log_wrn(f"エクスポートを中断しました。同じユーザで再実行すると続きから再開します。")
+            else:
+                os.remove(followxx_file_path)
+
         raise (e)
     finally:
         if clg is not None:
             clg.log_inf(f"ロジック実行(Twitterフォロイー(フォロワー)エクスポート)を終了します。")
 
     return None
+
+
+def __select_fetch_engine(
+    enum_of_proc: EnumOfProc,
+    num_of_target_followxxs: int,
+) -> EnumOfFetchEngine:
+    """取得方式選択(レート制限の1期間で取得しきれない場合はID取得後にユーザ情報を補完する)"""
+
+    enum_of_fetch_engine: EnumOfFetchEngine = EnumOfFetchEngine.LIST
+
+    max_num_of_data_per_15min: int = 0
+    if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
+        max_num_of_data_per_15min = twitter_users_util.EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value
+    elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
+        max_num_of_data_per_15min = twitter_users_util.EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value
+
+    if num_of_target_followxxs > max_num_of_data_per_15min:
+        enum_of_fetch_engine = EnumOfFetchEngine.IDS_AND_LOOKUP
+
+    return enum_of_fetch_engine
+
+
+def __show_estimated_proc_time(
+    use_debug_mode: bool,
+    enum_of_proc: EnumOfProc,
+    enum_of_fetch_engine: EnumOfFetchEngine,
+    num_of_target_followxxs: int,
+) -> None:
+    """想定処理時間表示"""
+
+    try:
+        # データ数／１５分(ページ取得)
+        max_num_of_data_per_15min: int = 0
+        if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
+            if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+                max_num_of_data_per_15min = (
+                    twitter_users_util.EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value
+                )
+            elif enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+                max_num_of_data_per_15min = (
+                    twitter_users_util.EnumOfFolloweeId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value
+                )
+        elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
+            if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+                max_num_of_data_per_15min = (
+                    twitter_users_util.EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value
+                )
+            elif enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+                max_num_of_data_per_15min = (
+                    twitter_users_util.EnumOfFollowerId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value
+                )
+
+        # データ数／１５分(ID取得後のユーザ情報の補完)
+        if enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+            max_num_of_data_per_15min = min(
+                max_num_of_data_per_15min, twitter_users_util.EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_15MIN.value
+            )
+
+        util.show_estimated_proc_time(use_debug_mode, num_of_target_followxxs, max_num_of_data_per_15min)
+    except Exception as e:
+        raise (e)
+
+    return None
+
+
+def __show_rate_limit(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    enum_of_proc: EnumOfProc,
+    enum_of_fetch_engine: EnumOfFetchEngine,
+) -> None:
+    """レート制限表示"""
+
+    try:
+        if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
+            if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+                twitter_developer_util.show_rate_limit_of_friends_list(use_debug_mode, api)
+            elif enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+                twitter_developer_util.show_rate_limit_of_friends_ids(use_debug_mode, api)
+                twitter_developer_util.show_rate_limit_of_users_lookup(use_debug_mode, api)
+        elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
+            if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+                twitter_developer_util.show_rate_limit_of_followers_list(use_debug_mode, api)
+            elif enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+                twitter_developer_util.show_rate_limit_of_followers_ids(use_debug_mode, api)
+                twitter_developer_util.show_rate_limit_of_users_lookup(use_debug_mode, api)
+    except Exception as e:
+        raise (e)
+
+    return None
+
+
+def __select_endpoint_of_page(
+    enum_of_proc: EnumOfProc,
+    enum_of_fetch_engine: EnumOfFetchEngine,
+) -> str:
+    """ページ取得エンドポイント選択(1ページ1リクエストで取得するエンドポイント)"""
+
+    endpoint: str = "/users/lookup"
+
+    if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+        if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
+            endpoint = "/friends/list"
+        elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
+            endpoint = "/followers/list"
+
+    return endpoint
+
+
+def __iter_followxx_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    enum_of_proc: EnumOfProc,
+    enum_of_fetch_engine: EnumOfFetchEngine,
+    user_id: str,
+    num_of_followxxs: int,
+    page_cursor: twitter_users_util.PageCursor,
+    progress_reporter: util.ProgressReporter,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool],
+) -> Iterator[ResultSet]:
+    """フォロイー(フォロワー)ページ取得(イテレータ)"""
+
+    followxx_pages: Iterator[ResultSet] = iter([])
+
+    try:
+        if enum_of_proc == EnumOfProc.EXPORT_FOLLOWEE:
+            if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+                followxx_pages = twitter_users_util.iter_followee_pages(
+                    use_debug_mode,
+                    api,
+                    user_id,
+                    num_of_data=num_of_followxxs,
+                    page_cursor=page_cursor,
+                    progress_reporter=progress_reporter,
+                    use_raw_json_parser=True,
+                    fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+                )
+            elif enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+                followxx_pages = twitter_users_util.iter_followee_pages_by_ids(
+                    use_debug_mode,
+                    api,
+                    user_id,
+                    num_of_data=num_of_followxxs,
+                    page_cursor=page_cursor,
+                    progress_reporter=progress_reporter,
+                    api_pool=api_pool,
+                    use_raw_json_parser=True,
+                    fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+                )
+        elif enum_of_proc == EnumOfProc.EXPORT_FOLLOWER:
+            if enum_of_fetch_engine == EnumOfFetchEngine.LIST:
+                followxx_pages = twitter_users_util.iter_follower_pages(
+                    use_debug_mode,
+                    api,
+                    user_id,
+                    num_of_data=num_of_followxxs,
+                    page_cursor=page_cursor,
+                    progress_reporter=progress_reporter,
+                    use_raw_json_parser=True,
+                    fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+                )
+            elif enum_of_fetch_engine == EnumOfFetchEngine.IDS_AND_LOOKUP:
+                followxx_pages = twitter_users_util.iter_follower_pages_by_ids(
+                    use_debug_mode,
+                    api,
+                    user_id,
+                    num_of_data=num_of_followxxs,
+                    page_cursor=page_cursor,
+                    progress_reporter=progress_reporter,
+                    api_pool=api_pool,
+                    use_raw_json_parser=True,
+                    fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+                )
+    except Exception as e:
+        raise (e)
+
+    return followxx_pages
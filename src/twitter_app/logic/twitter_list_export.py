@@ -4,7 +4,9 @@ import pandas as pd
 import python_lib_for_me as pyl
 import tweepy
 
+from twitter_app import util
 from twitter_app.util import const_util, pandas_util
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util
 from twitter_app.util.twitter_api_v1_1.standard import twitter_developer_util, twitter_users_util
 
 
@@ -12,13 +14,15 @@ def do_logic(
     use_debug_mode: bool,
     api: tweepy.API,
     list_df: pd.DataFrame,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
 ) -> None:
     """
     ロジック実行
 
     Args:
-        api (tweepy.API)       : API
-        list_df (pd.DataFrame) : リストデータフレーム
+        api (tweepy.API)                              : API
+        list_df (pd.DataFrame)                        : リストデータフレーム
+        api_pool (Optional[TwitterApiPool], optional) : APIプール(指定した場合はリクエストを認証情報ごとに分散する)
 
     Returns:
         -
@@ -39,41 +43,33 @@ def do_logic(
 
         # リストのエクスポート
         for _, list_ in list_df.iterrows():
-            # リストメンバーページの取得
-            list_member_pages = twitter_users_util.get_list_member_pages(
-                use_debug_mode,
-                api,
-                str(list_[const_util.LIST_HEADER[1]]),
-            )
-
-            # リストメンバーデータフレームの初期化
-            list_member_df: pd.DataFrame = pd.DataFrame(columns=const_util.LIST_MEMBER_HEADER)
-
-            # リストメンバーデータフレームへの格納
-            for list_members_by_page in list_member_pages:
-                # list_member: tweepy.models.User
-                for list_member in list_members_by_page:
-                    # ユーザ情報データフレームの格納
-                    user_info_df = pd.DataFrame(
-                        [
-                            [
-                                list_member.screen_name,
-                                list_member.name,
-                                const_util.ACCOUNT_URL.format(list_member.screen_name),
-                            ]
-                        ],
-                        columns=const_util.LIST_MEMBER_HEADER,
-                    )
-                    list_member_df = pd.concat([list_member_df, user_info_df], ignore_index=True)
-
             # リストメンバーファイルパスの生成
             list_member_file_path = const_util.LIST_MEMBER_FILE_PATH.format(str(list_[const_util.LIST_HEADER[2]]))
 
-            # リストメンバーデータフレームの保存
-            clg.log_inf(f"リストメンバー(追加分先頭n行)：\n{list_member_df.head(5)}")
-            clg.log_inf(f"リストメンバー(追加分末尾n行)：\n{list_member_df.tail(5)}")
+            # リストメンバーファイルストリーム書き込みの生成
+            list_member_file_writer: pandas_util.ListMemberFileStreamWriter = pandas_util.ListMemberFileStreamWriter(
+                use_debug_mode, list_member_file_path
+            )
+
+            # リストメンバーページの取得(ページの到着ごとにリストメンバーファイルに追記する)
+            for list_members_by_page in twitter_users_util.iter_list_member_pages(
+                use_debug_mode,
+                api,
+                str(list_[const_util.LIST_HEADER[1]]),
+                progress_reporter=util.ProgressReporter(use_debug_mode, api, "/lists/members", api_pool=api_pool),
+                api_pool=api_pool,
+                use_raw_json_parser=True,
+                fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+            ):
+                list_member_file_writer.write_users(list_members_by_page)
+
+            # リストメンバーファイルの保存(リストメンバーが0人の場合はヘッダのみ)
+            if list_member_file_writer.num_of_pages == 0:
+                list_member_file_writer.write_users([])
+
+            clg.log_inf(f"リストメンバー(追加分先頭n行)：\n{list_member_file_writer.head_df}")
+            clg.log_inf(f"リストメンバー(追加分末尾n行)：\n{list_member_file_writer.tail_df}")
             clg.log_inf(f"リストメンバーファイルパス：\n{list_member_file_path}")
-            pandas_util.save_list_member_df(use_debug_mode, list_member_df, list_member_file_path)
 
         # レート制限の表示
         twitter_developer_util.show_rate_limit_of_lists_members(use_debug_mode, api)
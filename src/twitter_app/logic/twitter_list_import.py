@@ -7,6 +7,7 @@ import python_lib_for_me as pyl
 import tweepy
 from tweepy.models import ResultSet
 
+from twitter_app import util
 from twitter_app.util import const_util, pandas_util
 from twitter_app.util.twitter_api_v1_1.standard import twitter_users_util
 
@@ -17,17 +18,30 @@ def do_logic(
     list_member_file_path_with_wildcard: str,
     header_line_num: int,
     add_only_users_with_diff: bool,
+    reconcile_users_with_diff: bool = False,
+    discard_pending_jobs: bool = False,
 ) -> None:
     """ロジック実行"""
 
     clg: Optional[pyl.CustomLogger] = None
     list_: Any = None
+    job_store: Optional[util.ListAddJobStore] = None
+    user_store: Optional[util.UserStore] = None
+
+    # 既存リスト使用有無(差分ユーザ追加と差分ユーザ同期は既存のリストを破棄せずに使用する)
+    use_existing_list: bool = add_only_users_with_diff is True or reconcile_users_with_diff is True
 
     try:
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
         clg.log_inf(f"ロジック実行(Twitterリストインポート)を開始します。")
 
+        # リスト追加ジョブストアの生成
+        job_store = util.ListAddJobStore()
+
+        # ユーザストアの生成(全てのリストでユーザの確認結果を共有する)
+        user_store = util.UserStore()
+
         # リストメンバーファイルパスの取得
         list_member_file_paths: list[str] = glob.glob(list_member_file_path_with_wildcard)
 
@@ -35,23 +49,51 @@ def do_logic(
         if len(list_member_file_paths) == 0:
             clg.log_wrn(f"リストメンバーファイルの件数が0件です。(list_member_file_path:{list_member_file_path_with_wildcard})")
         else:
-            # TwitterAPIの実行
+            # リスト名(複数)(リスト追加ジョブの実行対象)
+            list_names: list[str] = []
+
+            # TwitterAPIの実行(リスト追加ジョブの登録)
             for list_member_file_path in list_member_file_paths:
                 # リスト名の生成
                 list_name: str = os.path.splitext(os.path.basename(list_member_file_path))[0]
+                list_names.append(list_name)
+                list_ = None
+
+                # 未完了のリスト追加ジョブの破棄(リストメンバーファイルを読み込み直してインポートをやり直す)
+                if discard_pending_jobs is True and job_store.count_pending_jobs(list_name) > 0:
+                    job_store.delete_jobs(list_name)
+                    clg.log_inf(f"未完了のリスト追加ジョブを破棄しました。(list_name:{list_name})")
+
+                # 未完了のリスト追加ジョブの確認(中断したインポートは除外ユーザの判定等をやり直さずに再開する)
+                pending_jobs: list[util.ListAddJob] = job_store.get_pending_jobs([list_name])
+                if len(pending_jobs) > 0:
+                    # 再開するリストの存在確認(削除された場合は未完了のリスト追加ジョブを破棄してやり直す)
+                    existing_list_ids: list[str] = [
+                        str(existing_list.id) for existing_list in twitter_users_util.get_lists(use_debug_mode, api)
+                    ]
+                    if str(pending_jobs[0].list_id) in existing_list_ids:
+                        clg.log_wrn(
+                            f"未完了のリスト追加ジョブを再開します。リストメンバーファイルは読み込み直しません。"
+                            + f"(list_name:{list_name}, list_member_file_path:{list_member_file_path})"
+                        )
+                        clg.log_wrn(f"リストメンバーファイルの変更を反映する場合は未完了のリスト追加ジョブ破棄を指定してください。")
+                        continue
+                    else:
+                        job_store.delete_jobs(list_name)
+                        clg.log_wrn(f"リストが存在しないため、未完了のリスト追加ジョブを破棄しました。(list_name:{list_name})")
 
                 # 既存リストの取得
-                if add_only_users_with_diff is True:
+                if use_existing_list is True:
                     existing_lists: ResultSet = twitter_users_util.get_lists(use_debug_mode, api)
                     for existing_list in existing_lists:
                         if existing_list.name == list_name:
                             list_ = existing_list
                             break
 
-                # リストの生成
-                if add_only_users_with_diff is True and list_ is None:
+                # リストの生成(既存のリストを使用する場合は、存在しない場合のみ生成する)
+                if use_existing_list is True and list_ is None:
                     list_ = twitter_users_util.generate_list(use_debug_mode, api, list_name)
-                elif add_only_users_with_diff is False:
+                elif use_existing_list is False:
                     twitter_users_util.destroy_list(use_debug_mode, api, list_name)
                     list_ = twitter_users_util.generate_list(use_debug_mode, api, list_name)
 
@@ -60,24 +102,50 @@ def do_logic(
                     use_debug_mode, list_member_file_path, header_line_num
                 )
 
-                # ユーザの追加
-                twitter_users_util.add_users_to_list(
-                    use_debug_mode,
-                    api,
-                    list_,
-                    [
-                        str(list_member[const_util.LIST_MEMBER_HEADER[0]]).strip()
-                        for _, list_member in list_member_df.iterrows()
-                    ],
-                    [
-                        str(list_member[const_util.LIST_MEMBER_HEADER[1]])
-                        for _, list_member in list_member_df.iterrows()
-                    ],
-                    add_only_users_with_diff,
-                )
+                # ユーザID・名の生成
+                user_ids: list[str] = [
+                    str(list_member[const_util.LIST_MEMBER_HEADER[0]]).strip()
+                    for _, list_member in list_member_df.iterrows()
+                ]
+                user_names: list[str] = [
+                    str(list_member[const_util.LIST_MEMBER_HEADER[1]]) for _, list_member in list_member_df.iterrows()
+                ]
+
+                # ユーザの同期(差分ユーザの追加と削除)、またはユーザの追加(ジョブの登録のみ)
+                if reconcile_users_with_diff is True:
+                    twitter_users_util.reconcile_users_in_list(
+                        use_debug_mode,
+                        api,
+                        list_,
+                        user_ids,
+                        user_names,
+                        job_store=job_store,
+                        enqueue_only=True,
+                        user_store=user_store,
+                    )
+                else:
+                    twitter_users_util.add_users_to_list(
+                        use_debug_mode,
+                        api,
+                        list_,
+                        user_ids,
+                        user_names,
+                        add_only_users_with_diff,
+                        job_store=job_store,
+                        enqueue_only=True,
+                        user_store=user_store,
+                    )
+
+            # TwitterAPIの実行(全てのリストのリスト追加ジョブを交互に実行する)
+            list_ = None
+            twitter_users_util.run_list_add_jobs(use_debug_mode, api, job_store, list_names)
     except Exception as e:
-        # リストの破棄
-        if list_ is not None:
+        # リストの破棄(同期する場合と未完了のリスト追加ジョブがある場合は再開できるようにリストを残す)
+        if (
+            list_ is not None
+            and reconcile_users_with_diff is False
+            and (job_store is None or job_store.count_pending_jobs(list_.name) == 0)
+        ):
             twitter_users_util.destroy_list(use_debug_mode, api, list_.name)
 
         raise (e)
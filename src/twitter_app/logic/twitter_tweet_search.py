@@ -9,6 +9,7 @@ from tweepy.models import SearchResults
 
 from twitter_app import util
 from twitter_app.util import const_util, pandas_util
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util
 from twitter_app.util.twitter_api_v1_1.standard import twitter_developer_util, twitter_tweets_util
 
 
@@ -17,6 +18,7 @@ def do_logic(
     api: tweepy.API,
     query: str,
     num_of_tweets: int,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
 ) -> None:
     """ロジック実行"""
 
@@ -49,6 +51,11 @@ def do_logic(
             query_with_filter,
             twitter_tweets_util.EnumOfSearchResultType.RECENT,
             num_of_tweets,
+            progress_reporter=util.ProgressReporter(
+                use_debug_mode, api, "/search/tweets", num_of_data=num_of_tweets, api_pool=api_pool
+            ),
+            api_pool=api_pool,
+            use_raw_json_parser=True,
         )
 
         # ツイート検索結果ページの件数が0件の場合
@@ -59,29 +66,32 @@ def do_logic(
             query_for_name: str = re.sub(r'[\\/:*?"<>\|]+', "-", query)
             tweet_search_result_file_path = const_util.TWEET_SEARCH_RESULT_FILE_PATH.format(query_for_name)
 
-            # ツイート検索結果データフレームの初期化
-            tweet_search_result_df: pd.DataFrame = pd.DataFrame(columns=const_util.TWEET_SEARCH_RESULT_HEADER)
+            # ツイート検索結果データフレームビルダー(加工前)の初期化
+            tweet_search_result_df_builder: pandas_util.ColumnarDataFrameBuilder = pandas_util.ColumnarDataFrameBuilder(
+                const_util.TWEET_SEARCH_RESULT_RAW_HEADER
+            )
 
-            # ツイート検索結果データフレームへの格納
+            # ツイート検索結果データフレームビルダー(加工前)への格納
             for tweets_by_page in tweet_search_result_pages:
-                # tweet: tweepy.models.Status
+                # tweet: util.TweetRecord
                 for tweet in tweets_by_page:
-                    # ツイート情報データフレームの格納
-                    tweet_info_df: pd.DataFrame = pd.DataFrame(
+                    # ツイート情報(加工前)の格納
+                    tweet_search_result_df_builder.append_row(
                         [
-                            [
-                                pyl.convert_timestamp_to_jst(str(tweet.created_at)),
-                                tweet.user.screen_name,
-                                tweet.user.name,
-                                str(tweet.text).replace("\n", ""),
-                                tweet.retweet_count,
-                                tweet.favorite_count,
-                                const_util.TWEET_URL.format(tweet.user.screen_name, tweet.id),
-                            ]
-                        ],
-                        columns=const_util.TWEET_SEARCH_RESULT_HEADER,
+                            tweet.created_at,
+                            tweet.user.screen_name,
+                            tweet.user.name,
+                            tweet.text,
+                            tweet.retweet_count,
+                            tweet.favorite_count,
+                            tweet.id,
+                        ]
                     )
-                    tweet_search_result_df = pd.concat([tweet_search_result_df, tweet_info_df], ignore_index=True)
+
+            # ツイート検索結果データフレームの生成(列ごとに一括で加工する)
+            tweet_search_result_df: pd.DataFrame = pandas_util.generate_tweet_search_result_df(
+                use_debug_mode, tweet_search_result_df_builder.build()
+            )
 
             # ツイート検索結果データフレームの保存
             clg.log_inf(f"ツイート検索結果(追加分先頭n行)：\n{tweet_search_result_df.head(5)}")
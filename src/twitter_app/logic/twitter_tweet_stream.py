@@ -1,5 +1,5 @@
 from enum import IntEnum, auto
-from typing import Optional
+from typing import Iterable, Optional
 
 import pandas as pd
 import python_lib_for_me as pyl
@@ -7,6 +7,7 @@ import tweepy
 from tweepy.models import ResultSet
 
 from twitter_app.util import const_util, pandas_util
+from twitter_app.util.twitter_api_v1_1 import twitter_user_store_util
 from twitter_app.util.twitter_api_v1_1.standard import twitter_tweets_util, twitter_users_util
 
 
@@ -32,25 +33,39 @@ def do_logic(
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
         clg.log_inf(f"ロジック実行(Twitterツイート配信)を開始します。")
 
-        # ユーザページの取得
-        user_pages: list[ResultSet] = []
+        # ユーザページの取得(ページは下記のフォローユーザIDの生成時に遅延して取得する)
+        user_pages: Iterable[ResultSet] = []
         if enum_of_proc_target_item == EnumOfProcTargetItem.USER_ID:
             # 指定したユーザIDのフォロイーのツイートを配信する場合
-            user_pages = twitter_users_util.get_followee_pages(
+            user_pages = twitter_users_util.iter_followee_pages(
                 use_debug_mode,
                 api,
                 user_id=item,
                 num_of_data=twitter_tweets_util.EnumOfStream.MAX_NUM_OF_FOLLOWING.value,
+                use_raw_json_parser=True,
+                fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
             )
         elif enum_of_proc_target_item == EnumOfProcTargetItem.LIST_ID:
             # 指定したリストIDのツイートを配信する場合
-            user_pages = twitter_users_util.get_list_member_pages(use_debug_mode, api, list_id=item)
+            user_pages = twitter_users_util.iter_list_member_pages(
+                use_debug_mode,
+                api,
+                list_id=item,
+                use_raw_json_parser=True,
+                fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+            )
         elif enum_of_proc_target_item == EnumOfProcTargetItem.LIST_NAME:
             # 指定したリスト名のツイートを配信する場合
             lists: ResultSet = twitter_users_util.get_lists(use_debug_mode, api)
             for list_ in lists:
                 if list_.name == item:
-                    user_pages = twitter_users_util.get_list_member_pages(use_debug_mode, api, list_id=list_.id)
+                    user_pages = twitter_users_util.iter_list_member_pages(
+                        use_debug_mode,
+                        api,
+                        list_id=list_.id,
+                        use_raw_json_parser=True,
+                        fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+                    )
                     break
         elif enum_of_proc_target_item == EnumOfProcTargetItem.FILE_PATH:
             # 指定したファイルに記載されているユーザのツイートを配信する場合
@@ -58,10 +73,27 @@ def do_logic(
             user_ids: list[str] = [
                 str(list_member[const_util.LIST_MEMBER_HEADER[0]]) for _, list_member in list_member_df.iterrows()
             ]
-            user_pages = twitter_users_util.lookup_users(use_debug_mode, api, user_ids)
+            user_pages = twitter_users_util.lookup_users(
+                use_debug_mode,
+                api,
+                user_ids,
+                num_of_parallel_requests=twitter_users_util.EnumOfUserForLookup.MAX_NUM_OF_PARALLEL_REQUESTS.value,
+                use_raw_json_parser=True,
+                fetch_profile=twitter_users_util.EnumOfFetchProfile.LEAN,
+                user_store=twitter_user_store_util.UserStore(),
+                use_async_client=True,
+            )
 
-        # フォローユーザIDの生成
-        following_user_ids: list[str] = [user.id for users_by_page in user_pages for user in users_by_page]
+        # フォローユーザIDの生成(フォロー可能な上限に到達した場合は以降のページを取得しない)
+        following_user_ids: list[str] = []
+        max_num_of_following: int = twitter_tweets_util.EnumOfStream.MAX_NUM_OF_FOLLOWING.value
+        for users_by_page in user_pages:
+            following_user_ids.extend([user.id for user in users_by_page])
+            if len(following_user_ids) >= max_num_of_following:
+                if len(following_user_ids) > max_num_of_following:
+                    clg.log_wrn(f"配信対象がフォロー可能な上限を超過したため、超過分のユーザを除外します。(上限：{max_num_of_following}人)")
+                    following_user_ids = following_user_ids[:max_num_of_following]
+                break
         if len(following_user_ids) > 0:
             clg.log_inf(f"配信対象：{len(following_user_ids)}人")
         else:
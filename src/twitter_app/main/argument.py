@@ -193,6 +193,8 @@ class TwitterListImportArg(TwitterApiAbstractBaseArg):
         self.__list_member_file_path: str = arg_namespace.list_member_file_path
         self.__header_line_num: int = arg_namespace.header_line_num
         self.__add_only_users_with_diff: bool = arg_namespace.add_only_users_with_diff
+        self.__reconcile_users_with_diff: bool = arg_namespace.reconcile_users_with_diff
+        self.__discard_pending_jobs: bool = arg_namespace.discard_pending_jobs
         # 引数検証
         self.__validate_arg()
         return None
@@ -241,6 +243,14 @@ class TwitterListImportArg(TwitterApiAbstractBaseArg):
     def add_only_users_with_diff(self) -> bool:
         return self.__add_only_users_with_diff
 
+    @property
+    def reconcile_users_with_diff(self) -> bool:
+        return self.__reconcile_users_with_diff
+
+    @property
+    def discard_pending_jobs(self) -> bool:
+        return self.__discard_pending_jobs
+
 
 class TwitterListShowArg(TwitterApiAbstractBaseArg):
     """Twitterリスト表示引数"""
@@ -66,8 +66,16 @@ DESC_OF_IMP_LIST: Final[str] = textwrap.dedent(
         - Twitterリストインポート
     - 概要
         - 指定したcsvファイルをリストとしてTwitterにインポートします
+        - 中断した場合は再度実行すると未完了のユーザ追加から再開します
+            - 再開するリストが削除されていた場合はやり直します
+    - 生成ファイル
+        - リスト追加ジョブストア
+            - ./dest/job/list_add_job.sqlite3
+        - ユーザストア
+            - ./dest/cache/user_store.sqlite3
     - コマンド例
         - poetry run twitter imp-list -l "input/list_member/*.csv" -hd 1 -d
+        - poetry run twitter imp-list -l "input/list_member/*.csv" -hd 1 -r
     """
 )
 
@@ -297,6 +305,31 @@ ARGUMENT_PARSER_INFO_DICT: Final[dict] = {
                         ),
                         # "group": "group_c (optional)",
                     },
+                    {
+                        "name": ["-r", "--reconcile_users_with_diff"],
+                        "action": "store_true",
+                        "help": textwrap.dedent(
+                            """\
+                            - [グループC(任意)] 差分ユーザ同期
+                                - 指定した場合は既存のリストに不足しているユーザのみを追加し、余分なユーザのみを削除します
+                                - 既存のリストは削除しません(存在しない場合は新しいリストを生成します)
+                                - 差分ユーザ追加より優先します
+                            """  # noqa: E501
+                        ),
+                        # "group": "group_c (optional)",
+                    },
+                    {
+                        "name": ["-dj", "--discard_pending_jobs"],
+                        "action": "store_true",
+                        "help": textwrap.dedent(
+                            """\
+                            - [グループC(任意)] 未完了のリスト追加ジョブ破棄
+                                - 指定した場合は中断したインポートを再開せず、リストメンバーファイルを読み込み直してやり直します
+                                - 指定しない場合は未完了のユーザ追加から再開します(リストメンバーファイルの変更は反映しません)
+                            """  # noqa: E501
+                        ),
+                        # "group": "group_c (optional)",
+                    },
                 ],
             },
             {
@@ -6,6 +6,7 @@ import tweepy
 
 from twitter_app.logic import twitter_api_auth, twitter_followxx_export
 from twitter_app.main import argument
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util
 
 
 def export_twitter_followxx(arg_namespace: argparse.Namespace) -> None:
@@ -34,6 +35,11 @@ def export_twitter_followxx(arg_namespace: argparse.Namespace) -> None:
 
         # ロジック(TwitterAPI認証)の実行
         api: tweepy.API = twitter_api_auth.do_logic_that_generate_api_by_oauth_1_user(arg.use_debug_mode)
+        api_pool: twitter_api_pool_util.TwitterApiPool = twitter_api_auth.do_logic_that_generate_api_pool(
+            arg.use_debug_mode,
+            api,
+            use_app_context=True,
+        )
 
         # ロジック(Twitterフォロイー(フォロワー)エクスポート)の実行
         if arg.export_followee is True:
@@ -44,6 +50,7 @@ def export_twitter_followxx(arg_namespace: argparse.Namespace) -> None:
                 twitter_followxx_export.EnumOfProc.EXPORT_FOLLOWEE,
                 arg.user_id,
                 arg.num_of_followxxs,
+                api_pool=api_pool,
             )
         elif arg.export_follower is True:
             # ロジック(Twitterフォロワーエクスポート)の実行
@@ -53,6 +60,7 @@ def export_twitter_followxx(arg_namespace: argparse.Namespace) -> None:
                 twitter_followxx_export.EnumOfProc.EXPORT_FOLLOWER,
                 arg.user_id,
                 arg.num_of_followxxs,
+                api_pool=api_pool,
             )
     except Exception as e:
         raise (e)
@@ -7,6 +7,7 @@ import tweepy
 
 from twitter_app.logic import twitter_api_auth, twitter_list_export, twitter_list_show
 from twitter_app.main import argument
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util
 
 
 def export_twitter_list(arg_namespace: argparse.Namespace) -> None:
@@ -37,6 +38,11 @@ def export_twitter_list(arg_namespace: argparse.Namespace) -> None:
         api: tweepy.API = twitter_api_auth.do_logic_that_generate_api_by_oauth_1_user(
             arg.use_debug_mode,
         )
+        api_pool: twitter_api_pool_util.TwitterApiPool = twitter_api_auth.do_logic_that_generate_api_pool(
+            arg.use_debug_mode,
+            api,
+            use_app_context=True,
+        )
 
         # ロジック(Twitterリスト表示)の実行
         list_df: pd.DataFrame = pd.DataFrame()
@@ -63,7 +69,7 @@ def export_twitter_list(arg_namespace: argparse.Namespace) -> None:
             )
 
         # ロジック(Twitterリストエクスポート)の実行
-        twitter_list_export.do_logic(arg.use_debug_mode, api, list_df)
+        twitter_list_export.do_logic(arg.use_debug_mode, api, list_df, api_pool=api_pool)
     except Exception as e:
         raise (e)
     finally:
@@ -44,6 +44,8 @@ def import_twitter_list(arg_namespace: argparse.Namespace) -> None:
             arg.list_member_file_path,
             arg.header_line_num,
             arg.add_only_users_with_diff,
+            arg.reconcile_users_with_diff,
+            arg.discard_pending_jobs,
         )
     except Exception as e:
         raise (e)
@@ -6,6 +6,7 @@ import tweepy
 
 from twitter_app.logic import twitter_api_auth, twitter_tweet_search
 from twitter_app.main import argument
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util
 
 
 def search_twitter_tweet(arg_namespace: argparse.Namespace) -> None:
@@ -36,6 +37,11 @@ def search_twitter_tweet(arg_namespace: argparse.Namespace) -> None:
         api: tweepy.API = twitter_api_auth.do_logic_that_generate_api_by_oauth_1_user(
             arg.use_debug_mode,
         )
+        api_pool: twitter_api_pool_util.TwitterApiPool = twitter_api_auth.do_logic_that_generate_api_pool(
+            arg.use_debug_mode,
+            api,
+            use_app_context=True,
+        )
 
         # ロジック(Twitterツイート検索)の実行
         twitter_tweet_search.do_logic(
@@ -43,6 +49,7 @@ def search_twitter_tweet(arg_namespace: argparse.Namespace) -> None:
             api,
             arg.query,
             arg.num_of_tweets,
+            api_pool=api_pool,
         )
     except Exception as e:
         raise (e)
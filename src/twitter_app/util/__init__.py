@@ -4,7 +4,10 @@ from typing import Optional
 
 import python_lib_for_me as pyl
 
+from .checkpoint_util import *
 from .const_util import *
+from .diff_util import *
+from .job_store_util import *
 from .pandas_util import *
 from .twitter_api_v1_1 import *
 
@@ -0,0 +1,204 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+import python_lib_for_me as pyl
+
+from twitter_app.util import const_util
+
+
+class ExportCheckpoint:
+    """
+    エクスポートチェックポイント
+
+    Notes:
+        - 長時間のエクスポートを中断した位置から再開するための情報を保持する
+        - 次ページの取得位置(カーソル)と、その時点までにファイルへ書き込んだ行数を組で保存する
+        - 消費済みデータ数は、その時点までに取得したデータ数(補完できなかったユーザを含む)を示す
+            - 再開時の残りの取得数は書き込み済み行数ではなく消費済みデータ数から算出する
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        fetch_engine: str,
+        next_cursor: int,
+        num_of_rows: int,
+        num_of_consumed_data: int,
+        update_datetime: str = "",
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            user_id (str)                   : ユーザID
+            fetch_engine (str)              : 取得方式
+            next_cursor (int)               : 次ページの取得位置(カーソル)
+            num_of_rows (int)               : 書き込み済み行数
+            num_of_consumed_data (int)      : 消費済みデータ数
+            update_datetime (str, optional) : 更新日時
+        """
+
+        self.__user_id: str = user_id
+        self.__fetch_engine: str = fetch_engine
+        self.__next_cursor: int = next_cursor
+        self.__num_of_rows: int = num_of_rows
+        self.__num_of_consumed_data: int = num_of_consumed_data
+        self.__update_datetime: str = update_datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        """辞書変換"""
+        return {
+            "user_id": self.__user_id,
+            "fetch_engine": self.__fetch_engine,
+            "next_cursor": self.__next_cursor,
+            "num_of_rows": self.__num_of_rows,
+            "num_of_consumed_data": self.__num_of_consumed_data,
+            "update_datetime": self.__update_datetime,
+        }
+
+    @property
+    def user_id(self) -> str:
+        return self.__user_id
+
+    @property
+    def fetch_engine(self) -> str:
+        return self.__fetch_engine
+
+    @property
+    def next_cursor(self) -> int:
+        return self.__next_cursor
+
+    @property
+    def num_of_rows(self) -> int:
+        return self.__num_of_rows
+
+    @property
+    def num_of_consumed_data(self) -> int:
+        return self.__num_of_consumed_data
+
+    @property
+    def update_datetime(self) -> str:
+        return self.__update_datetime
+
+
+def load_export_checkpoint(
+    use_debug_mode: bool,
+    export_file_path: str,
+) -> Optional[ExportCheckpoint]:
+    """
+    エクスポートチェックポイント読み込み
+
+    Args:
+        use_debug_mode (bool)   : デバッグモード使用有無
+        export_file_path (str)  : エクスポートファイルパス
+
+    Returns:
+        Optional[ExportCheckpoint]: エクスポートチェックポイント (存在しない場合はNone)
+
+    Notes:
+        - チェックポイントファイルはエクスポートファイルと同じディレクトリに配置する
+        - エクスポートファイルが存在しない場合は再開できないため、Noneを返却する
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+    export_checkpoint: Optional[ExportCheckpoint] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # チェックポイントファイルの読み込み
+        checkpoint_file_path: str = const_util.EXPORT_CHECKPOINT_FILE_PATH.format(export_file_path)
+        if os.path.isfile(checkpoint_file_path) is True and os.path.isfile(export_file_path) is True:
+            with open(checkpoint_file_path, "r", encoding=const_util.ENCODING) as checkpoint_file:
+                checkpoint_dict: dict[str, Any] = json.load(checkpoint_file)
+            export_checkpoint = ExportCheckpoint(
+                checkpoint_dict["user_id"],
+                checkpoint_dict["fetch_engine"],
+                checkpoint_dict["next_cursor"],
+                checkpoint_dict["num_of_rows"],
+                checkpoint_dict.get("num_of_consumed_data", checkpoint_dict["num_of_rows"]),
+                checkpoint_dict.get("update_datetime", ""),
+            )
+
+            clg.log_dbg(f"エクスポートチェックポイントを読み込みました。({checkpoint_dict})")
+    except Exception as e:
+        raise (e)
+
+    return export_checkpoint
+
+
+def save_export_checkpoint(
+    use_debug_mode: bool,
+    export_file_path: str,
+    export_checkpoint: ExportCheckpoint,
+) -> None:
+    """
+    エクスポートチェックポイント保存
+
+    Args:
+        use_debug_mode (bool)                   : デバッグモード使用有無
+        export_file_path (str)                  : エクスポートファイルパス
+        export_checkpoint (ExportCheckpoint)    : エクスポートチェックポイント
+
+    Returns:
+        -
+
+    Notes:
+        - 書き込み途中で中断されても壊れたファイルが残らないよう、一時ファイルに書き込んでから置き換える
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # チェックポイントファイルの保存
+        checkpoint_file_path: str = const_util.EXPORT_CHECKPOINT_FILE_PATH.format(export_file_path)
+        checkpoint_dict: dict[str, Any] = export_checkpoint.to_dict()
+        checkpoint_dict["update_datetime"] = datetime.now().strftime(const_util.JST_TIMESTAMP_FORMAT)
+        with open(f"{checkpoint_file_path}.tmp", "w", encoding=const_util.ENCODING) as checkpoint_file:
+            json.dump(checkpoint_dict, checkpoint_file, indent=2)
+        os.replace(f"{checkpoint_file_path}.tmp", checkpoint_file_path)
+
+        clg.log_dbg(f"エクスポートチェックポイントを保存しました。({checkpoint_dict})")
+    except Exception as e:
+        raise (e)
+
+    return None
+
+
+def delete_export_checkpoint(
+    use_debug_mode: bool,
+    export_file_path: str,
+) -> None:
+    """
+    エクスポートチェックポイント削除
+
+    Args:
+        use_debug_mode (bool)   : デバッグモード使用有無
+        export_file_path (str)  : エクスポートファイルパス
+
+    Returns:
+        -
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # チェックポイントファイルの削除
+        checkpoint_file_path: str = const_util.EXPORT_CHECKPOINT_FILE_PATH.format(export_file_path)
+        if os.path.isfile(checkpoint_file_path) is True:
+            os.remove(checkpoint_file_path)
+
+            clg.log_dbg(f"エクスポートチェックポイントを削除しました。")
+    except Exception as e:
+        raise (e)
+
+    return None
@@ -9,6 +9,13 @@ FOLLOWEE_FILE_PATH: Final[str] = \
     "./dest/followee/{0}_{1}.csv"
 FOLLOWER_FILE_PATH: Final[str] = \
     "./dest/follower/{0}_{1}.csv"
+EXPORT_CHECKPOINT_FILE_PATH: Final[str] = \
+    "{0}.checkpoint.json"
+
+LIST_ADD_JOB_STORE_FILE_PATH: Final[str] = \
+    "./dest/job/list_add_job.sqlite3"
+USER_STORE_FILE_PATH: Final[str] = \
+    "./dest/cache/user_store.sqlite3"
 
 LIST_MEMBER_FILE_PATH: Final[str] = \
     "./dest/list_member/{0}.csv"
@@ -38,10 +45,23 @@ TWEET_SEARCH_RESULT_HEADER: Final[list[str]] = \
         "favorite_count",
         "url",
     ]
+TWEET_SEARCH_RESULT_RAW_HEADER: Final[list[str]] = \
+    [
+        "creation_timestamp",
+        "user_id",
+        "user_name",
+        "tweet_text",
+        "retweet_count",
+        "favorite_count",
+        "tweet_id",
+    ]
 
 ACCOUNT_URL: Final[str] = \
     "https://twitter.com/{0}"
 TWEET_URL: Final[str] = \
     "https://twitter.com/{0}/status/{1}"
 
+JST_TIMEZONE: Final[str] = "Asia/Tokyo"
+JST_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
 ENCODING: Final[str] = "utf8"
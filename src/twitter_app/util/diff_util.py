@@ -0,0 +1,100 @@
+from typing import Iterable
+
+
+class MembershipDiff:
+    """
+    メンバーシップ差分
+
+    Notes:
+        - 目標(ファイル等)と現在(リストメンバー等)のユーザIDの差分を保持する
+        - 各集合には正規化前のユーザIDを格納する
+    """
+
+    def __init__(
+        self,
+        added: set[str],
+        missing: set[str],
+        extra: set[str],
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            added (set[str])    : 追加済みユーザID(目標と現在の両方に存在する目標側のユーザID)
+            missing (set[str])  : 未追加ユーザID(目標にのみ存在する目標側のユーザID)
+            extra (set[str])    : 余分ユーザID(現在にのみ存在する現在側のユーザID)
+        """
+
+        self.__added: set[str] = added
+        self.__missing: set[str] = missing
+        self.__extra: set[str] = extra
+
+    @property
+    def added(self) -> set[str]:
+        return self.__added
+
+    @property
+    def missing(self) -> set[str]:
+        return self.__missing
+
+    @property
+    def extra(self) -> set[str]:
+        return self.__extra
+
+
+def normalize_user_id(user_id: str) -> str:
+    """
+    ユーザID正規化
+
+    Args:
+        user_id (str) : ユーザID(スクリーン名または数値ID)
+
+    Returns:
+        str: 正規化したユーザID
+
+    Notes:
+        - 前後の空白と先頭の`@`を取り除き、大文字と小文字を区別しない形式に変換する
+            - スクリーン名は大文字と小文字を区別しないため
+    """
+    return str(user_id).strip().lstrip("@").casefold()
+
+
+def diff_memberships(
+    target_user_ids: Iterable[str],
+    current_user_ids: Iterable[str],
+) -> MembershipDiff:
+    """
+    メンバーシップ差分算出
+
+    Args:
+        target_user_ids (Iterable[str])     : 目標ユーザID(複数)
+        current_user_ids (Iterable[str])    : 現在ユーザID(複数)
+
+    Returns:
+        MembershipDiff: メンバーシップ差分
+
+    Notes:
+        - 正規化したユーザIDの集合で比較するため、ユーザ数に対して線形時間で算出できる
+        - スクリーン名と数値IDを混在させた場合は一致しない(いずれかに揃えて指定する)
+    """
+
+    target_user_ids = list(target_user_ids)
+    current_user_ids = list(current_user_ids)
+
+    # 正規化したユーザIDの集合の生成
+    normalized_target_user_ids: set[str] = {normalize_user_id(user_id) for user_id in target_user_ids}
+    normalized_current_user_ids: set[str] = {normalize_user_id(user_id) for user_id in current_user_ids}
+
+    # 差分の算出
+    added: set[str] = set()
+    missing: set[str] = set()
+    for user_id in target_user_ids:
+        if normalize_user_id(user_id) in normalized_current_user_ids:
+            added.add(user_id)
+        else:
+            missing.add(user_id)
+    extra: set[str] = {
+        user_id for user_id in current_user_ids if not (normalize_user_id(user_id) in normalized_target_user_ids)
+    }
+
+    return MembershipDiff(added, missing, extra)
@@ -0,0 +1,384 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from twitter_app.util import const_util
+
+
+class ListAddJob:
+    """
+    リスト追加ジョブ
+
+    Notes:
+        - リストに追加するユーザ(1リクエスト分)を保持する
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        list_id: str,
+        list_name: str,
+        batch_index: int,
+        user_ids: list[str],
+        not_before: float,
+        num_of_attempts: int,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            job_id (int)            : ジョブID
+            list_id (str)           : リストID
+            list_name (str)         : リスト名
+            batch_index (int)       : バッチ番号(リスト内での実行順)
+            user_ids (list[str])    : ユーザID(複数)
+            not_before (float)      : 実行可能時刻(エポック秒)
+            num_of_attempts (int)   : 試行回数
+        """
+
+        self.__job_id: int = job_id
+        self.__list_id: str = list_id
+        self.__list_name: str = list_name
+        self.__batch_index: int = batch_index
+        self.__user_ids: list[str] = user_ids
+        self.__not_before: float = not_before
+        self.__num_of_attempts: int = num_of_attempts
+
+    @property
+    def job_id(self) -> int:
+        return self.__job_id
+
+    @property
+    def list_id(self) -> str:
+        return self.__list_id
+
+    @property
+    def list_name(self) -> str:
+        return self.__list_name
+
+    @property
+    def batch_index(self) -> int:
+        return self.__batch_index
+
+    @property
+    def user_ids(self) -> list[str]:
+        return self.__user_ids
+
+    @property
+    def not_before(self) -> float:
+        return self.__not_before
+
+    @property
+    def num_of_attempts(self) -> int:
+        return self.__num_of_attempts
+
+
+class ListAddJobStore:
+    """
+    リスト追加ジョブストア
+
+    Notes:
+        - リストへのユーザ追加をジョブとしてSQLiteに永続化する
+            - プロセスが終了(再起動)しても未完了のジョブを失わずに再開できる
+            - 除外ユーザの判定等をやり直す必要がない
+        - ジョブの状態
+            - pending   : 未完了
+            - done      : 完了
+            - failed    : 失敗(試行回数の上限に到達)
+        - 1日に追加可能なユーザ数の判定のため、ジョブの実行ごとに実行時刻と追加数を保持する
+            - 延期したジョブを再実行した場合も、各実行を別の実行履歴として保持する
+    """
+
+    STATUS_PENDING: str = "pending"
+    STATUS_DONE: str = "done"
+    STATUS_FAILED: str = "failed"
+
+    def __init__(
+        self,
+        job_store_file_path: str = const_util.LIST_ADD_JOB_STORE_FILE_PATH,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            job_store_file_path (str, optional) : ジョブストアファイルパス
+        """
+
+        self.__job_store_file_path: str = job_store_file_path
+
+        # テーブルの生成
+        os.makedirs(os.path.dirname(job_store_file_path) or ".", exist_ok=True)
+        with self.__connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS list_add_job (
+                    job_id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                    list_id         TEXT    NOT NULL,
+                    list_name       TEXT    NOT NULL,
+                    batch_index     INTEGER NOT NULL,
+                    user_ids        TEXT    NOT NULL,
+                    status          TEXT    NOT NULL,
+                    not_before      REAL    NOT NULL,
+                    num_of_attempts INTEGER NOT NULL DEFAULT 0,
+                    num_of_added    INTEGER NOT NULL DEFAULT 0,
+                    executed_at     REAL
+                )
+                """
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_list_add_job_status ON list_add_job (status, list_name)")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS list_add_job_execution (
+                    execution_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id          INTEGER NOT NULL,
+                    executed_at     REAL    NOT NULL,
+                    num_of_added    INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_list_add_job_execution_executed_at "
+                + "ON list_add_job_execution (executed_at)"
+            )
+
+            # 実行履歴の移行(実行履歴のテーブルがない時に作成したジョブストアの場合)
+            connection.execute(
+                "INSERT INTO list_add_job_execution (job_id, executed_at, num_of_added) "
+                + "SELECT job_id, executed_at, num_of_added FROM list_add_job WHERE executed_at IS NOT NULL "
+                + "AND NOT EXISTS (SELECT 1 FROM list_add_job_execution)"
+            )
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """接続(トランザクションの終了時にコミットして切断する)"""
+
+        connection: sqlite3.Connection = sqlite3.connect(self.__job_store_file_path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def enqueue_jobs(
+        self,
+        list_id: str,
+        list_name: str,
+        user_ids_list: list[list[str]],
+    ) -> int:
+        """
+        ジョブ登録
+
+        Args:
+            list_id (str)                   : リストID
+            list_name (str)                 : リスト名
+            user_ids_list (list[list[str]]) : ユーザIDリスト(1要素が1ジョブ)
+
+        Returns:
+            int: 登録したジョブ数
+
+        Notes:
+            - 同じリスト名の未完了のジョブは置き換える
+        """
+
+        now: float = time.time()
+        with self.__connect() as connection:
+            connection.execute(
+                "DELETE FROM list_add_job WHERE list_name = ? AND status = ?",
+                (list_name, ListAddJobStore.STATUS_PENDING),
+            )
+            connection.executemany(
+                "INSERT INTO list_add_job (list_id, list_name, batch_index, user_ids, status, not_before) "
+                + "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (list_id, list_name, batch_index, json.dumps(user_ids), ListAddJobStore.STATUS_PENDING, now)
+                    for batch_index, user_ids in enumerate(user_ids_list, start=1)
+                ],
+            )
+
+        return len(user_ids_list)
+
+    def get_pending_jobs(
+        self,
+        list_names: Optional[list[str]] = None,
+    ) -> list[ListAddJob]:
+        """
+        未完了ジョブ取得
+
+        Args:
+            list_names (Optional[list[str]], optional) : リスト名(複数)(指定しない場合は全てのリスト)
+
+        Returns:
+            list[ListAddJob]: 未完了ジョブ(登録順)
+        """
+
+        query: str = "SELECT * FROM list_add_job WHERE status = ?"
+        params: list[Any] = [ListAddJobStore.STATUS_PENDING]
+        if list_names is not None:
+            query += f" AND list_name IN ({', '.join(['?'] * len(list_names))})"
+            params.extend(list_names)
+        query += " ORDER BY job_id"
+
+        with self.__connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows: list[sqlite3.Row] = connection.execute(query, params).fetchall()
+
+        return [
+            ListAddJob(
+                row["job_id"],
+                row["list_id"],
+                row["list_name"],
+                row["batch_index"],
+                json.loads(row["user_ids"]),
+                row["not_before"],
+                row["num_of_attempts"],
+            )
+            for row in rows
+        ]
+
+    def count_pending_jobs(
+        self,
+        list_name: str,
+    ) -> int:
+        """未完了ジョブ数取得"""
+        return len(self.get_pending_jobs([list_name]))
+
+    def complete_job(
+        self,
+        job_id: int,
+        num_of_added: int,
+    ) -> None:
+        """ジョブ完了"""
+
+        now: float = time.time()
+        with self.__connect() as connection:
+            connection.execute(
+                "UPDATE list_add_job SET status = ?, num_of_added = num_of_added + ?, "
+                + "num_of_attempts = num_of_attempts + 1, executed_at = ? WHERE job_id = ?",
+                (ListAddJobStore.STATUS_DONE, num_of_added, now, job_id),
+            )
+            self.__record_execution(connection, job_id, now, num_of_added)
+
+        return None
+
+    def defer_job(
+        self,
+        job_id: int,
+        num_of_added: int,
+        not_before: float,
+        max_num_of_attempts: int,
+        user_ids: Optional[list[str]] = None,
+    ) -> bool:
+        """
+        ジョブ延期
+
+        Args:
+            job_id (int)                                : ジョブID
+            num_of_added (int)                          : 追加数(一部のみ追加できた場合)
+            not_before (float)                          : 実行可能時刻(エポック秒)
+            max_num_of_attempts (int)                   : 最大試行回数
+            user_ids (Optional[list[str]], optional)    : ユーザID(複数)(未追加のユーザのみ)(指定しない場合は変更しない)
+
+        Returns:
+            bool: 延期有無(試行回数の上限に到達した場合は失敗として扱いFalse)
+
+        Notes:
+            - 一部のみ追加できた場合も1日に追加可能なユーザ数の判定に含めるため、実行時刻と追加数を実行履歴に記録する
+            - ユーザIDを指定した場合は、再実行時に未追加のユーザのみを追加する
+        """  # noqa: E501
+
+        now: float = time.time()
+        is_deferred: bool = False
+        with self.__connect() as connection:
+            row: Any = connection.execute(
+                "SELECT num_of_attempts FROM list_add_job WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            num_of_attempts: int = (row[0] if row is not None else 0) + 1
+            is_deferred = num_of_attempts < max_num_of_attempts
+            connection.execute(
+                "UPDATE list_add_job SET status = ?, not_before = ?, num_of_attempts = ?, "
+                + "num_of_added = num_of_added + ?, executed_at = ? WHERE job_id = ?",
+                (
+                    ListAddJobStore.STATUS_PENDING if is_deferred else ListAddJobStore.STATUS_FAILED,
+                    not_before,
+                    num_of_attempts,
+                    num_of_added,
+                    now,
+                    job_id,
+                ),
+            )
+            if user_ids is not None:
+                connection.execute(
+                    "UPDATE list_add_job SET user_ids = ? WHERE job_id = ?",
+                    (json.dumps(user_ids), job_id),
+                )
+            self.__record_execution(connection, job_id, now, num_of_added)
+
+        return is_deferred
+
+    def __record_execution(
+        self,
+        connection: sqlite3.Connection,
+        job_id: int,
+        executed_at: float,
+        num_of_added: int,
+    ) -> None:
+        """実行履歴記録"""
+
+        connection.execute(
+            "INSERT INTO list_add_job_execution (job_id, executed_at, num_of_added) VALUES (?, ?, ?)",
+            (job_id, executed_at, num_of_added),
+        )
+
+        return None
+
+    def delete_jobs(
+        self,
+        list_name: str,
+    ) -> None:
+        """ジョブ削除(未完了のみ)"""
+
+        with self.__connect() as connection:
+            connection.execute(
+                "DELETE FROM list_add_job WHERE list_name = ? AND status = ?",
+                (list_name, ListAddJobStore.STATUS_PENDING),
+            )
+
+        return None
+
+    def get_last_executed_at(self) -> Optional[float]:
+        """最終実行時刻(エポック秒)取得"""
+
+        with self.__connect() as connection:
+            row: Any = connection.execute("SELECT MAX(executed_at) FROM list_add_job_execution").fetchone()
+
+        return row[0] if row is not None else None
+
+    def get_executions_since(
+        self,
+        since: float,
+    ) -> list[tuple[float, int]]:
+        """
+        実行履歴取得
+
+        Args:
+            since (float) : 取得開始時刻(エポック秒)
+
+        Returns:
+            list[tuple[float, int]]: 実行履歴 (list[(実行時刻, 追加数)])(実行時刻順)
+        """
+
+        with self.__connect() as connection:
+            rows: list[Any] = connection.execute(
+                "SELECT executed_at, num_of_added FROM list_add_job_execution "
+                + "WHERE executed_at >= ? ORDER BY executed_at",
+                (since,),
+            ).fetchall()
+
+        return [(row[0], row[1]) for row in rows]
+
+    @property
+    def job_store_file_path(self) -> str:
+        return self.__job_store_file_path
@@ -1,4 +1,5 @@
-from typing import Optional
+import string
+from typing import Any, Iterable, Optional, Sequence
 
 import pandas as pd
 import python_lib_for_me as pyl
@@ -6,6 +7,255 @@ import python_lib_for_me as pyl
 from twitter_app.util import const_util
 
 
+class ColumnarDataFrameBuilder:
+    """
+    列指向データフレームビルダー
+
+    Notes:
+        - 行を列ごとのリストに蓄積し、データフレームを最後に1回だけ生成する
+        - 行ごとに`pd.concat`する場合と異なり、行数に対して線形時間で生成できる
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            columns (list[str]): 列名(複数)
+        """
+
+        self.__columns: list[str] = columns
+        self.__column_values: list[list[Any]] = [[] for _ in columns]
+
+    def append_row(
+        self,
+        row: Sequence[Any],
+    ) -> None:
+        """行追加"""
+
+        # 引数の検証：行の長さが列の長さと同じであること
+        if len(row) != len(self.__columns):
+            raise (pyl.CustomError(f"行の長さが列の長さと異なります。(row:{len(row)}, columns:{len(self.__columns)})"))
+
+        for column_values, value in zip(self.__column_values, row):
+            column_values.append(value)
+
+        return None
+
+    def build(self) -> pd.DataFrame:
+        """データフレーム生成"""
+        return pd.DataFrame(dict(zip(self.__columns, self.__column_values)), columns=self.__columns)
+
+    @property
+    def columns(self) -> list[str]:
+        return self.__columns
+
+    @property
+    def num_of_rows(self) -> int:
+        return len(self.__column_values[0]) if len(self.__column_values) > 0 else 0
+
+
+def convert_timestamp_series_to_jst(
+    timestamp_series: pd.Series,
+    jst_timestamp_format: str = const_util.JST_TIMESTAMP_FORMAT,
+) -> pd.Series:
+    """
+    タイムスタンプシリーズJST変換
+
+    Args:
+        timestamp_series (pd.Series)        : タイムスタンプシリーズ(タイムゾーン付き)
+        jst_timestamp_format (str, optional) : JSTタイムスタンプ書式
+
+    Returns:
+        pd.Series: JSTタイムスタンプシリーズ
+    """
+
+    utc_timestamp_series: pd.Series = pd.to_datetime(timestamp_series, utc=True)
+    jst_timestamp_series: pd.Series = utc_timestamp_series.dt.tz_convert(const_util.JST_TIMEZONE).dt.strftime(
+        jst_timestamp_format
+    )
+
+    return jst_timestamp_series
+
+
+def format_series(
+    format_string: str,
+    *series: pd.Series,
+) -> pd.Series:
+    """
+    シリーズ書式設定
+
+    Args:
+        format_string (str) : 書式文字列(例：const_util.TWEET_URL)
+        series (pd.Series)  : 置換フィールドに埋め込むシリーズ(複数)
+
+    Returns:
+        pd.Series: 書式設定済みシリーズ
+
+    Notes:
+        - `str.format`を行ごとに呼び出す代わりに、文字列シリーズの連結でまとめて書式設定する
+        - 置換フィールドは位置引数({0}、{1}、...)のみ対応する
+    """
+
+    # 引数の検証：シリーズが1つ以上であること
+    if len(series) == 0:
+        raise (pyl.CustomError(f"シリーズが指定されていません。(format_string:{format_string})"))
+
+    formatted_series: pd.Series = pd.Series("", index=series[0].index, dtype=object)
+    for literal_text, field_name, _, _ in string.Formatter().parse(format_string):
+        formatted_series = formatted_series + literal_text
+        if field_name is not None:
+            if not field_name.isdecimal() or int(field_name) >= len(series):
+                raise (pyl.CustomError(f"置換フィールドが不正です。(format_string:{format_string}, field_name:{field_name})"))
+            formatted_series = formatted_series + series[int(field_name)].astype(str)
+
+    return formatted_series
+
+
+def generate_list_member_df(
+    use_debug_mode: bool,
+    users: Iterable[Any],
+) -> pd.DataFrame:
+    """
+    リストメンバーデータフレーム生成
+
+    Args:
+        use_debug_mode (bool)   : デバッグモード使用有無
+        users (Iterable[Any])   : ユーザ(複数) (Iterable[tweepy.models.User])
+
+    Returns:
+        pd.DataFrame: リストメンバーデータフレーム
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # リストメンバーデータフレームビルダーへの格納
+        list_member_df_builder: ColumnarDataFrameBuilder = ColumnarDataFrameBuilder(const_util.LIST_MEMBER_HEADER)
+        for user in users:
+            list_member_df_builder.append_row(
+                [
+                    user.screen_name,
+                    user.name,
+                    const_util.ACCOUNT_URL.format(user.screen_name),
+                ]
+            )
+
+        # リストメンバーデータフレームの生成
+        list_member_df: pd.DataFrame = list_member_df_builder.build()
+    except Exception as e:
+        raise (e)
+
+    return list_member_df
+
+
+class ListMemberFileStreamWriter:
+    """
+    リストメンバーファイルストリーム書き込み
+
+    Notes:
+        - ページごとのリストメンバーデータフレームをリストメンバーファイルに追記する
+        - ヘッダは最初の書き込み時のみ出力する
+        - 全ページを保持しないため、メモリ使用量は1ページ分に収まる
+        - 既存行数を指定した場合は既存のファイルに続けて追記する(中断したエクスポートの再開用)
+    """
+
+    def __init__(
+        self,
+        use_debug_mode: bool,
+        list_member_file_path: str,
+        num_of_rows_head_and_tail: int = 5,
+        num_of_existing_rows: int = 0,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            use_debug_mode (bool)                       : デバッグモード使用有無
+            list_member_file_path (str)                 : リストメンバーファイルパス
+            num_of_rows_head_and_tail (int, optional)   : 保持する先頭(末尾)行数(ログ出力用)
+            num_of_existing_rows (int, optional)        : 既存行数(0より大きい場合は既存のファイルに追記する)
+        """
+
+        self.__use_debug_mode: bool = use_debug_mode
+        self.__list_member_file_path: str = list_member_file_path
+        self.__num_of_rows_head_and_tail: int = num_of_rows_head_and_tail
+        self.__num_of_pages: int = 0
+        self.__num_of_existing_rows: int = num_of_existing_rows
+        self.__num_of_rows: int = num_of_existing_rows
+        self.__head_df: pd.DataFrame = pd.DataFrame(columns=const_util.LIST_MEMBER_HEADER)
+        self.__tail_df: pd.DataFrame = pd.DataFrame(columns=const_util.LIST_MEMBER_HEADER)
+
+    def write(
+        self,
+        list_member_df: pd.DataFrame,
+    ) -> None:
+        """リストメンバーデータフレーム書き込み"""
+
+        clg: Optional[pyl.CustomLogger] = None
+
+        try:
+            # ロガーの取得
+            clg = pyl.CustomLogger(__name__, use_debug_mode=self.__use_debug_mode)
+
+            # データフレームの保存(初回は上書き、2回目以降と既存のファイルへの書き込みは追記)
+            is_first_write: bool = self.__num_of_pages == 0 and self.__num_of_existing_rows == 0
+            list_member_df.to_csv(
+                self.__list_member_file_path,
+                header=is_first_write,
+                index=False,
+                mode="w" if is_first_write else "a",
+                encoding=const_util.ENCODING,
+            )
+
+            # 書き込み状況の更新
+            if self.__num_of_pages == 0:
+                self.__head_df = list_member_df.head(self.__num_of_rows_head_and_tail)
+            self.__tail_df = list_member_df.tail(self.__num_of_rows_head_and_tail)
+            self.__num_of_pages += 1
+            self.__num_of_rows += len(list_member_df)
+
+            clg.log_dbg(f"リストメンバーファイルに追記しました。(num_of_rows:{self.__num_of_rows})")
+        except Exception as e:
+            raise (e)
+
+        return None
+
+    def write_users(
+        self,
+        users: Iterable[Any],
+    ) -> None:
+        """ユーザ(複数)書き込み"""
+        self.write(generate_list_member_df(self.__use_debug_mode, users))
+        return None
+
+    @property
+    def list_member_file_path(self) -> str:
+        return self.__list_member_file_path
+
+    @property
+    def num_of_pages(self) -> int:
+        return self.__num_of_pages
+
+    @property
+    def num_of_rows(self) -> int:
+        return self.__num_of_rows
+
+    @property
+    def head_df(self) -> pd.DataFrame:
+        return self.__head_df
+
+    @property
+    def tail_df(self) -> pd.DataFrame:
+        return self.__tail_df
+
+
 def save_list_member_df(
     use_debug_mode: bool,
     list_member_df: pd.DataFrame,
@@ -62,6 +312,114 @@ def read_list_member_file(
     return list_member_df
 
 
+def truncate_list_member_file(
+    use_debug_mode: bool,
+    list_member_file_path: str,
+    num_of_rows: int,
+) -> None:
+    """
+    リストメンバーファイル切り詰め
+
+    Args:
+        use_debug_mode (bool)       : デバッグモード使用有無
+        list_member_file_path (str) : リストメンバーファイルパス
+        num_of_rows (int)           : 残す行数(ヘッダを除く)
+
+    Returns:
+        -
+
+    Notes:
+        - 中断したエクスポートを再開する前に、チェックポイント以降に書き込まれた行を取り除く
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # ファイルの読み込み(残す行のみ)
+        list_member_df: pd.DataFrame = pd.read_csv(
+            list_member_file_path,
+            dtype=str,
+            keep_default_na=False,
+            nrows=num_of_rows,
+            encoding=const_util.ENCODING,
+        )
+
+        # ファイルの上書き
+        list_member_df.to_csv(
+            list_member_file_path,
+            header=True,
+            index=False,
+            mode="w",
+            encoding=const_util.ENCODING,
+        )
+
+        clg.log_dbg(f"リストメンバーファイルを切り詰めました。(num_of_rows:{len(list_member_df)})")
+    except Exception as e:
+        raise (e)
+
+    return None
+
+
+def generate_tweet_search_result_df(
+    use_debug_mode: bool,
+    tweet_search_result_raw_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    ツイート検索結果データフレーム生成
+
+    Args:
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        tweet_search_result_raw_df (pd.DataFrame)   : ツイート検索結果データフレーム(加工前)
+
+    Returns:
+        pd.DataFrame: ツイート検索結果データフレーム
+
+    Notes:
+        - 加工前の列(const_util.TWEET_SEARCH_RESULT_RAW_HEADER)から以下を列ごとに一括で導出する
+            - 作成日時(JST)
+            - ツイート本文(改行除去)
+            - ツイートURL
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # 加工前の列の取得
+        raw_header: list[str] = const_util.TWEET_SEARCH_RESULT_RAW_HEADER
+        creation_timestamp_series: pd.Series = tweet_search_result_raw_df[raw_header[0]]
+        user_id_series: pd.Series = tweet_search_result_raw_df[raw_header[1]]
+        user_name_series: pd.Series = tweet_search_result_raw_df[raw_header[2]]
+        tweet_text_series: pd.Series = tweet_search_result_raw_df[raw_header[3]]
+        retweet_count_series: pd.Series = tweet_search_result_raw_df[raw_header[4]]
+        favorite_count_series: pd.Series = tweet_search_result_raw_df[raw_header[5]]
+        tweet_id_series: pd.Series = tweet_search_result_raw_df[raw_header[6]]
+
+        # データフレームの生成
+        header: list[str] = const_util.TWEET_SEARCH_RESULT_HEADER
+        tweet_search_result_df: pd.DataFrame = pd.DataFrame(
+            {
+                header[0]: convert_timestamp_series_to_jst(creation_timestamp_series),
+                header[1]: user_id_series,
+                header[2]: user_name_series,
+                header[3]: tweet_text_series.astype(str).str.replace("\n", "", regex=False),
+                header[4]: retweet_count_series,
+                header[5]: favorite_count_series,
+                header[6]: format_series(const_util.TWEET_URL, user_id_series, tweet_id_series),
+            },
+            columns=header,
+        )
+    except Exception as e:
+        raise (e)
+
+    return tweet_search_result_df
+
+
 def save_tweet_search_result_df(
     use_debug_mode: bool,
     tweet_search_result_df: pd.DataFrame,
@@ -6,3 +6,11 @@ https://developer.twitter.com/en/docs/api-reference-index
 from .premium import *
 from .standard import *
 from .twitter_api_auth_util import *
+from .twitter_api_pool_util import *
+from .twitter_api_transport_util import *
+from .twitter_progress_util import *
+from .twitter_rate_limit_util import *
+from .twitter_rate_limiter_util import *
+from .twitter_raw_json_util import *
+from .twitter_record_util import *
+from .twitter_user_store_util import *
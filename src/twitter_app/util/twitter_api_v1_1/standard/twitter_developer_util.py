@@ -5,6 +5,8 @@ from typing import Any, Optional
 import python_lib_for_me as pyl
 import tweepy
 
+from twitter_app.util.twitter_api_v1_1 import twitter_rate_limit_util
+
 
 def show_rate_limit(
     use_debug_mode: bool,
@@ -38,6 +40,8 @@ def show_rate_limit(
                 - リクエスト数／１５分 : 180
                     - 超過した場合は15分の待機時間が発生する
         - Twitter API Standard v1.1 のGETメソッドに対してのみ正確である
+        - レスポンスヘッダから記録したレート制限が有効な場合はそれを表示し、APIを呼び出さない
+            - 有効でない場合はAPIを呼び出し、取得した全てのレート制限をレジストリに記録する
 
     References:
         - エンドポイント
@@ -57,8 +61,23 @@ def show_rate_limit(
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
+        # 記録済みレート制限の取得
+        recorded_rate_limit: Optional[twitter_rate_limit_util.RateLimit] = None
+        if not (resource_family == "" or endpoint == ""):
+            auth_context: str = twitter_rate_limit_util.generate_auth_context_of_api(api)
+            recorded_rate_limit = twitter_rate_limit_util.get_rate_limit_registry().get(auth_context, endpoint)
+
         # レート制限の表示
+        if recorded_rate_limit is not None:
+            clg.log_inf(
+                f"リクエスト回数(15分間隔)：{recorded_rate_limit.remaining}/{recorded_rate_limit.limit}、"
+                + f"制限リセット時刻：{datetime.fromtimestamp(recorded_rate_limit.reset)} "
+                + f"(resource_family:{resource_family}, endpoint:{endpoint}, source:response_header)"
+            )
+            return None
+
         rate_limits: Any = api.rate_limit_status()
+        twitter_rate_limit_util.record_rate_limit_status(api, rate_limits)
         if not (resource_family == "" or endpoint == ""):
             rate_limit: dict = rate_limits["resources"][resource_family][endpoint]
             remaining: int = rate_limit["remaining"]
@@ -96,6 +115,15 @@ def show_rate_limit_of_friends_list(
     return None
 
 
+def show_rate_limit_of_friends_ids(
+    use_debug_mode: bool,
+    api: tweepy.API,
+) -> None:
+    """レート制限表示(GET friends/ids)"""
+    show_rate_limit(use_debug_mode, api, "friends", "/friends/ids")
+    return None
+
+
 def show_rate_limit_of_followers_list(
     use_debug_mode: bool,
     api: tweepy.API,
@@ -105,6 +133,24 @@ def show_rate_limit_of_followers_list(
     return None
 
 
+def show_rate_limit_of_followers_ids(
+    use_debug_mode: bool,
+    api: tweepy.API,
+) -> None:
+    """レート制限表示(GET followers/ids)"""
+    show_rate_limit(use_debug_mode, api, "followers", "/followers/ids")
+    return None
+
+
+def show_rate_limit_of_users_lookup(
+    use_debug_mode: bool,
+    api: tweepy.API,
+) -> None:
+    """レート制限表示(GET users/lookup)"""
+    show_rate_limit(use_debug_mode, api, "users", "/users/lookup")
+    return None
+
+
 def show_rate_limit_of_search_tweets(
     use_debug_mode: bool,
     api: tweepy.API,
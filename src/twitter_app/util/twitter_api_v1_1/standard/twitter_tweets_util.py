@@ -1,12 +1,18 @@
 import math
 from enum import Enum, IntEnum
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import python_lib_for_me as pyl
 import tweepy
 from tweepy.models import SearchResults
 
 from twitter_app.util import const_util
+from twitter_app.util.twitter_api_v1_1 import (
+    twitter_api_pool_util,
+    twitter_progress_util,
+    twitter_raw_json_util,
+    twitter_record_util,
+)
 
 
 class EnumOfSearchResultType(Enum):
@@ -34,22 +40,30 @@ def search_tweets_in_past_7day(
     search_result_type: EnumOfSearchResultType,
     num_of_data: int = EnumOfTweetsInPast7Day.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
     num_of_data_per_request: int = EnumOfTweetsInPast7Day.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
+    use_raw_json_parser: bool = False,
 ) -> list[SearchResults]:
     """
     ツイート検索(過去7日間)
 
     Args:
-        use_debug_mode (bool)                       : デバッグモード使用有無
-        api (tweepy.API)                            : API
-        query (str)                                 : クエリ
-        search_result_type (EnumOfSearchResultType) : 検索結果の種類
-        num_of_data (int, optional)                 : データ数
-        num_of_data_per_request (int, optional)     : リクエストごとのデータ数
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        query (str)                                    : クエリ
+        search_result_type (EnumOfSearchResultType)    : 検索結果の種類
+        num_of_data (int, optional)                    : データ数
+        num_of_data_per_request (int, optional)        : リクエストごとのデータ数
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        api_pool (Optional[TwitterApiPool])            : APIプール(指定した場合はリクエストを認証情報ごとに分散する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをTweetRecordのリストで返却する)
 
     Returns:
         list[SearchResults] : ツイート検索結果ページ (list[SearchResults[tweepy.models.Status]])
 
     Notes:
+        - 生JSONパーサーを使用する場合は`tweepy.Cursor`を使用せずにmax_idでページングする
+            - `tweepy.Cursor`はmax_idの算出のために常にモデルを生成するため
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
@@ -92,13 +106,33 @@ def search_tweets_in_past_7day(
         num_of_requests = math.ceil(num_of_data / num_of_data_per_request)
 
         # ツイートの検索
-        tweet_search_result_pagination: tweepy.Cursor = tweepy.Cursor(
-            api.search_tweets,
-            q=query,
-            result_type=search_result_type.value,
-            count=num_of_data_per_request,
+        search_tweets: Any = (
+            api_pool.generate_dispatch_method("search_tweets", "/search/tweets")
+            if api_pool is not None
+            else api.search_tweets
         )
-        tweet_search_result_pages = list(tweet_search_result_pagination.pages(num_of_requests))
+        tweet_search_result_page_iterator: Any = None
+        if use_raw_json_parser is False:
+            tweet_search_result_page_iterator = tweepy.Cursor(
+                search_tweets,
+                q=query,
+                result_type=search_result_type.value,
+                count=num_of_data_per_request,
+            ).pages(num_of_requests)
+        else:
+            tweet_search_result_page_iterator = __iter_raw_tweet_search_result_pages(
+                search_tweets,
+                query,
+                search_result_type,
+                num_of_requests,
+                num_of_data_per_request,
+            )
+        for tweet_search_result_page in tweet_search_result_page_iterator:
+            tweet_search_result_pages.append(tweet_search_result_page)
+
+            # 進捗の報告
+            if progress_reporter is not None:
+                progress_reporter.update(len(tweet_search_result_page))
 
         clg.log_inf(f"ツイート検索(過去7日間)に成功しました。(query:{query})")
     except Exception as e:
@@ -109,6 +143,34 @@ def search_tweets_in_past_7day(
     return tweet_search_result_pages
 
 
+def __iter_raw_tweet_search_result_pages(
+    search_tweets: Any,
+    query: str,
+    search_result_type: EnumOfSearchResultType,
+    num_of_requests: int,
+    num_of_data_per_request: int,
+) -> Iterator[list[twitter_record_util.TweetRecord]]:
+    """ツイート検索結果ページ取得(生JSONパーサー)(イテレータ)(max_idは前ページの最小のツイートIDの1つ前とする)"""
+
+    max_id: Optional[int] = None
+    for _ in range(num_of_requests):
+        tweet_search_result_page: list[twitter_record_util.TweetRecord] = search_tweets(
+            q=query,
+            result_type=search_result_type.value,
+            count=num_of_data_per_request,
+            max_id=max_id,
+            parser=twitter_raw_json_util.RawJsonParser(),
+        )
+        if len(tweet_search_result_page) == 0:
+            break
+
+        yield tweet_search_result_page
+
+        max_id = min(tweet.id for tweet in tweet_search_result_page) - 1
+
+    return None
+
+
 class CustomStream(tweepy.Stream):
     def __init__(
         self,
@@ -1,20 +1,126 @@
+import asyncio
+import copy
 import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from enum import IntEnum
-from typing import Any, Optional
+from enum import Enum, IntEnum
+from typing import Any, Iterator, Optional
 
 import python_lib_for_me as pyl
+import requests
 import tweepy
 from tweepy.models import ResultSet
 
 from twitter_app import util
+from twitter_app.util.twitter_api_v1_1 import (
+    twitter_api_pool_util,
+    twitter_api_transport_util,
+    twitter_progress_util,
+    twitter_rate_limiter_util,
+    twitter_raw_json_util,
+    twitter_record_util,
+    twitter_user_store_util,
+)
 
 ####################################################################################################
 # Follow, search, and get users
 ####################################################################################################
 
 
+class PageCursor:
+    """
+    ページカーソル
+
+    Notes:
+        - カーソルによるページネーションの取得位置を保持する
+        - 取得開始位置を指定した場合は、そのページから取得を開始する(中断した取得の再開用)
+        - 次ページの取得位置はページを返却する直前に更新する
+            - 呼び出し元はページを処理した後に参照すれば、処理済みのページの次から再開できる
+            - 0の場合は最終ページまで取得済みであることを示す
+        - 消費済みデータ数は次ページの取得位置までに取得したデータ数を示す(ID取得後にユーザ情報を補完する取得のみ更新する)
+            - 凍結や削除により補完できなかったユーザも含むため、返却したユーザ数より多くなる場合がある
+    """
+
+    def __init__(
+        self,
+        cursor: int = -1,
+        num_of_consumed_data: int = 0,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            cursor (int, optional)                  : 取得開始位置(-1の場合は先頭ページ)
+            num_of_consumed_data (int, optional)    : 消費済みデータ数(取得開始位置までに取得したデータ数)
+        """
+
+        self.__cursor: int = cursor
+        self.__next_cursor: int = cursor
+        self.__num_of_consumed_data: int = num_of_consumed_data
+
+    @property
+    def cursor(self) -> int:
+        return self.__cursor
+
+    @property
+    def next_cursor(self) -> int:
+        return self.__next_cursor
+
+    @next_cursor.setter
+    def next_cursor(self, next_cursor: int) -> None:
+        self.__next_cursor = next_cursor
+
+    @property
+    def num_of_consumed_data(self) -> int:
+        return self.__num_of_consumed_data
+
+    @num_of_consumed_data.setter
+    def num_of_consumed_data(self, num_of_consumed_data: int) -> None:
+        self.__num_of_consumed_data = num_of_consumed_data
+
+
+class EnumOfFetchProfile(Enum):
+    DEFAULT = "default"  # 既定のペイロード
+    LEAN = "lean"  # 最新のツイートとエンティティを除外したペイロード
+
+
+def __generate_params_of_fetch_profile(
+    fetch_profile: EnumOfFetchProfile,
+    endpoint: str,
+) -> dict[str, str]:
+    """
+    取得プロファイルパラメータ生成
+
+    Args:
+        fetch_profile (EnumOfFetchProfile)  : 取得プロファイル
+        endpoint (str)                      : エンドポイント(例：/friends/list)
+
+    Returns:
+        dict[str, str]: パラメータ (APIのメソッドにキーワード引数として指定する)
+
+    Notes:
+        - LEANの場合はエンドポイントが対応するパラメータでレスポンスを縮小する
+            - skip_status           : ユーザの最新のツイートを除外する
+            - include_user_entities : ユーザのエンティティを除外する(friends/list、followers/list)
+            - include_entities      : エンティティを除外する(lists/members、blocks/list、users/lookup)
+        - 真偽値はAPIが解釈できる小文字の文字列で指定する(tweepyは`str`で変換するため)
+    """
+
+    params: dict[str, str] = {}
+
+    if fetch_profile == EnumOfFetchProfile.LEAN:
+        if endpoint in ("/friends/list", "/followers/list"):
+            params = {"skip_status": "true", "include_user_entities": "false"}
+        elif endpoint in ("/lists/members", "/blocks/list"):
+            params = {"skip_status": "true", "include_entities": "false"}
+        elif endpoint == "/users/lookup":
+            params = {"include_entities": "false"}
+
+    return params
+
+
 class EnumOfFollowee:
     class EnumOfOauth1User(IntEnum):
         MAX_NUM_OF_DATA_PER_REQUEST = 200
@@ -27,27 +133,38 @@ class EnumOfFollowee:
         MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
 
-def get_followee_pages(
+def iter_followee_pages(
     use_debug_mode: bool,
     api: tweepy.API,
     user_id: str,
     num_of_data: int = EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
     num_of_data_per_request: int = EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
-) -> list[ResultSet]:
+    page_cursor: Optional[PageCursor] = None,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
     """
-    フォロイーページ取得
+    フォロイーページ取得(イテレータ)
 
     Args:
-        use_debug_mode (bool)                   : デバッグモード使用有無
-        api (tweepy.API)                        : API
-        user_id (str)                           : ユーザID
-        num_of_data (int, optional)             : データ数
-        num_of_data_per_request (int, optional) : リクエストごとのデータ数
-
-    Returns:
-        list[ResultSet] : フォロイーページ (list[ResultSet[tweepy.models.User]])
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        user_id (str)                                  : ユーザID
+        num_of_data (int, optional)                    : データ数
+        num_of_data_per_request (int, optional)        : リクエストごとのデータ数
+        page_cursor (Optional[PageCursor])             : ページカーソル(取得位置の指定と保持)
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Yields:
+        ResultSet : フォロイーページ (ResultSet[tweepy.models.User])
 
     Notes:
+        - ページを1つずつ遅延して取得する
+            - 呼び出し元はページの到着ごとに処理を開始できる
+            - 呼び出し元が反復を途中で終了した場合は以降のページを取得しない
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
@@ -72,7 +189,6 @@ def get_followee_pages(
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
-    followee_pages: list[ResultSet] = []
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
@@ -91,8 +207,21 @@ def get_followee_pages(
             api.get_friends,
             screen_name=user_id,
             count=num_of_data_per_request,
+            cursor=page_cursor.cursor if page_cursor is not None else -1,
+            parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+            **__generate_params_of_fetch_profile(fetch_profile, "/friends/list"),
         )
-        followee_pages = list(followee_pagination.pages(num_of_requests))
+        followee_page_iterator: Any = followee_pagination.pages(num_of_requests)
+        for followee_page in followee_page_iterator:
+            # 次ページの取得位置の更新
+            if page_cursor is not None:
+                page_cursor.next_cursor = followee_page_iterator.next_cursor
+
+            # 進捗の報告
+            if progress_reporter is not None:
+                progress_reporter.update(len(followee_page))
+
+            yield followee_page
 
         clg.log_inf(f"フォロイーページ取得に成功しました。(user_id:{user_id})")
     except Exception as e:
@@ -100,30 +229,98 @@ def get_followee_pages(
             clg.log_err(f"フォロイーページ取得に失敗しました。(user_id:{user_id})")
         raise (e)
 
+    return None
+
+
+def get_followee_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    user_id: str,
+    num_of_data: int = EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> list[ResultSet]:
+    """
+    フォロイーページ取得
+
+    Args:
+        use_debug_mode (bool)                        : デバッグモード使用有無
+        api (tweepy.API)                             : API
+        user_id (str)                                : ユーザID
+        num_of_data (int, optional)                  : データ数
+        num_of_data_per_request (int, optional)      : リクエストごとのデータ数
+        fetch_profile (EnumOfFetchProfile, optional) : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Returns:
+        list[ResultSet] : フォロイーページ (list[ResultSet[tweepy.models.User]])
+
+    Notes:
+        - 全ページを取得してから返却する(ページごとに処理する場合は`iter_followee_pages`を使用する)
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
+        - エンドポイント
+            - GET friends/list
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 200
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - データ数／リクエスト : 200
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friends-list
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    followee_pages: list[ResultSet] = []
+
+    try:
+        # フォロイーページの取得
+        followee_pages = list(
+            iter_followee_pages(
+                use_debug_mode,
+                api,
+                user_id,
+                num_of_data,
+                num_of_data_per_request,
+                fetch_profile=fetch_profile,
+            )
+        )
+    except Exception as e:
+        raise (e)
+
     return followee_pages
 
 
-class EnumOfFollower:
+class EnumOfFolloweeId:
     class EnumOfOauth1User(IntEnum):
-        MAX_NUM_OF_DATA_PER_REQUEST = 200
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
         MAX_NUM_OF_REQUESTS_PER_15MIN = 15
         MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
     class EnumOfOauth2App(IntEnum):
-        MAX_NUM_OF_DATA_PER_REQUEST = 200
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
         MAX_NUM_OF_REQUESTS_PER_15MIN = 15
         MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
 
-def get_follower_pages(
+def iter_followee_id_pages(
     use_debug_mode: bool,
     api: tweepy.API,
     user_id: str,
-    num_of_data: int = EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
-    num_of_data_per_request: int = EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
-) -> list[ResultSet]:
+    num_of_data: int = EnumOfFolloweeId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfFolloweeId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    page_cursor: Optional[PageCursor] = None,
+) -> Iterator[list[int]]:
     """
-    フォロワーページ取得
+    フォロイーIDページ取得(イテレータ)
 
     Args:
         use_debug_mode (bool)                   : デバッグモード使用有無
@@ -131,36 +328,36 @@ def get_follower_pages(
         user_id (str)                           : ユーザID
         num_of_data (int, optional)             : データ数
         num_of_data_per_request (int, optional) : リクエストごとのデータ数
+        page_cursor (Optional[PageCursor])      : ページカーソル(取得位置の指定と保持)
 
-    Returns:
-        list[ResultSet] : フォロワーページ (list[ResultSet[tweepy.models.User]])
+    Yields:
+        list[int] : フォロイーIDページ (list[フォロイーの数値ID])
 
     Notes:
+        - ページを1つずつ遅延して取得する
+        - 返却されるのは数値IDのみであるため、ユーザ情報が必要な場合は`iter_lookup_user_pages`で補完する
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
         - エンドポイント
-            - GET followers/list
+            - GET friends/ids
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - データ数／リクエスト : 200
+                - データ数／リクエスト : 5000
                 - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
             - アプリ認証(OAuth 2.0)
-                - データ数／リクエスト : 200
+                - データ数／リクエスト : 5000
                 - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
             - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-followers-list
-        - レスポンス
-            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friends-ids
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
-    follower_pages: list[ResultSet] = []
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
@@ -169,138 +366,193 @@ def get_follower_pages(
     try:
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
-        clg.log_inf(f"時間がかかるため気長にお待ちください。")
 
         # リクエスト数の算出
         num_of_requests = math.ceil(num_of_data / num_of_data_per_request)
 
-        # フォロワーページの取得
-        follower_pagination: tweepy.Cursor = tweepy.Cursor(
-            api.get_followers,
+        # フォロイーIDページの取得
+        followee_id_pagination: tweepy.Cursor = tweepy.Cursor(
+            api.get_friend_ids,
             screen_name=user_id,
             count=num_of_data_per_request,
+            cursor=page_cursor.cursor if page_cursor is not None else -1,
         )
-        follower_pages = list(follower_pagination.pages(num_of_requests))
+        followee_id_page_iterator: Any = followee_id_pagination.pages(num_of_requests)
+        for followee_id_page in followee_id_page_iterator:
+            # 次ページの取得位置の更新
+            if page_cursor is not None:
+                page_cursor.next_cursor = followee_id_page_iterator.next_cursor
 
-        clg.log_inf(f"フォロワーページ取得に成功しました。(user_id:{user_id})")
+            yield followee_id_page
+
+        clg.log_inf(f"フォロイーIDページ取得に成功しました。(user_id:{user_id})")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"フォロワーページ取得に失敗しました。(user_id:{user_id})")
+            clg.log_err(f"フォロイーIDページ取得に失敗しました。(user_id:{user_id})")
         raise (e)
 
-    return follower_pages
+    return None
 
 
-def get_friendship(
+def iter_followee_pages_by_ids(
     use_debug_mode: bool,
     api: tweepy.API,
-    user_id_source: str,
-    user_id_target: str,
-) -> Any:
+    user_id: str,
+    num_of_data: int = EnumOfFolloweeId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    page_cursor: Optional[PageCursor] = None,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
     """
-    交友関係取得
+    フォロイーページ取得(ID取得後にユーザ情報を補完する)(イテレータ)
 
     Args:
-        use_debug_mode (bool)   : デバッグモード使用有無
-        api (tweepy.API)        : API
-        user_id_source (str)    : ユーザID(比較元)
-        user_id_target (str)    : ユーザID(比較対象)
-
-    Returns:
-        Any: 交友関係 (tweepy.models.Friendship)
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        user_id (str)                                  : ユーザID
+        num_of_data (int, optional)                    : データ数
+        page_cursor (Optional[PageCursor])             : ページカーソル(取得位置の指定と保持)
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        api_pool (Optional[TwitterApiPool])            : APIプール(指定した場合はリクエストを認証情報ごとに分散する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Yields:
+        ResultSet : フォロイーページ (ResultSet[tweepy.models.User])
 
     Notes:
-        - 認証
-            - ユーザ認証(OAuth 1.0a)
-            - アプリ認証(OAuth 2.0)
+        - `iter_followee_pages`の代替であり、大量のフォロイーを取得する場合に使用する
+            - フォロイーIDを5000件ごとに取得し、100件ごとにユーザ情報を補完する
+            - 1ページは100件となり、フォロイーIDの順序を維持する
+            - 凍結や削除により補完できなかったユーザは含まれない
+        - ページカーソルはIDページの最後のページを返却する直前にのみ更新する
+            - IDページの途中で中断した場合は、そのIDページの先頭から再開する
+            - 消費済みデータ数には補完できなかったユーザを含むIDページのID数を加算する
         - エンドポイント
-            - GET friendships/show
+            - GET friends/ids
+            - GET users/lookup
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - リクエスト数／１５分 : 180
-                    - 超過した場合は15分の待機時間が発生する
+                - データ数／１５分 : 75000(friends/ids)、90000(users/lookup)
             - アプリ認証(OAuth 2.0)
-                - リクエスト数／１５分 : 15
-                    - 超過した場合は15分の待機時間が発生する
-
-    References:
-        - エンドポイント
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friendships-show
-        - レスポンス
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friendships-show#example-response
+                - データ数／１５分 : 75000(friends/ids)、30000(users/lookup)
     """  # noqa: E501
 
-    clg: Optional[pyl.CustomLogger] = None
-
-    # 認証方式の確認
-    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
-        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+    num_of_remaining_data: int = num_of_data
+    id_page_cursor: PageCursor = PageCursor(page_cursor.cursor if page_cursor is not None else -1)
 
     try:
-        # ロガーの取得
-        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+        # フォロイーIDページの取得
+        for followee_id_page in iter_followee_id_pages(
+            use_debug_mode,
+            api,
+            user_id,
+            num_of_data,
+            page_cursor=id_page_cursor,
+        ):
+            # フォロイーIDの絞り込み(データ数を超過した分は補完しない)
+            followee_ids: list[int] = followee_id_page[:num_of_remaining_data]
+            num_of_remaining_data -= len(followee_ids)
+
+            # フォロイーページの取得(ユーザ情報の補完)
+            num_of_followee_pages: int = math.ceil(
+                len(followee_ids) / EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value
+            )
+            followee_pages: Iterator[ResultSet] = iter_lookup_user_pages(
+                use_debug_mode,
+                api,
+                followee_ids,
+                progress_reporter=progress_reporter,
+                api_pool=api_pool,
+                use_raw_json_parser=use_raw_json_parser,
+                fetch_profile=fetch_profile,
+            )
+            for index, followee_page in enumerate(followee_pages, start=1):
+                # 次ページの取得位置の更新(IDページの最後のページのみ)
+                if page_cursor is not None and index == num_of_followee_pages:
+                    page_cursor.next_cursor = id_page_cursor.next_cursor
+                    page_cursor.num_of_consumed_data += len(followee_ids)
 
-        # 交友関係の取得
-        friendship: Any = api.get_friendship(source_screen_name=user_id_source, target_screen_name=user_id_target)
+                yield followee_page
 
-        clg.log_dbg(f"交友関係取得に成功しました。")
+            if num_of_remaining_data <= 0:
+                break
     except Exception as e:
-        if clg is not None:
-            clg.log_err(f"交友関係取得に失敗しました。")
         raise (e)
 
-    return friendship
+    return None
 
 
-class EnumOfUserForLookup(IntEnum):
-    MAX_NUM_OF_DATA_PER_REQUEST = 100
+class EnumOfFollower:
+    class EnumOfOauth1User(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 200
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 15
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
+    class EnumOfOauth2App(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 200
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 15
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
-def lookup_users(
+
+def iter_follower_pages(
     use_debug_mode: bool,
     api: tweepy.API,
-    user_ids: list[str],
-    num_of_data_per_request: int = EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value,
-) -> list[ResultSet]:
+    user_id: str,
+    num_of_data: int = EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    page_cursor: Optional[PageCursor] = None,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
     """
-    ユーザ検索
+    フォロワーページ取得(イテレータ)
 
     Args:
-        use_debug_mode (bool)                   : デバッグモード使用有無
-        api (tweepy.API)                        : API
-        user_ids (str)                          : ユーザID(複数)
-        num_of_data_per_request (int, optional) : リクエストごとのデータ数
-
-    Returns:
-        list[ResultSet]: ユーザ検索結果ページ (list[ResultSet[tweepy.models.User]])
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        user_id (str)                                  : ユーザID
+        num_of_data (int, optional)                    : データ数
+        num_of_data_per_request (int, optional)        : リクエストごとのデータ数
+        page_cursor (Optional[PageCursor])             : ページカーソル(取得位置の指定と保持)
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Yields:
+        ResultSet : フォロワーページ (ResultSet[tweepy.models.User])
 
     Notes:
+        - ページを1つずつ遅延して取得する
+            - 呼び出し元はページの到着ごとに処理を開始できる
+            - 呼び出し元が反復を途中で終了した場合は以降のページを取得しない
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
         - エンドポイント
-            - GET users/lookup
+            - GET followers/list
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - データ数／リクエスト : 100
-                - リクエスト数／１５分 : 900
+                - データ数／リクエスト : 200
+                - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
             - アプリ認証(OAuth 2.0)
-                - データ数／リクエスト : 100
-                - リクエスト数／１５分 : 300
+                - データ数／リクエスト : 200
+                - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
             - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-users-lookup
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-followers-list
         - レスポンス
             - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
-    user_pages: list[ResultSet] = []
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
@@ -309,125 +561,164 @@ def lookup_users(
     try:
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+        clg.log_inf(f"時間がかかるため気長にお待ちください。")
 
-        # ユーザIDリスト(100人ごと)の生成
-        user_ids_list: list[list[str]] = pyl.split_list(user_ids, num_of_data_per_request)
+        # リクエスト数の算出
+        num_of_requests = math.ceil(num_of_data / num_of_data_per_request)
 
-        # ユーザ(100人ごと)の検索
-        for user_ids_by_element in user_ids_list:
-            users: Any = api.lookup_users(screen_name=user_ids_by_element)
-            user_pages.append(users)
+        # フォロワーページの取得
+        follower_pagination: tweepy.Cursor = tweepy.Cursor(
+            api.get_followers,
+            screen_name=user_id,
+            count=num_of_data_per_request,
+            cursor=page_cursor.cursor if page_cursor is not None else -1,
+            parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+            **__generate_params_of_fetch_profile(fetch_profile, "/followers/list"),
+        )
+        follower_page_iterator: Any = follower_pagination.pages(num_of_requests)
+        for follower_page in follower_page_iterator:
+            # 次ページの取得位置の更新
+            if page_cursor is not None:
+                page_cursor.next_cursor = follower_page_iterator.next_cursor
 
-        clg.log_inf(f"ユーザ検索に成功しました。")
+            # 進捗の報告
+            if progress_reporter is not None:
+                progress_reporter.update(len(follower_page))
+
+            yield follower_page
+
+        clg.log_inf(f"フォロワーページ取得に成功しました。(user_id:{user_id})")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"ユーザ検索に失敗しました。")
+            clg.log_err(f"フォロワーページ取得に失敗しました。(user_id:{user_id})")
         raise (e)
 
-    return user_pages
+    return None
 
 
-def get_user_info(
+def get_follower_pages(
     use_debug_mode: bool,
     api: tweepy.API,
     user_id: str,
-) -> Any:
+    num_of_data: int = EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> list[ResultSet]:
     """
-    ユーザ情報取得
+    フォロワーページ取得
 
     Args:
-        use_debug_mode (bool)   : デバッグモード使用有無
-        api (tweepy.API)        : API
-        user_id (str)           : ユーザID
+        use_debug_mode (bool)                        : デバッグモード使用有無
+        api (tweepy.API)                             : API
+        user_id (str)                                : ユーザID
+        num_of_data (int, optional)                  : データ数
+        num_of_data_per_request (int, optional)      : リクエストごとのデータ数
+        fetch_profile (EnumOfFetchProfile, optional) : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
 
     Returns:
-        Any: ユーザ情報 (tweepy.models.User)
+        list[ResultSet] : フォロワーページ (list[ResultSet[tweepy.models.User]])
 
     Notes:
+        - 全ページを取得してから返却する(ページごとに処理する場合は`iter_follower_pages`を使用する)
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
         - エンドポイント
-            - GET users/show
+            - GET followers/list
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - リクエスト数／１５分 : 900
+                - データ数／リクエスト : 200
+                - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
             - アプリ認証(OAuth 2.0)
-                - リクエスト数／１５分 : 900
+                - データ数／リクエスト : 200
+                - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
             - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-users-show
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-followers-list
         - レスポンス
             - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
     """  # noqa: E501
 
-    clg: Optional[pyl.CustomLogger] = None
-
-    # 認証方式の確認
-    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
-        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+    follower_pages: list[ResultSet] = []
 
     try:
-        # ロガーの取得
-        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
-
-        # ユーザ情報の取得
-        user_info: Any = api.get_user(screen_name=user_id)
-
-        clg.log_dbg(f"ユーザ情報取得に成功しました。")
+        # フォロワーページの取得
+        follower_pages = list(
+            iter_follower_pages(
+                use_debug_mode,
+                api,
+                user_id,
+                num_of_data,
+                num_of_data_per_request,
+                fetch_profile=fetch_profile,
+            )
+        )
     except Exception as e:
-        if clg is not None:
-            clg.log_err(f"ユーザ情報取得に失敗しました。")
         raise (e)
 
-    return user_info
+    return follower_pages
 
 
-####################################################################################################
-# Create and manage lists
-####################################################################################################
+class EnumOfFollowerId:
+    class EnumOfOauth1User(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 15
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+
+    class EnumOfOauth2App(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 15
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
 
-def get_lists(
+def iter_follower_id_pages(
     use_debug_mode: bool,
     api: tweepy.API,
-    user_id: str = "",
-) -> ResultSet:
+    user_id: str,
+    num_of_data: int = EnumOfFollowerId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfFollowerId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    page_cursor: Optional[PageCursor] = None,
+) -> Iterator[list[int]]:
     """
-    リスト(複数)取得
+    フォロワーIDページ取得(イテレータ)
 
     Args:
-        use_debug_mode (bool)   : デバッグモード使用有無
-        api (tweepy.API)        : API
-        user_id (str)           : ユーザID
+        use_debug_mode (bool)                   : デバッグモード使用有無
+        api (tweepy.API)                        : API
+        user_id (str)                           : ユーザID
+        num_of_data (int, optional)             : データ数
+        num_of_data_per_request (int, optional) : リクエストごとのデータ数
+        page_cursor (Optional[PageCursor])      : ページカーソル(取得位置の指定と保持)
 
-    Returns:
-        ResultSet: リスト(複数) (ResultSet[tweepy.models.List])
+    Yields:
+        list[int] : フォロワーIDページ (list[フォロワーの数値ID])
 
     Notes:
+        - ページを1つずつ遅延して取得する
+        - 返却されるのは数値IDのみであるため、ユーザ情報が必要な場合は`iter_lookup_user_pages`で補完する
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
         - エンドポイント
-            - GET lists/list
+            - GET followers/ids
         - レート制限
             - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 5000
                 - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
             - アプリ認証(OAuth 2.0)
+                - データ数／リクエスト : 5000
                 - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-list
-        - レスポンス
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-followers-ids
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
@@ -440,80 +731,165 @@ def get_lists(
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
-        # リスト(複数)の取得
-        lists: Any
-        if user_id == "":
-            lists = api.get_lists(reverse=True)
-        else:
-            lists = api.get_lists(screen_name=user_id, reverse=True)
+        # リクエスト数の算出
+        num_of_requests = math.ceil(num_of_data / num_of_data_per_request)
 
-        clg.log_inf(f"リスト(複数)取得に成功しました。(user_id:{user_id})")
+        # フォロワーIDページの取得
+        follower_id_pagination: tweepy.Cursor = tweepy.Cursor(
+            api.get_follower_ids,
+            screen_name=user_id,
+            count=num_of_data_per_request,
+            cursor=page_cursor.cursor if page_cursor is not None else -1,
+        )
+        follower_id_page_iterator: Any = follower_id_pagination.pages(num_of_requests)
+        for follower_id_page in follower_id_page_iterator:
+            # 次ページの取得位置の更新
+            if page_cursor is not None:
+                page_cursor.next_cursor = follower_id_page_iterator.next_cursor
+
+            yield follower_id_page
+
+        clg.log_inf(f"フォロワーIDページ取得に成功しました。(user_id:{user_id})")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"リスト(複数)取得に失敗しました。(user_id:{user_id})")
+            clg.log_err(f"フォロワーIDページ取得に失敗しました。(user_id:{user_id})")
         raise (e)
 
-    return lists
+    return None
 
 
-class EnumOfListMember:
-    class EnumOfOauth1User(IntEnum):
-        MAX_NUM_OF_DATA_PER_REQUEST = 5000
-        MAX_NUM_OF_REQUESTS_PER_15MIN = 900
-        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+def iter_follower_pages_by_ids(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    user_id: str,
+    num_of_data: int = EnumOfFollowerId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    page_cursor: Optional[PageCursor] = None,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
+    """
+    フォロワーページ取得(ID取得後にユーザ情報を補完する)(イテレータ)
 
-    class EnumOfOauth2App(IntEnum):
-        MAX_NUM_OF_DATA_PER_REQUEST = 5000
-        MAX_NUM_OF_REQUESTS_PER_15MIN = 75
-        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+    Args:
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        user_id (str)                                  : ユーザID
+        num_of_data (int, optional)                    : データ数
+        page_cursor (Optional[PageCursor])             : ページカーソル(取得位置の指定と保持)
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        api_pool (Optional[TwitterApiPool])            : APIプール(指定した場合はリクエストを認証情報ごとに分散する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Yields:
+        ResultSet : フォロワーページ (ResultSet[tweepy.models.User])
+
+    Notes:
+        - `iter_follower_pages`の代替であり、大量のフォロワーを取得する場合に使用する
+            - フォロワーIDを5000件ごとに取得し、100件ごとにユーザ情報を補完する
+            - 1ページは100件となり、フォロワーIDの順序を維持する
+            - 凍結や削除により補完できなかったユーザは含まれない
+        - ページカーソルはIDページの最後のページを返却する直前にのみ更新する
+            - IDページの途中で中断した場合は、そのIDページの先頭から再開する
+            - 消費済みデータ数には補完できなかったユーザを含むIDページのID数を加算する
+        - エンドポイント
+            - GET followers/ids
+            - GET users/lookup
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／１５分 : 75000(followers/ids)、90000(users/lookup)
+            - アプリ認証(OAuth 2.0)
+                - データ数／１５分 : 75000(followers/ids)、30000(users/lookup)
+    """  # noqa: E501
 
+    num_of_remaining_data: int = num_of_data
+    id_page_cursor: PageCursor = PageCursor(page_cursor.cursor if page_cursor is not None else -1)
 
-def get_list_member_pages(
+    try:
+        # フォロワーIDページの取得
+        for follower_id_page in iter_follower_id_pages(
+            use_debug_mode,
+            api,
+            user_id,
+            num_of_data,
+            page_cursor=id_page_cursor,
+        ):
+            # フォロワーIDの絞り込み(データ数を超過した分は補完しない)
+            follower_ids: list[int] = follower_id_page[:num_of_remaining_data]
+            num_of_remaining_data -= len(follower_ids)
+
+            # フォロワーページの取得(ユーザ情報の補完)
+            num_of_follower_pages: int = math.ceil(
+                len(follower_ids) / EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value
+            )
+            follower_pages: Iterator[ResultSet] = iter_lookup_user_pages(
+                use_debug_mode,
+                api,
+                follower_ids,
+                progress_reporter=progress_reporter,
+                api_pool=api_pool,
+                use_raw_json_parser=use_raw_json_parser,
+                fetch_profile=fetch_profile,
+            )
+            for index, follower_page in enumerate(follower_pages, start=1):
+                # 次ページの取得位置の更新(IDページの最後のページのみ)
+                if page_cursor is not None and index == num_of_follower_pages:
+                    page_cursor.next_cursor = id_page_cursor.next_cursor
+                    page_cursor.num_of_consumed_data += len(follower_ids)
+
+                yield follower_page
+
+            if num_of_remaining_data <= 0:
+                break
+    except Exception as e:
+        raise (e)
+
+    return None
+
+
+def get_friendship(
     use_debug_mode: bool,
     api: tweepy.API,
-    list_id: str,
-    num_of_data: int = EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
-    num_of_data_per_request: int = EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
-) -> list[ResultSet]:
+    user_id_source: str,
+    user_id_target: str,
+) -> Any:
     """
-    リストメンバーページ取得
+    交友関係取得
 
     Args:
-        use_debug_mode (bool)                   : デバッグモード使用有無
-        api (tweepy.API)                        : API
-        list_id (str)                           : リストID
-        num_of_data (int, optional)             : データ数
-        num_of_data_per_request (int, optional) : リクエストごとのデータ数
+        use_debug_mode (bool)   : デバッグモード使用有無
+        api (tweepy.API)        : API
+        user_id_source (str)    : ユーザID(比較元)
+        user_id_target (str)    : ユーザID(比較対象)
 
     Returns:
-        list[ResultSet] : リストメンバーページ (list[ResultSet[tweepy.models.User]])
+        Any: 交友関係 (tweepy.models.Friendship)
 
     Notes:
         - 認証
             - ユーザ認証(OAuth 1.0a)
             - アプリ認証(OAuth 2.0)
         - エンドポイント
-            - GET lists/members
+            - GET friendships/show
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - データ数／リクエスト : 5000
-                - リクエスト数／１５分 : 900
+                - リクエスト数／１５分 : 180
                     - 超過した場合は15分の待機時間が発生する
             - アプリ認証(OAuth 2.0)
-                - データ数／リクエスト : 5000
-                - リクエスト数／１５分 : 75
+                - リクエスト数／１５分 : 15
                     - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-members
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friendships-show
         - レスポンス
-            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friendships-show#example-response
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
-    list_member_pages: list[ResultSet] = []
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
@@ -522,62 +898,66 @@ def get_list_member_pages(
     try:
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
-        clg.log_inf(f"時間がかかるため気長にお待ちください。")
-
-        # リクエスト数の算出
-        num_of_requests = math.ceil(num_of_data / num_of_data_per_request)
 
-        # リストメンバーページの取得
-        list_member_pagination: tweepy.Cursor = tweepy.Cursor(
-            api.get_list_members,
-            list_id=list_id,
-            count=num_of_data_per_request,
-        )
-        list_member_pages = list(list_member_pagination.pages(num_of_requests))
+        # 交友関係の取得
+        friendship: Any = api.get_friendship(source_screen_name=user_id_source, target_screen_name=user_id_target)
 
-        clg.log_inf(f"リストメンバーページ取得に成功しました。(list_id:{list_id})")
+        clg.log_dbg(f"交友関係取得に成功しました。")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"リストメンバーページ取得に失敗しました。(list_id:{list_id})")
+            clg.log_err(f"交友関係取得に失敗しました。")
         raise (e)
 
-    return list_member_pages
+    return friendship
 
 
-def generate_list(
+class EnumOfFriendshipForLookup(IntEnum):
+    MAX_NUM_OF_DATA_PER_REQUEST = 100
+    MAX_NUM_OF_REQUESTS_PER_15MIN = 15
+
+
+def lookup_friendships(
     use_debug_mode: bool,
     api: tweepy.API,
-    list_name: str,
-) -> Any:
+    user_ids: list[str],
+    num_of_data_per_request: int = EnumOfFriendshipForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value,
+) -> dict[str, list[str]]:
     """
-    リスト生成
+    交友関係検索
 
     Args:
-        use_debug_mode (bool)   : デバッグモード使用有無
-        api (tweepy.API)        : API
-        list_name (str)         : リスト名
+        use_debug_mode (bool)                   : デバッグモード使用有無
+        api (tweepy.API)                        : API
+        user_ids (list[str])                    : ユーザID(複数)
+        num_of_data_per_request (int, optional) : リクエストごとのデータ数
 
     Returns:
-        Any: リスト (tweepy.models.List)
+        dict[str, list[str]]: 交友関係 (キー：ユーザID(小文字)、値：認証ユーザとの接続状態(following、followed_by等))
 
     Notes:
+        - 認証ユーザとユーザ(複数)との交友関係を100人ごとにまとめて取得する
+        - 削除されたアカウント、凍結されたアカウントは含まれない
+        - 接続状態の公開値は`following`、`following_requested`、`followed_by`、`none`、`blocking`、`muting`である
+            - 自分をブロックしたかどうかは含まれないため、`get_friendship`の代わりには使用できない
+        - tweepyの`Relationship`は接続状態を既知の値のみ真偽値に変換して保持するため、JSONのまま取得する
         - 認証
             - ユーザ認証(OAuth 1.0a)
         - エンドポイント
-            - POST lists/create
+            - GET friendships/lookup
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - リクエスト数／１５分 : (未公表)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-create
-        - レスポンス
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friendships-lookup
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
+    friendships: dict[str, list[str]] = {}
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
@@ -587,53 +967,1230 @@ def generate_list(
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
-        # リストの生成
-        list_: Any = api.create_list(list_name, mode="private", description="")
+        # ユーザIDリスト(100人ごと)の生成
+        user_ids_list: list[list[str]] = pyl.split_list(user_ids, num_of_data_per_request)
 
-        clg.log_inf(f"リスト生成に成功しました。(list_name:{list_name})")
+        # 交友関係(100人ごと)の検索
+        for user_ids_by_element in user_ids_list:
+            relationships: Any = api.lookup_friendships(
+                screen_name=user_ids_by_element,
+                parser=tweepy.parsers.JSONParser(),
+            )
+            for relationship in relationships:
+                friendships[str(relationship["screen_name"]).lower()] = list(relationship["connections"])
+
+        clg.log_inf(f"交友関係検索に成功しました。")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"リスト生成に失敗しました。(list_name:{list_name})")
+            clg.log_err(f"交友関係検索に失敗しました。")
         raise (e)
 
-    return list_
+    return friendships
 
 
-def destroy_list(
+class EnumOfUserForLookup(IntEnum):
+    MAX_NUM_OF_DATA_PER_REQUEST = 100
+    MAX_NUM_OF_REQUESTS_PER_15MIN = 900
+    MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+    MAX_NUM_OF_PARALLEL_REQUESTS = 4
+
+
+def lookup_users(
     use_debug_mode: bool,
     api: tweepy.API,
-    list_name: str,
-) -> bool:
+    user_ids: list[str],
+    num_of_data_per_request: int = EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    num_of_parallel_requests: int = 1,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+    user_store: Optional[twitter_user_store_util.UserStore] = None,
+    use_async_client: bool = False,
+) -> list[ResultSet]:
     """
-    リスト破棄
+    ユーザ検索
 
     Args:
-        use_debug_mode (bool)   : デバッグモード使用有無
-        api (tweepy.API)        : API
-        list_name (str)         : リスト名
+        use_debug_mode (bool)                        : デバッグモード使用有無
+        api (tweepy.API)                             : API
+        user_ids (str)                               : ユーザID(複数)
+        num_of_data_per_request (int, optional)      : リクエストごとのデータ数
+        num_of_parallel_requests (int, optional)     : 並列リクエスト数(1の場合は逐次実行する)
+        use_raw_json_parser (bool, optional)         : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional) : 取得プロファイル(LEANの場合はエンティティを除外する)
+        user_store (Optional[UserStore], optional)   : ユーザストア(指定した場合は有効期限内のユーザをAPIで取得しない)
+        use_async_client (bool, optional)            : 非同期クライアント使用有無(並列リクエスト数を同時リクエスト数とする)
 
     Returns:
-        bool: 実行結果 (True：成功、False：失敗)
+        list[ResultSet]: ユーザ検索結果ページ (list[ResultSet[tweepy.models.User]])
 
     Notes:
+        - ユーザストアを指定した場合はユーザストアに存在しないユーザのみを検索し、検索したユーザを保存する
+            - 検索結果ページはUserRecordのリストで、指定したユーザIDの順序(100人ごと)で返却する
+        - 非同期クライアントを使用する場合は100人ごとの検索を1つのイベントループで並行に実行する
+            - スレッドを使用せずに多数のリクエストを重ねられる(aiohttpが必要)
+        - 並列リクエスト数が2以上の場合は100人ごとの検索をスレッドプールで並列に実行する
+            - 検索結果ページは指定したユーザIDの順序(100人ごと)で返却する
+            - `tweepy.API`はリクエストごとにセッションを閉じるため、共有セッションでない場合はスレッドごとにセッションを生成する
+            - リミッターを導入済み(`install_rate_limiter`または`install_http_transport`)の場合は、
+              各リクエストが送信前にリミッターからトークンを取得するため、レート制限を超過しない
+                - 導入していない場合は並列数分のリクエストが同時に送信され、超過時は`wait_on_rate_limit`の待機に頼る
         - 認証
             - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
         - エンドポイント
-            - POST lists/destroy
+            - GET users/lookup
         - レート制限
             - ユーザ認証(OAuth 1.0a)
-                - リクエスト数／１５分 : (未公表)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : 900
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : 300
+                    - 超過した場合は15分の待機時間が発生する
 
     References:
         - エンドポイント
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-destroy
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-users-lookup
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+    user_pages: list[ResultSet] = []
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # ユーザの取得(ユーザストアに保存済みかつ有効期限内のユーザ)
+        stored_users: dict[str, twitter_record_util.UserRecord] = {}
+        user_ids_to_lookup: list[str] = user_ids
+        if user_store is not None:
+            stored_users = user_store.get_users_by_screen_names(user_ids)
+            user_ids_to_lookup = [
+                user_id
+                for user_id in user_ids
+                if not (twitter_user_store_util.UserStore.generate_screen_name_key(user_id) in stored_users)
+            ]
+            clg.log_dbg(
+                f"ユーザストアからユーザを取得しました。"
+                + f"(num_of_stored_users:{len(stored_users)}, num_of_users_to_lookup:{len(user_ids_to_lookup)})"
+            )
+
+        # ユーザIDリスト(100人ごと)の生成
+        user_ids_list: list[list[str]] = pyl.split_list(user_ids_to_lookup, num_of_data_per_request)
+
+        # ユーザ(100人ごと)の検索(並列実行の場合も指定した順序で格納する)
+        if use_async_client is True:
+            user_pages = asyncio.run(
+                __lookup_users_by_async_client(
+                    use_debug_mode,
+                    api,
+                    user_ids_to_lookup,
+                    num_of_data_per_request,
+                    num_of_parallel_requests,
+                    __generate_params_of_fetch_profile(fetch_profile, "/users/lookup"),
+                )
+            )
+            if use_raw_json_parser is True:
+                for users_by_page in user_pages:
+                    users_by_page[:] = twitter_record_util.convert_users_to_records(users_by_page)
+        elif num_of_parallel_requests <= 1:
+            for user_ids_by_element in user_ids_list:
+                users: Any = api.lookup_users(
+                    screen_name=user_ids_by_element,
+                    parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+                    **__generate_params_of_fetch_profile(fetch_profile, "/users/lookup"),
+                )
+                user_pages.append(users)
+        else:
+            user_pages = __lookup_users_by_thread_pool(
+                api,
+                user_ids_list,
+                num_of_parallel_requests,
+                use_raw_json_parser,
+                __generate_params_of_fetch_profile(fetch_profile, "/users/lookup"),
+            )
+
+        # ユーザの保存と検索結果ページの再生成(ユーザストアのユーザと検索したユーザを指定した順序で格納する)
+        if user_store is not None:
+            for users_by_page in user_pages:
+                for user in user_store.put_users(users_by_page):
+                    stored_users[twitter_user_store_util.UserStore.generate_screen_name_key(user.screen_name)] = user
+            user_pages = []
+            for user_ids_by_element in pyl.split_list(user_ids, num_of_data_per_request):
+                users_of_page: ResultSet = ResultSet()
+                for user_id in user_ids_by_element:
+                    screen_name_key: str = twitter_user_store_util.UserStore.generate_screen_name_key(user_id)
+                    if screen_name_key in stored_users:
+                        users_of_page.append(stored_users[screen_name_key])
+                user_pages.append(users_of_page)
+
+        clg.log_inf(f"ユーザ検索に成功しました。")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"ユーザ検索に失敗しました。")
+        raise (e)
+
+    return user_pages
+
+
+def __lookup_users_by_thread_pool(
+    api: tweepy.API,
+    user_ids_list: list[list[str]],
+    num_of_parallel_requests: int,
+    use_raw_json_parser: bool,
+    params: dict[str, str],
+) -> list[ResultSet]:
+    """ユーザ検索(スレッドプール)"""
+
+    # API(スレッドごと)
+    thread_local: threading.local = threading.local()
+
+    def lookup_users_by_thread(user_ids_by_element: list[str]) -> Any:
+        if hasattr(thread_local, "api") is False:
+            thread_local.api = __generate_api_for_thread(api)
+        return thread_local.api.lookup_users(
+            screen_name=user_ids_by_element,
+            parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+            **params,
+        )
+
+    with ThreadPoolExecutor(max_workers=num_of_parallel_requests) as executor:
+        return list(executor.map(lookup_users_by_thread, user_ids_list))
+
+
+def __generate_api_for_thread(api: tweepy.API) -> tweepy.API:
+    """
+    API生成(スレッド用)
+
+    Notes:
+        - 共有セッション(`SharedSession`)の場合はセッションを閉じないため、APIをそのまま返却する
+        - それ以外の場合はAPIを複製し、スレッド専用のセッションを設定する
+            - リミッターのアダプタとレスポンスフックは引き継ぐ(リミッターは共有する)
+    """
+
+    if isinstance(api.session, twitter_api_transport_util.SharedSession):
+        return api
+
+    session: requests.Session = requests.Session()
+    for prefix, adapter in api.session.adapters.items():
+        if isinstance(adapter, twitter_rate_limiter_util.RateLimitedHTTPAdapter):
+            session.mount(prefix, twitter_rate_limiter_util.RateLimitedHTTPAdapter(adapter.rate_limiter))
+    session.hooks = {event: list(hooks) for event, hooks in api.session.hooks.items()}
+
+    api_for_thread: tweepy.API = copy.copy(api)
+    api_for_thread.session = session
+
+    return api_for_thread
+
+
+async def __lookup_users_by_async_client(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    user_ids: list[str],
+    num_of_data_per_request: int,
+    num_of_concurrent_requests: int,
+    params: dict[str, str],
+) -> list[ResultSet]:
+    """ユーザ検索(非同期クライアント)"""
+
+    # 非同期クライアント(aiohttp)は使用する場合のみ必要であるため、関数内でインポートする
+    from twitter_app.util.twitter_api_v1_1 import twitter_api_async_util
+
+    async with twitter_api_async_util.AsyncTwitterApi(api, num_of_concurrent_requests) as async_api:
+        user_pages: list[ResultSet] = await twitter_api_async_util.lookup_users_concurrently(
+            use_debug_mode,
+            async_api,
+            user_ids,
+            num_of_data_per_request,
+            params,
+        )
+
+    return user_pages
+
+
+def iter_lookup_user_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    user_ids: list[int],
+    num_of_data_per_request: int = EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
+    """
+    ユーザ検索(数値ID指定)(イテレータ)
+
+    Args:
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        user_ids (list[int])                           : 数値ID(複数)
+        num_of_data_per_request (int, optional)        : リクエストごとのデータ数
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        api_pool (Optional[TwitterApiPool])            : APIプール(指定した場合はリクエストを認証情報ごとに分散する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Yields:
+        ResultSet : ユーザ検索結果ページ (ResultSet[tweepy.models.User])
+
+    Notes:
+        - ページを1つずつ遅延して取得する
+        - ページ内のユーザは指定した数値IDの順序に並べ替える(APIは順序を保証しないため)
+        - 凍結や削除により存在しないユーザは含まれない
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
+        - エンドポイント
+            - GET users/lookup
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : 900
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : 300
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-users-lookup
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # 数値IDリスト(100人ごと)の生成
+        user_ids_list: list[list[int]] = pyl.split_list(user_ids, num_of_data_per_request)
+
+        # ユーザ(100人ごと)の検索
+        for user_ids_by_element in user_ids_list:
+            api_of_request: tweepy.API = api_pool.select_api("/users/lookup") if api_pool is not None else api
+            users: Any = api_of_request.lookup_users(
+                user_id=user_ids_by_element,
+                parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+                **__generate_params_of_fetch_profile(fetch_profile, "/users/lookup"),
+            )
+
+            # ユーザの並べ替え(指定した数値IDの順序)
+            user_order: dict[int, int] = {user_id: index for index, user_id in enumerate(user_ids_by_element)}
+            users.sort(key=lambda user: user_order.get(user.id, len(user_order)))
+
+            # 進捗の報告
+            if progress_reporter is not None:
+                progress_reporter.update(len(users))
+
+            yield users
+
+        clg.log_dbg(f"ユーザ検索に成功しました。(num_of_user_ids:{len(user_ids)})")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"ユーザ検索に失敗しました。(num_of_user_ids:{len(user_ids)})")
+        raise (e)
+
+    return None
+
+
+def get_user_info(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    user_id: str,
+    user_store: Optional[twitter_user_store_util.UserStore] = None,
+) -> Any:
+    """
+    ユーザ情報取得
+
+    Args:
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        api (tweepy.API)                            : API
+        user_id (str)                               : ユーザID
+        user_store (Optional[UserStore], optional)  : ユーザストア(指定した場合は有効期限内のユーザをAPIで取得しない)
+
+    Returns:
+        Any: ユーザ情報 (tweepy.models.User)(ユーザストアを指定した場合はUserRecord)
+
+    Notes:
+        - ユーザストアを指定した場合は取得したユーザ情報を保存する
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
+        - エンドポイント
+            - GET users/show
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - リクエスト数／１５分 : 900
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - リクエスト数／１５分 : 900
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-users-show
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # ユーザ情報の取得(ユーザストアに保存済みかつ有効期限内の場合はAPIを使用しない)
+        user_info: Any = None
+        if user_store is not None:
+            user_info = user_store.get_users_by_screen_names([user_id]).get(
+                twitter_user_store_util.UserStore.generate_screen_name_key(user_id)
+            )
+        if user_info is None:
+            user_info = api.get_user(screen_name=user_id)
+            if user_store is not None:
+                user_info = user_store.put_users([user_info])[0]
+
+        clg.log_dbg(f"ユーザ情報取得に成功しました。")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"ユーザ情報取得に失敗しました。")
+        raise (e)
+
+    return user_info
+
+
+####################################################################################################
+# Create and manage lists
+####################################################################################################
+
+
+def get_lists(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    user_id: str = "",
+) -> ResultSet:
+    """
+    リスト(複数)取得
+
+    Args:
+        use_debug_mode (bool)   : デバッグモード使用有無
+        api (tweepy.API)        : API
+        user_id (str)           : ユーザID
+
+    Returns:
+        ResultSet: リスト(複数) (ResultSet[tweepy.models.List])
+
+    Notes:
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
+        - エンドポイント
+            - GET lists/list
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-list
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # リスト(複数)の取得
+        lists: Any
+        if user_id == "":
+            lists = api.get_lists(reverse=True)
+        else:
+            lists = api.get_lists(screen_name=user_id, reverse=True)
+
+        clg.log_inf(f"リスト(複数)取得に成功しました。(user_id:{user_id})")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"リスト(複数)取得に失敗しました。(user_id:{user_id})")
+        raise (e)
+
+    return lists
+
+
+class EnumOfListMember:
+    class EnumOfOauth1User(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 900
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+
+    class EnumOfOauth2App(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 75
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+
+
+def iter_list_member_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    list_id: str,
+    num_of_data: int = EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
+    """
+    リストメンバーページ取得(イテレータ)
+
+    Args:
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        list_id (str)                                  : リストID
+        num_of_data (int, optional)                    : データ数
+        num_of_data_per_request (int, optional)        : リクエストごとのデータ数
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        api_pool (Optional[TwitterApiPool])            : APIプール(指定した場合はリクエストを認証情報ごとに分散する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Yields:
+        ResultSet : リストメンバーページ (ResultSet[tweepy.models.User])
+
+    Notes:
+        - ページを1つずつ遅延して取得する
+            - 呼び出し元はページの到着ごとに処理を開始できる
+            - 呼び出し元が反復を途中で終了した場合は以降のページを取得しない
+        - APIプールを指定した場合はユーザ認証のAPIにのみ分散する(非公開リストはアプリ認証で取得できないため)
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
+        - エンドポイント
+            - GET lists/members
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 5000
+                - リクエスト数／１５分 : 900
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - データ数／リクエスト : 5000
+                - リクエスト数／１５分 : 75
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-members
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler, tweepy.OAuth2AppHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+        clg.log_inf(f"時間がかかるため気長にお待ちください。")
+
+        # リクエスト数の算出
+        num_of_requests = math.ceil(num_of_data / num_of_data_per_request)
+
+        # リストメンバーページの取得
+        list_member_pagination: tweepy.Cursor = tweepy.Cursor(
+            (
+                api_pool.generate_dispatch_method("get_list_members", "/lists/members", auth_types=["oauth1"])
+                if api_pool is not None
+                else api.get_list_members
+            ),
+            list_id=list_id,
+            count=num_of_data_per_request,
+            parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+            **__generate_params_of_fetch_profile(fetch_profile, "/lists/members"),
+        )
+        for list_member_page in list_member_pagination.pages(num_of_requests):
+            # 進捗の報告
+            if progress_reporter is not None:
+                progress_reporter.update(len(list_member_page))
+
+            yield list_member_page
+
+        clg.log_inf(f"リストメンバーページ取得に成功しました。(list_id:{list_id})")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"リストメンバーページ取得に失敗しました。(list_id:{list_id})")
+        raise (e)
+
+    return None
+
+
+def get_list_member_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    list_id: str,
+    num_of_data: int = EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> list[ResultSet]:
+    """
+    リストメンバーページ取得
+
+    Args:
+        use_debug_mode (bool)                        : デバッグモード使用有無
+        api (tweepy.API)                             : API
+        list_id (str)                                : リストID
+        num_of_data (int, optional)                  : データ数
+        num_of_data_per_request (int, optional)      : リクエストごとのデータ数
+        fetch_profile (EnumOfFetchProfile, optional) : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Returns:
+        list[ResultSet] : リストメンバーページ (list[ResultSet[tweepy.models.User]])
+
+    Notes:
+        - 全ページを取得してから返却する(ページごとに処理する場合は`iter_list_member_pages`を使用する)
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+            - アプリ認証(OAuth 2.0)
+        - エンドポイント
+            - GET lists/members
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 5000
+                - リクエスト数／１５分 : 900
+                    - 超過した場合は15分の待機時間が発生する
+            - アプリ認証(OAuth 2.0)
+                - データ数／リクエスト : 5000
+                - リクエスト数／１５分 : 75
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-members
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    list_member_pages: list[ResultSet] = []
+
+    try:
+        # リストメンバーページの取得
+        list_member_pages = list(
+            iter_list_member_pages(
+                use_debug_mode,
+                api,
+                list_id,
+                num_of_data,
+                num_of_data_per_request,
+                fetch_profile=fetch_profile,
+            )
+        )
+    except Exception as e:
+        raise (e)
+
+    return list_member_pages
+
+
+def generate_list(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    list_name: str,
+) -> Any:
+    """
+    リスト生成
+
+    Args:
+        use_debug_mode (bool)   : デバッグモード使用有無
+        api (tweepy.API)        : API
+        list_name (str)         : リスト名
+
+    Returns:
+        Any: リスト (tweepy.models.List)
+
+    Notes:
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - POST lists/create
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - リクエスト数／１５分 : (未公表)
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-create
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # リストの生成
+        list_: Any = api.create_list(list_name, mode="private", description="")
+
+        clg.log_inf(f"リスト生成に成功しました。(list_name:{list_name})")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"リスト生成に失敗しました。(list_name:{list_name})")
+        raise (e)
+
+    return list_
+
+
+def destroy_list(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    list_name: str,
+) -> bool:
+    """
+    リスト破棄
+
+    Args:
+        use_debug_mode (bool)   : デバッグモード使用有無
+        api (tweepy.API)        : API
+        list_name (str)         : リスト名
+
+    Returns:
+        bool: 実行結果 (True：成功、False：失敗)
+
+    Notes:
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - POST lists/destroy
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - リクエスト数／１５分 : (未公表)
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-destroy
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+    result: bool = False
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # リスト(複数)の取得
+        lists: ResultSet = get_lists(use_debug_mode, api)
+
+        # リストの破棄
+        for list in lists:
+            if list.name == list_name:
+                api.destroy_list(list_id=list.id)
+                clg.log_inf(f"リスト破棄に成功しました。(list_name:{list_name})")
+                result = True
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"リスト破棄に失敗しました。(list_name:{list_name})")
+        raise (e)
+
+    return result
+
+
+class EnumOfUserForList:
+    class EnumOfOauth1User(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 50
+        MAX_NUM_OF_REQUESTS_PER_DAY = 2
+        MAX_NUM_OF_DATA_PER_DAY = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_DAY
+        MINUTE_INTERVAL = 30
+        MAX_NUM_OF_ATTEMPTS = 3
+
+
+def add_users_to_list(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    target_list: Any,
+    user_ids: list[str],
+    user_names: list[str] = [],
+    add_only_users_with_diff: bool = False,
+    num_of_data_per_request: int = EnumOfUserForList.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    num_of_data_per_day: int = EnumOfUserForList.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_DAY.value,
+    minute_interval: int = EnumOfUserForList.EnumOfOauth1User.MINUTE_INTERVAL.value,
+    job_store: Optional[util.ListAddJobStore] = None,
+    enqueue_only: bool = False,
+    user_store: Optional[twitter_user_store_util.UserStore] = None,
+) -> None:
+    """
+    ユーザ(複数)追加
+
+    Args:
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        api (tweepy.API)                            : API
+        target_list (Any)                           : 対象リスト
+            id (str)                                : リストID
+            member_count (int)                      : ユーザ数
+        user_ids (list[str])                        : ユーザID(複数)
+        user_names (list[str])                      : ユーザ名(複数)
+        add_only_users_with_diff (bool, optional)   : 差分ユーザ追加
+        num_of_data_per_request (int, optional)     : リクエストごとのデータ数
+        num_of_data_per_day (int, optional)         : 日ごとのデータ数
+        minute_interval (int, optional)             : 時間間隔
+        job_store (Optional[util.ListAddJobStore])  : リスト追加ジョブストア(指定しない場合は既定のファイル)
+        enqueue_only (bool, optional)               : ジョブ登録のみ(複数のリストのジョブを交互に実行する場合に指定する)
+        user_store (Optional[UserStore], optional)  : ユーザストア(指定しない場合は既定のファイル)
+
+    Returns:
+        -
+
+    Notes:
+        - 追加するユーザをリクエストごとのジョブとしてジョブストアに登録してから実行する
+            - 中断した場合は`run_list_add_jobs`で未完了のジョブから再開できる
+            - ジョブ登録のみの場合は呼び出し元が`run_list_add_jobs`で実行する
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - POST lists/members/create_all
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : (未公表)
+        - 指定したユーザを全て追加できるようにするため、以下のアカウントを除外する
+            - 削除されたアカウント
+            - 凍結されたアカウント
+            - 保護されたアカウント
+            - 自分をブロックしたアカウント
+            - 自分がブロックしたアカウント
+        - 削除・凍結・保護されたアカウントはユーザストアに保存し、有効期限内は検索せずに除外する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-members-create_all
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    # 引数の検証：ユーザ名の長さがユーザIDの長さと同じであること
+    if len(user_names) > 0 and len(user_ids) != len(user_names):
+        raise (
+            pyl.CustomError(f"ユーザ名(複数)の長さがユーザID(複数)の長さと異なります。(user_names:{len(user_names)}, user_ids:{len(user_ids)})")
+        )
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # ユーザ名の初期化
+        if len(user_names) == 0:
+            user_names = ["-"] * len(user_ids)
+
+        # ユーザの分割(未追加、追加済み)
+        users_of_unadded_and_added: tuple[
+            list[str], list[str], list[str], list[str]
+        ] = __split_users_into_unadded_and_added(
+            use_debug_mode,
+            api,
+            add_only_users_with_diff,
+            target_list.id,
+            user_ids,
+            user_names,
+        )
+        user_ids_of_unadded_account: list[str] = users_of_unadded_and_added[0]
+        user_names_of_unadded_account: list[str] = users_of_unadded_and_added[1]
+        user_ids_of_added_account: list[str] = users_of_unadded_and_added[2]
+        num_of_users_of_added_account: int = len(user_ids_of_added_account)
+
+        # ユーザの分割(問題なし、問題あり)(削除・凍結・保護の確認はユーザストアを経由する)
+        if user_store is None:
+            user_store = twitter_user_store_util.UserStore()
+        users_with_no_problems_and_problems: tuple[
+            list[str], list[str], list[str], list[str]
+        ] = __split_users_into_no_problems_and_problems(
+            use_debug_mode,
+            api,
+            user_ids_of_unadded_account,
+            user_names_of_unadded_account,
+            EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value,
+            user_store,
+        )
+        user_ids_without_problems: list[str] = users_with_no_problems_and_problems[0]
+        user_ids_with_problems: list[str] = users_with_no_problems_and_problems[2]
+        user_names_with_problems: list[str] = users_with_no_problems_and_problems[3]
+        num_of_users_without_problems: int = len(user_ids_without_problems)
+        num_of_users_with_problems: int = len(user_ids_with_problems)
+
+        # ログの出力
+        if add_only_users_with_diff is True:
+            clg.log_inf(f"追加済みユーザを除外しました。(num_of_users_of_added_account:{num_of_users_of_added_account})")
+        clg.log_inf(f"下記ユーザは問題があるため除外しました。" + f"(num_of_users_with_problems:{num_of_users_with_problems})")
+        clg.log_inf(f"ユーザID：{user_ids_with_problems}")
+        clg.log_inf(f"ユーザ名：{user_names_with_problems}")
+        clg.log_inf(
+            f"{num_of_data_per_request}人ごとにユーザを追加します。(num_of_users_without_problems:{num_of_users_without_problems})"
+        )
+        if enqueue_only is False:
+            util.show_estimated_proc_time(
+                use_debug_mode,
+                num_of_users_without_problems,
+                num_of_data_per_request,
+                minute_interval=minute_interval,
+            )
+
+        # ユーザIDリスト
+        user_ids_list: list[list[str]] = pyl.split_list(user_ids_without_problems, num_of_data_per_request)
+
+        # リスト追加ジョブの登録
+        if job_store is None:
+            job_store = util.ListAddJobStore()
+        job_store.enqueue_jobs(target_list.id, target_list.name, user_ids_list)
+
+        # リスト追加ジョブの実行
+        if enqueue_only is False:
+            run_list_add_jobs(
+                use_debug_mode,
+                api,
+                job_store,
+                [target_list.name],
+                num_of_data_per_day,
+                minute_interval,
+            )
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"ユーザ(複数)追加に失敗しました。")
+        raise (e)
+
+    return None
+
+
+def run_list_add_jobs(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    job_store: util.ListAddJobStore,
+    list_names: Optional[list[str]] = None,
+    num_of_data_per_day: int = EnumOfUserForList.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_DAY.value,
+    minute_interval: int = EnumOfUserForList.EnumOfOauth1User.MINUTE_INTERVAL.value,
+    max_num_of_attempts: int = EnumOfUserForList.EnumOfOauth1User.MAX_NUM_OF_ATTEMPTS.value,
+) -> None:
+    """
+    リスト追加ジョブ実行
+
+    Args:
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        api (tweepy.API)                            : API
+        job_store (util.ListAddJobStore)            : リスト追加ジョブストア
+        list_names (Optional[list[str]], optional)  : リスト名(複数)(指定しない場合は全てのリスト)
+        num_of_data_per_day (int, optional)         : 日ごとのデータ数
+        minute_interval (int, optional)             : 時間間隔
+        max_num_of_attempts (int, optional)         : 最大試行回数
+
+    Returns:
+        -
+
+    Notes:
+        - 未完了のジョブを登録順に実行し、全て完了するまで待機と実行を繰り返す
+        - 実行可能時刻はジョブストアの実行履歴から算出するため、プロセスを再起動しても間隔と上限を守って再開できる
+            - 前回の実行から時間間隔が経過するまで待機する
+            - 直近1日の追加数が日ごとのデータ数を超える場合は、超えなくなる時刻まで待機する
+            - 追加できたユーザ数が不足する場合はリストのメンバーを取得し、未追加のユーザがいれば上限に到達したとみなす
+                - 未追加のユーザのみを1日後に再実行する(追加済みのユーザは再送しない)
+                - 未追加のユーザがいない場合(指定したユーザが既にメンバーだった場合等)は完了とする
+        - 複数のリストのジョブはリストごとに交互に実行する
+            - 時間間隔と日ごとのデータ数は全てのリストで共有する
+            - 処理時間は各リストの待機時間の合計ではなく、全てのジョブ数と時間間隔の積となる
+            - 延期されたジョブは実行可能時刻まで選択せず、同じリストの後続のジョブを先に実行する
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - GET lists/show
+            - GET lists/members
+            - POST lists/members/create_all
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # 想定処理時間の表示(全てのリストのジョブ数と時間間隔から算出する)
+        pending_jobs: list[util.ListAddJob] = job_store.get_pending_jobs(list_names)
+        clg.log_inf(f"{len(pending_jobs)}件のリスト追加ジョブを実行します。")
+        util.show_estimated_proc_time(use_debug_mode, len(pending_jobs), 1, minute_interval=minute_interval)
+
+        # リスト名(複数)(ジョブを交互に実行する順序)
+        list_names_in_rotation: list[str] = list(dict.fromkeys([job.list_name for job in pending_jobs]))
+        last_list_name: Optional[str] = None
+
+        while True:
+            # 未完了ジョブの取得
+            pending_jobs = job_store.get_pending_jobs(list_names)
+            if len(pending_jobs) == 0:
+                break
+
+            # 実行するジョブの選択(前回実行したリストの次のリストのジョブ)
+            job: util.ListAddJob = __select_list_add_job_in_rotation(
+                pending_jobs, list_names_in_rotation, last_list_name
+            )
+            last_list_name = job.list_name
+            num_of_users_by_job: int = len(job.user_ids)
+
+            # 実行可能時刻の算出
+            run_at: float = __calc_time_to_run_list_add_job(job_store, job, num_of_data_per_day, minute_interval)
+
+            # 待機
+            if run_at > time.time():
+                run_at_str: str = datetime.fromtimestamp(run_at).strftime("%Y-%m-%d %H:%M:%S")
+                clg.log_inf(
+                    f"{run_at_str}に残りのユーザを追加します。"
+                    + f"(num_of_pending_jobs:{len(pending_jobs)}, job_store:{job_store.job_store_file_path})"
+                )
+                time.sleep(max(run_at - time.time(), 0))
+
+            # ユーザの追加
+            member_count_at_last_time: int = api.get_list(list_id=job.list_id).member_count
+            list_: Any = api.add_list_members(list_id=job.list_id, screen_name=job.user_ids)
+            num_of_users_at_this_time: int = list_.member_count - member_count_at_last_time
+
+            # ログの出力
+            clg.log_inf(
+                f"ユーザを追加しました。"
+                + f"(list_name:{job.list_name}, batch_index:{job.batch_index}, "
+                + f"num_of_users_at_this_time:{num_of_users_at_this_time}/{num_of_users_by_job})"
+            )
+
+            # 追加結果の確認(不足する場合は未追加のユーザを確認する)
+            if num_of_users_at_this_time >= num_of_users_by_job:
+                job_store.complete_job(job.job_id, num_of_users_at_this_time)
+                continue
+            user_ids_of_unadded_account: list[str] = __extract_users_not_in_list(
+                use_debug_mode, api, job.list_id, job.user_ids
+            )
+            if len(user_ids_of_unadded_account) == 0:
+                clg.log_inf(f"未追加のユーザがいないため、ジョブを完了します。(batch_index:{job.batch_index})")
+                job_store.complete_job(job.job_id, max(num_of_users_at_this_time, 0))
+            else:
+                # 未追加のユーザのみを延期する(上限に到達したとみなす)
+                datetime_day_dt: datetime = datetime.now() + timedelta(days=1)
+                is_deferred: bool = job_store.defer_job(
+                    job.job_id,
+                    max(num_of_users_at_this_time, 0),
+                    datetime_day_dt.timestamp(),
+                    max_num_of_attempts,
+                    user_ids_of_unadded_account,
+                )
+                if is_deferred is True:
+                    clg.log_wrn(f"1日に追加可能なユーザ数が上限に到達した可能性があるため、1日後に再度追加します。")
+                else:
+                    clg.log_wrn(f"最大試行回数に到達したため、追加を断念します。(user_ids:{user_ids_of_unadded_account})")
+
+        clg.log_inf(f"リスト追加ジョブ実行に成功しました。")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"リスト追加ジョブ実行に失敗しました。未完了のジョブは再実行時に再開します。")
+        raise (e)
+
+    return None
+
+
+def __extract_users_not_in_list(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    list_id: str,
+    user_ids: list[str],
+) -> list[str]:
+    """ユーザ抽出(リストのメンバーではないユーザ)(ユーザIDの大文字小文字を区別しない)"""
+
+    try:
+        # ユーザID(リストメンバー)の生成
+        user_ids_of_list_member: set[str] = set()
+        for list_members_by_page in iter_list_member_pages(
+            use_debug_mode,
+            api,
+            list_id,
+            use_raw_json_parser=True,
+            fetch_profile=EnumOfFetchProfile.LEAN,
+        ):
+            for list_member in list_members_by_page:
+                user_ids_of_list_member.add(list_member.screen_name.casefold())
+    except Exception as e:
+        raise (e)
+
+    return [user_id for user_id in user_ids if user_id.casefold() not in user_ids_of_list_member]
+
+
+def __select_list_add_job_in_rotation(
+    pending_jobs: list[util.ListAddJob],
+    list_names_in_rotation: list[str],
+    last_list_name: Optional[str],
+) -> util.ListAddJob:
+    """
+    リスト追加ジョブ選択(リストごとの交互実行)
+
+    Notes:
+        - リストごとに実行可能時刻を過ぎた先頭のジョブ(登録順)を選択する
+            - 延期されたジョブが後続のジョブを妨げないようにする
+        - 実行可能なジョブがない場合は実行可能時刻が最も早いジョブを選択する
+    """
+
+    try:
+        # リストごとの実行可能な先頭の未完了ジョブ(登録順)
+        now: float = time.time()
+        first_jobs_by_list: dict[str, util.ListAddJob] = {}
+        for pending_job in pending_jobs:
+            if pending_job.not_before <= now:
+                first_jobs_by_list.setdefault(pending_job.list_name, pending_job)
+        if len(first_jobs_by_list) == 0:
+            return min(pending_jobs, key=lambda pending_job: pending_job.not_before)
+
+        # 前回実行したリストの次のリストから順に、未完了ジョブのあるリストを選択する
+        start_index: int = 0
+        if last_list_name is not None and last_list_name in list_names_in_rotation:
+            start_index = list_names_in_rotation.index(last_list_name) + 1
+        for offset in range(len(list_names_in_rotation)):
+            list_name: str = list_names_in_rotation[(start_index + offset) % len(list_names_in_rotation)]
+            if list_name in first_jobs_by_list:
+                return first_jobs_by_list[list_name]
+    except Exception as e:
+        raise (e)
+
+    return pending_jobs[0]
+
+
+def __calc_time_to_run_list_add_job(
+    job_store: util.ListAddJobStore,
+    job: util.ListAddJob,
+    num_of_data_per_day: int,
+    minute_interval: int,
+) -> float:
+    """リスト追加ジョブ実行可能時刻算出"""
+
+    seconds_per_day: int = 60 * 60 * 24
+
+    try:
+        # 実行可能時刻(延期された場合の時刻)
+        run_at: float = job.not_before
+
+        # 前回の実行から時間間隔が経過した時刻
+        last_executed_at: Optional[float] = job_store.get_last_executed_at()
+        if last_executed_at is not None:
+            run_at = max(run_at, last_executed_at + 60 * minute_interval)
+
+        # 直近1日の追加数が日ごとのデータ数を超えなくなる時刻
+        executions: list[tuple[float, int]] = job_store.get_executions_since(time.time() - seconds_per_day)
+        num_of_users_in_last_day: int = sum([num_of_added for _, num_of_added in executions])
+        for executed_at, num_of_added in executions:
+            if num_of_users_in_last_day + len(job.user_ids) <= num_of_data_per_day:
+                break
+            num_of_users_in_last_day -= num_of_added
+            run_at = max(run_at, executed_at + seconds_per_day)
+    except Exception as e:
+        raise (e)
+
+    return run_at
+
+
+class EnumOfUserForListRemoval:
+    class EnumOfOauth1User(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 100
+
+
+def remove_users_from_list(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    target_list: Any,
+    user_ids: list[str],
+    num_of_data_per_request: int = EnumOfUserForListRemoval.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+) -> Any:
+    """
+    ユーザ(複数)削除
+
+    Args:
+        use_debug_mode (bool)                   : デバッグモード使用有無
+        api (tweepy.API)                        : API
+        target_list (Any)                       : 対象リスト
+            id (str)                            : リストID
+        user_ids (list[str])                    : ユーザID(複数)
+        num_of_data_per_request (int, optional) : リクエストごとのデータ数
+
+    Returns:
+        Any: 削除後のリスト (tweepy.models.List) (削除対象がない場合は対象リスト)
+
+    Notes:
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - POST lists/members/destroy_all
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 100
+                - リクエスト数／１５分 : (未公表)
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-members-destroy_all
         - レスポンス
             - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
-    result: bool = False
+    list_: Any = target_list
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
@@ -643,44 +2200,35 @@ def destroy_list(
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
-        # リスト(複数)の取得
-        lists: ResultSet = get_lists(use_debug_mode, api)
+        # ユーザIDリスト(100人ごと)の生成
+        user_ids_list: list[list[str]] = pyl.split_list(user_ids, num_of_data_per_request)
 
-        # リストの破棄
-        for list in lists:
-            if list.name == list_name:
-                api.destroy_list(list_id=list.id)
-                clg.log_inf(f"リスト破棄に成功しました。(list_name:{list_name})")
-                result = True
+        # ユーザ(100人ごと)の削除
+        for user_ids_by_element in user_ids_list:
+            list_ = api.remove_list_members(list_id=target_list.id, screen_name=user_ids_by_element)
+            clg.log_inf(f"ユーザを削除しました。(num_of_users:{len(user_ids_by_element)})")
+
+        clg.log_inf(f"ユーザ(複数)削除に成功しました。(num_of_users:{len(user_ids)})")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"リスト破棄に失敗しました。(list_name:{list_name})")
+            clg.log_err(f"ユーザ(複数)削除に失敗しました。")
         raise (e)
 
-    return result
-
-
-class EnumOfUserForList:
-    class EnumOfOauth1User(IntEnum):
-        MAX_NUM_OF_DATA_PER_REQUEST = 50
-        MAX_NUM_OF_REQUESTS_PER_DAY = 2
-        MAX_NUM_OF_DATA_PER_DAY = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_DAY
-        MINUTE_INTERVAL = 30
+    return list_
 
 
-def add_users_to_list(
+def reconcile_users_in_list(
     use_debug_mode: bool,
     api: tweepy.API,
     target_list: Any,
     user_ids: list[str],
     user_names: list[str] = [],
-    add_only_users_with_diff: bool = False,
-    num_of_data_per_request: int = EnumOfUserForList.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
-    num_of_data_per_day: int = EnumOfUserForList.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_DAY.value,
-    minute_interval: int = EnumOfUserForList.EnumOfOauth1User.MINUTE_INTERVAL.value,
+    job_store: Optional[util.ListAddJobStore] = None,
+    enqueue_only: bool = False,
+    user_store: Optional[twitter_user_store_util.UserStore] = None,
 ) -> None:
     """
-    ユーザ(複数)追加
+    ユーザ(複数)同期
 
     Args:
         use_debug_mode (bool)                       : デバッグモード使用有無
@@ -690,44 +2238,28 @@ def add_users_to_list(
             member_count (int)                      : ユーザ数
         user_ids (list[str])                        : ユーザID(複数)
         user_names (list[str])                      : ユーザ名(複数)
-        add_only_users_with_diff (bool, optional)   : 差分ユーザ追加
-        num_of_data_per_request (int, optional)     : リクエストごとのデータ数
-        num_of_data_per_day (int, optional)         : 日ごとのデータ数
-        minute_interval (int, optional)             : 時間間隔
+        job_store (Optional[util.ListAddJobStore])  : リスト追加ジョブストア(指定しない場合は既定のファイル)
+        enqueue_only (bool, optional)               : ジョブ登録のみ(ユーザの追加のみ、削除は即時に行う)
+        user_store (Optional[UserStore], optional)  : ユーザストア(指定しない場合は既定のファイル)
 
     Returns:
         -
 
     Notes:
+        - 対象リストのメンバーを指定したユーザに一致させる
+            - 指定したユーザにのみ存在するユーザを追加する
+            - 対象リストにのみ存在するユーザを削除する
+        - リストの破棄と再生成を行わないため、リクエスト数は差分の大きさに比例する
         - 認証
             - ユーザ認証(OAuth 1.0a)
         - エンドポイント
+            - GET lists/members
+            - POST lists/members/destroy_all
             - POST lists/members/create_all
-        - レート制限
-            - ユーザ認証(OAuth 1.0a)
-                - データ数／リクエスト : 100
-                - リクエスト数／１５分 : (未公表)
-        - 指定したユーザを全て追加できるようにするため、以下のアカウントを除外する
-            - 削除されたアカウント
-            - 凍結されたアカウント
-            - 保護されたアカウント
-            - 自分をブロックしたアカウント
-            - 自分がブロックしたアカウント
-
-    References:
-        - エンドポイント
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/overview
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-members-create_all
-        - レスポンス
-            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/get-lists-show#example-response
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
 
-    # 認証方式の確認
-    if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
-        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
-
     # 引数の検証：ユーザ名の長さがユーザIDの長さと同じであること
     if len(user_names) > 0 and len(user_ids) != len(user_names):
         raise (
@@ -742,99 +2274,52 @@ def add_users_to_list(
         if len(user_names) == 0:
             user_names = ["-"] * len(user_ids)
 
-        # ユーザの分割(未追加、追加済み)
-        users_of_unadded_and_added: tuple[
-            list[str], list[str], list[str], list[str]
-        ] = __split_users_into_unadded_and_added(
-            use_debug_mode,
-            api,
-            add_only_users_with_diff,
-            target_list.id,
-            user_ids,
-            user_names,
-        )
-        user_ids_of_unadded_account: list[str] = users_of_unadded_and_added[0]
-        user_names_of_unadded_account: list[str] = users_of_unadded_and_added[1]
-        user_ids_of_added_account: list[str] = users_of_unadded_and_added[2]
-        num_of_users_of_added_account: int = len(user_ids_of_added_account)
-
-        # ユーザの分割(問題なし、問題あり)
-        users_with_no_problems_and_problems: tuple[
-            list[str], list[str], list[str], list[str]
-        ] = __split_users_into_no_problems_and_problems(
-            use_debug_mode,
-            api,
-            user_ids_of_unadded_account,
-            user_names_of_unadded_account,
-            EnumOfUserForLookup.MAX_NUM_OF_DATA_PER_REQUEST.value,
-        )
-        user_ids_without_problems: list[str] = users_with_no_problems_and_problems[0]
-        user_ids_with_problems: list[str] = users_with_no_problems_and_problems[2]
-        user_names_with_problems: list[str] = users_with_no_problems_and_problems[3]
-        num_of_users_without_problems: int = len(user_ids_without_problems)
-        num_of_users_with_problems: int = len(user_ids_with_problems)
+        # ユーザID(リストメンバー)の生成
+        user_ids_of_list_member: list[str] = []
+        for list_members_by_page in iter_list_member_pages(use_debug_mode, api, target_list.id):
+            for list_member in list_members_by_page:
+                user_ids_of_list_member.append(list_member.screen_name)
 
-        # ログの出力
-        if add_only_users_with_diff is True:
-            clg.log_inf(f"追加済みユーザを除外しました。(num_of_users_of_added_account:{num_of_users_of_added_account})")
-        clg.log_inf(f"下記ユーザは問題があるため除外しました。" + f"(num_of_users_with_problems:{num_of_users_with_problems})")
-        clg.log_inf(f"ユーザID：{user_ids_with_problems}")
-        clg.log_inf(f"ユーザ名：{user_names_with_problems}")
+        # メンバーシップ差分の算出
+        membership_diff: util.MembershipDiff = util.diff_memberships(user_ids, user_ids_of_list_member)
         clg.log_inf(
-            f"{num_of_data_per_request}人ごとにユーザを追加します。(num_of_users_without_problems:{num_of_users_without_problems})"
-        )
-        util.show_estimated_proc_time(
-            use_debug_mode,
-            num_of_users_without_problems,
-            num_of_data_per_request,
-            minute_interval=minute_interval,
+            f"リストとの差分を算出しました。"
+            + f"(num_of_added_users:{len(membership_diff.added)}, "
+            + f"num_of_missing_users:{len(membership_diff.missing)}, "
+            + f"num_of_extra_users:{len(membership_diff.extra)})"
         )
 
-        # ユーザIDリスト
-        user_ids_list: list[list[str]] = pyl.split_list(user_ids_without_problems, num_of_data_per_request)
-
-        # ユーザIDリストの要素ごと
-        user_ids_by_element: list[str]
-        sum_of_users_at_this_time: int = target_list.member_count
-        sum_of_users_at_last_time: int = 0
-        num_of_users_at_this_time: int = 0
-        for index, user_ids_by_element in enumerate(user_ids_list, start=1):
-            # ユーザの追加
-            sum_of_users_at_last_time = sum_of_users_at_this_time
-            list_: Any = api.add_list_members(list_id=target_list.id, screen_name=user_ids_by_element)
-            sum_of_users_at_this_time = list_.member_count
-            num_of_users_at_this_time = sum_of_users_at_this_time - sum_of_users_at_last_time
-
-            # ログの出力
-            num_of_users_by_element: int = len(user_ids_by_element)
-            clg.log_inf(
-                f"ユーザを追加しました。"
-                + f"(num_of_users_at_this_time:"
-                + f"{num_of_users_at_this_time}/{num_of_users_by_element}, "
-                + f"sum_of_users_at_this_time:"
-                + f"{sum_of_users_at_this_time - target_list.member_count}/{num_of_users_without_problems})"
+        # ユーザ(余分)の削除(リストのユーザ数の上限を超えないように追加より先に行う)
+        list_: Any = target_list
+        if len(membership_diff.extra) > 0:
+            user_ids_of_extra_account: list[str] = [
+                user_id for user_id in user_ids_of_list_member if user_id in membership_diff.extra
+            ]
+            list_ = remove_users_from_list(use_debug_mode, api, target_list, user_ids_of_extra_account)
+
+        # ユーザ(未追加)の追加
+        if len(membership_diff.missing) > 0:
+            user_ids_of_missing_account: list[str] = []
+            user_names_of_missing_account: list[str] = []
+            for index, user_id in enumerate(user_ids):
+                if user_id in membership_diff.missing:
+                    user_ids_of_missing_account.append(user_id)
+                    user_names_of_missing_account.append(user_names[index])
+            add_users_to_list(
+                use_debug_mode,
+                api,
+                list_,
+                user_ids_of_missing_account,
+                user_names_of_missing_account,
+                job_store=job_store,
+                enqueue_only=enqueue_only,
+                user_store=user_store,
             )
 
-            # 追加結果、ユーザ数の確認
-            if num_of_users_at_this_time != num_of_users_by_element or (
-                index != len(user_ids_list)
-                and (sum_of_users_at_this_time - target_list.member_count) >= num_of_data_per_day
-            ):
-                datetime_day_dt: datetime = datetime.now() + timedelta(days=1)
-                datetime_day_str: str = datetime_day_dt.strftime("%Y-%m-%d %H:%M:%S")
-                clg.log_wrn(f"1日に追加可能なユーザ数が上限に到達したため、処理を中断します。")
-                clg.log_wrn(f"1日後({datetime_day_str})にオプション「差分ユーザ追加」を指定して再度実行してください。")
-                break
-
-            # 待機
-            if index != len(user_ids_list):
-                datetime_min_dt: datetime = datetime.now() + timedelta(minutes=minute_interval)
-                datetime_min_str: str = datetime_min_dt.strftime("%Y-%m-%d %H:%M:%S")
-                clg.log_inf(f"{minute_interval}分後({datetime_min_str})に残りのユーザを追加します。")
-                time.sleep(60 * minute_interval)
+        clg.log_inf(f"ユーザ(複数)同期に成功しました。")
     except Exception as e:
         if clg is not None:
-            clg.log_err(f"ユーザ(複数)追加に失敗しました。")
+            clg.log_err(f"ユーザ(複数)同期に失敗しました。")
         raise (e)
 
     return None
@@ -858,8 +2343,6 @@ def __split_users_into_unadded_and_added(
     user_names_of_unadded_account: list[str] = []
     # ユーザID(追加済み)
     user_ids_of_added_account: list[str] = []
-    # ユーザID(追加済みTEMP)
-    user_ids_of_added_account_temp: list[str] = []
     # ユーザ名(追加済み)
     user_names_of_added_account: list[str] = []
 
@@ -868,15 +2351,18 @@ def __split_users_into_unadded_and_added(
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
         if add_only_users_with_diff is True:
-            # ユーザID(追加済みアカウント)の生成
-            list_member_pages: list[ResultSet] = get_list_member_pages(use_debug_mode, api, list_id)
-            for list_members_by_page in list_member_pages:
+            # ユーザID(リストメンバー)の生成
+            user_ids_of_list_member: list[str] = []
+            for list_members_by_page in iter_list_member_pages(use_debug_mode, api, list_id):
                 for list_member in list_members_by_page:
-                    user_ids_of_added_account_temp.append(list_member.screen_name)
+                    user_ids_of_list_member.append(list_member.screen_name)
+
+            # メンバーシップ差分の算出
+            membership_diff: util.MembershipDiff = util.diff_memberships(user_ids, user_ids_of_list_member)
 
             # ユーザID・名(未追加・追加済みアカウント)の生成
             for index, user_id in enumerate(user_ids):
-                if not (user_id in user_ids_of_added_account_temp):
+                if user_id in membership_diff.missing:
                     user_ids_of_unadded_account.append(user_id)
                     user_names_of_unadded_account.append(user_names[index])
                 else:
@@ -904,8 +2390,17 @@ def __split_users_into_no_problems_and_problems(
     user_ids: list[str],
     user_names: list[str],
     num_of_data_per_request: int,
+    user_store: Optional[twitter_user_store_util.UserStore] = None,
 ) -> tuple[list[str], list[str], list[str], list[str]]:
-    """ユーザ分割(問題なし、問題あり)"""
+    """
+    ユーザ分割(問題なし、問題あり)
+
+    Notes:
+        - ユーザストアを指定した場合は有効期限内の問題ありユーザ(削除・凍結・保護)を検索せずに除外する
+            - 検索で見つからなかったユーザと保護されたユーザを問題ありユーザとして保存する
+        - 自分をブロックしたアカウントは交友関係取得(1人ごと)で確認する
+            - 交友関係検索(100人ごと)の接続状態には自分をブロックしたかどうかが含まれないため使用しない
+    """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
 
@@ -922,20 +2417,65 @@ def __split_users_into_no_problems_and_problems(
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
-        # ユーザID(未削除・未凍結・未保護アカウント)の生成
-        user_ids_of_unprotected_account: list[str] = []
-        user_pages: list[ResultSet] = lookup_users(use_debug_mode, api, user_ids, num_of_data_per_request)
+        # ユーザID(問題ありユーザとして保存済みのアカウントを除く)の生成
+        user_ids_to_lookup: list[str] = user_ids
+        if user_store is not None:
+            problem_users: dict[str, str] = user_store.get_problem_users(user_ids)
+            user_ids_to_lookup = [
+                user_id
+                for user_id in user_ids
+                if twitter_user_store_util.UserStore.generate_screen_name_key(user_id) not in problem_users
+            ]
+            clg.log_inf(
+                f"問題ありユーザとして保存済みのアカウントを除外しました。(num_of_excluded_users:{len(user_ids) - len(user_ids_to_lookup)})"
+            )
+
+        # ユーザ(未削除・未凍結・未保護アカウント)の生成
+        users_of_unprotected_account: list[Any] = []
+        user_pages: list[ResultSet] = lookup_users(
+            use_debug_mode,
+            api,
+            user_ids_to_lookup,
+            num_of_data_per_request,
+            num_of_parallel_requests=EnumOfUserForLookup.MAX_NUM_OF_PARALLEL_REQUESTS.value,
+            use_raw_json_parser=True,
+            fetch_profile=EnumOfFetchProfile.LEAN,
+            user_store=user_store,
+        )
+        user_ids_of_protected_account: list[str] = []
+        screen_name_keys_of_found_account: set[str] = set()
         for users_by_page in user_pages:
             for user in users_by_page:
+                screen_name_keys_of_found_account.add(
+                    twitter_user_store_util.UserStore.generate_screen_name_key(user.screen_name)
+                )
                 if user.protected is False:
-                    user_ids_of_unprotected_account.append(user.screen_name)
+                    users_of_unprotected_account.append(user)
+                else:
+                    user_ids_of_protected_account.append(user.screen_name)
+        user_ids_of_unprotected_account: list[str] = [user.screen_name for user in users_of_unprotected_account]
+
+        # 問題ありユーザ(削除・凍結・保護アカウント)の保存
+        if user_store is not None:
+            user_ids_of_missing_account: list[str] = [
+                user_id
+                for user_id in user_ids_to_lookup
+                if not (
+                    twitter_user_store_util.UserStore.generate_screen_name_key(user_id)
+                    in screen_name_keys_of_found_account
+                )
+            ]
+            user_store.put_problem_users(user_ids_of_missing_account, twitter_user_store_util.UserStore.REASON_MISSING)
+            user_store.put_problem_users(
+                user_ids_of_protected_account, twitter_user_store_util.UserStore.REASON_PROTECTED
+            )
 
         clg.log_inf(f"削除されたアカウント、凍結されたアカウント、保護されたアカウントの除外に成功しました。")
         clg.log_inf(f"時間がかかるため気長にお待ちください。")
 
         # ユーザID(未ブロックアカウント)の生成
         user_ids_of_accounts_that_has_not_blocked_me: list[str] = []
-        auth_user_info: Any = get_auth_user_info(use_debug_mode, api)
+        auth_user_info: Any = get_auth_user_info(use_debug_mode, api, user_store)
         for user_id in user_ids_of_unprotected_account:
             friendship: Any = get_friendship(use_debug_mode, api, user_id, auth_user_info.screen_name)
             if friendship[0].blocking is None or friendship[0].blocking is False:
@@ -943,24 +2483,24 @@ def __split_users_into_no_problems_and_problems(
 
         clg.log_inf(f"自分をブロックしたアカウントの除外に成功しました。")
 
-        # ユーザID(ブロック済みアカウント)の生成
-        user_ids_of_accounts_that_i_have_blocked: list[str] = []
-        blocked_user_pages: list[ResultSet] = get_blocked_users_pages(use_debug_mode, api)
-        for blocked_users_by_page in blocked_user_pages:
-            for blocked_user in blocked_users_by_page:
-                user_ids_of_accounts_that_i_have_blocked.append(blocked_user.screen_name)
+        # 数値ID(ブロック済みアカウント)の生成(5000人ごとに数値IDのみを取得して集合で保持する)
+        numeric_ids_of_accounts_that_i_have_blocked: set[int] = get_blocked_user_ids(use_debug_mode, api)
 
         # ユーザID(未ブロックアカウント)の生成
-        user_ids_of_accounts_that_i_have_not_blocked: list[str] = []
-        for user_id in user_ids_of_accounts_that_has_not_blocked_me:
-            if not (user_id in user_ids_of_accounts_that_i_have_blocked):
-                user_ids_of_accounts_that_i_have_not_blocked.append(user_id)
+        user_ids_of_accounts_that_i_have_not_blocked: set[str] = set()
+        user_ids_of_accounts_that_has_not_blocked_me_set: set[str] = set(user_ids_of_accounts_that_has_not_blocked_me)
+        for user in users_of_unprotected_account:
+            if (
+                user.screen_name in user_ids_of_accounts_that_has_not_blocked_me_set
+                and user.id not in numeric_ids_of_accounts_that_i_have_blocked
+            ):
+                user_ids_of_accounts_that_i_have_not_blocked.add(user.screen_name)
 
         clg.log_inf(f"自分がブロックしたアカウントの除外に成功しました。")
 
         # ユーザID・名(問題なし・あり)の生成
         for index, user_id in enumerate(user_ids):
-            if not (user_id in user_ids_of_accounts_that_i_have_not_blocked):
+            if user_id not in user_ids_of_accounts_that_i_have_not_blocked:
                 user_ids_with_problems.append(user_id)
                 user_names_with_problems.append(user_names[index])
             else:
@@ -987,18 +2527,22 @@ def __split_users_into_no_problems_and_problems(
 def get_auth_user_info(
     use_debug_mode: bool,
     api: tweepy.API,
+    user_store: Optional[twitter_user_store_util.UserStore] = None,
 ) -> Any:
     """
     認証ユーザ情報取得
 
     Args:
-        use_debug_mode (bool)   : デバッグモード使用有無
-        api (tweepy.API)        : API
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        api (tweepy.API)                            : API
+        user_store (Optional[UserStore], optional)  : ユーザストア(指定した場合は有効期限内のユーザをAPIで取得しない)
 
     Returns:
-        Any: 認証ユーザ情報 (tweepy.models.User)
+        Any: 認証ユーザ情報 (tweepy.models.User)(ユーザストアを指定した場合はUserRecord)
 
     Notes:
+        - ユーザストアを指定した場合はアクセストークン(ハッシュ値)に紐づけて認証ユーザ情報を保存する
+            - ユーザストアから取得した場合は認証情報の検証を行わない(認証情報が無効な場合は以降のAPIでエラーになる)
         - 認証
             - ユーザ認証(OAuth 1.0a)
         - エンドポイント
@@ -1025,8 +2569,14 @@ def get_auth_user_info(
         # ロガーの取得
         clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
 
-        # 認証ユーザ情報の取得
-        auth_user_info: Any = api.verify_credentials()
+        # 認証ユーザ情報の取得(ユーザストアに保存済みかつ有効期限内の場合はAPIを使用しない)
+        auth_user_info: Any = None
+        if user_store is not None:
+            auth_user_info = user_store.get_auth_user(api.auth.access_token)
+        if auth_user_info is None:
+            auth_user_info = api.verify_credentials()
+            if user_store is not None:
+                auth_user_info = user_store.put_auth_user(api.auth.access_token, auth_user_info)
 
         clg.log_inf(f"認証ユーザ情報取得に成功しました。(user_id:{auth_user_info.screen_name: <15}, user_name:{auth_user_info.name})")
     except Exception as e:
@@ -1049,25 +2599,34 @@ class EnumOfBlockedUser:
         MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
 
 
-def get_blocked_users_pages(
+def iter_blocked_users_pages(
     use_debug_mode: bool,
     api: tweepy.API,
     num_of_data: int = EnumOfBlockedUser.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
     num_of_data_per_request: int = EnumOfBlockedUser.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
-) -> list[ResultSet]:
+    progress_reporter: Optional[twitter_progress_util.ProgressReporter] = None,
+    use_raw_json_parser: bool = False,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> Iterator[ResultSet]:
     """
-    ブロックユーザページの取得
+    ブロックユーザページの取得(イテレータ)
 
     Args:
-        use_debug_mode (bool)                   : デバッグモード使用有無
-        api (tweepy.API)                        : API
-        num_of_data (int, optional)             : データ数
-        num_of_data_per_request (int, optional) : リクエストごとのデータ数
+        use_debug_mode (bool)                          : デバッグモード使用有無
+        api (tweepy.API)                               : API
+        num_of_data (int, optional)                    : データ数
+        num_of_data_per_request (int, optional)        : リクエストごとのデータ数
+        progress_reporter (Optional[ProgressReporter]) : 進捗報告(ページの到着ごとに更新する)
+        use_raw_json_parser (bool, optional)           : 生JSONパーサー使用有無(使用する場合はページをUserRecordのリストで返却する)
+        fetch_profile (EnumOfFetchProfile, optional)   : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
 
-    Returns:
-        list[ResultSet] : ブロックユーザページ (list[ResultSet[tweepy.models.User]])
+    Yields:
+        ResultSet : ブロックユーザページ (ResultSet[tweepy.models.User])
 
     Notes:
+        - ページを1つずつ遅延して取得する
+            - 呼び出し元はページの到着ごとに処理を開始できる
+            - 呼び出し元が反復を途中で終了した場合は以降のページを取得しない
         - 認証
             - ユーザ認証(OAuth 1.0a)
         - エンドポイント
@@ -1087,7 +2646,6 @@ def get_blocked_users_pages(
     """  # noqa: E501
 
     clg: Optional[pyl.CustomLogger] = None
-    blocked_user_pages: list[ResultSet] = []
 
     # 認証方式の確認
     if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
@@ -1104,8 +2662,15 @@ def get_blocked_users_pages(
         # ブロックユーザページの取得
         blocked_user_pagination: tweepy.Cursor = tweepy.Cursor(
             api.get_blocks,
+            parser=twitter_raw_json_util.select_parser(use_raw_json_parser),
+            **__generate_params_of_fetch_profile(fetch_profile, "/blocks/list"),
         )
-        blocked_user_pages = list(blocked_user_pagination.pages(num_of_requests))
+        for blocked_user_page in blocked_user_pagination.pages(num_of_requests):
+            # 進捗の報告
+            if progress_reporter is not None:
+                progress_reporter.update(len(blocked_user_page))
+
+            yield blocked_user_page
 
         clg.log_inf(f"ブロックユーザページ取得に成功しました。")
     except Exception as e:
@@ -1113,4 +2678,170 @@ def get_blocked_users_pages(
             clg.log_err(f"ブロックユーザページ取得に失敗しました。")
         raise (e)
 
+    return None
+
+
+def get_blocked_users_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    num_of_data: int = EnumOfBlockedUser.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+    num_of_data_per_request: int = EnumOfBlockedUser.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST.value,
+    fetch_profile: EnumOfFetchProfile = EnumOfFetchProfile.DEFAULT,
+) -> list[ResultSet]:
+    """
+    ブロックユーザページの取得
+
+    Args:
+        use_debug_mode (bool)                        : デバッグモード使用有無
+        api (tweepy.API)                             : API
+        num_of_data (int, optional)                  : データ数
+        num_of_data_per_request (int, optional)      : リクエストごとのデータ数
+        fetch_profile (EnumOfFetchProfile, optional) : 取得プロファイル(LEANの場合は最新のツイートとエンティティを除外する)
+
+    Returns:
+        list[ResultSet] : ブロックユーザページ (list[ResultSet[tweepy.models.User]])
+
+    Notes:
+        - 全ページを取得してから返却する(ページごとに処理する場合は`iter_blocked_users_pages`を使用する)
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - GET blocks/list
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 5000
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/mute-block-report-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/mute-block-report-users/api-reference/get-blocks-list
+        - レスポンス
+            - https://developer.twitter.com/en/docs/twitter-api/v1/data-dictionary/object-model/user
+    """  # noqa: E501
+
+    blocked_user_pages: list[ResultSet] = []
+
+    try:
+        # ブロックユーザページの取得
+        blocked_user_pages = list(
+            iter_blocked_users_pages(
+                use_debug_mode,
+                api,
+                num_of_data,
+                num_of_data_per_request,
+                fetch_profile=fetch_profile,
+            )
+        )
+    except Exception as e:
+        raise (e)
+
     return blocked_user_pages
+
+
+class EnumOfBlockedUserId:
+    class EnumOfOauth1User(IntEnum):
+        MAX_NUM_OF_DATA_PER_REQUEST = 5000
+        MAX_NUM_OF_REQUESTS_PER_15MIN = 15
+        MAX_NUM_OF_DATA_PER_15MIN = MAX_NUM_OF_DATA_PER_REQUEST * MAX_NUM_OF_REQUESTS_PER_15MIN
+
+
+def iter_blocked_user_id_pages(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    num_of_data: int = EnumOfBlockedUserId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+) -> Iterator[list[int]]:
+    """
+    ブロックユーザIDページの取得(イテレータ)
+
+    Args:
+        use_debug_mode (bool)       : デバッグモード使用有無
+        api (tweepy.API)            : API
+        num_of_data (int, optional) : データ数
+
+    Yields:
+        list[int] : ブロックユーザIDページ (list[ブロックユーザの数値ID])
+
+    Notes:
+        - ページを1つずつ遅延して取得する
+        - ユーザ情報が不要な場合は`iter_blocked_users_pages`より少ないリクエスト数で取得できる
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - GET blocks/ids
+        - レート制限
+            - ユーザ認証(OAuth 1.0a)
+                - データ数／リクエスト : 5000
+                - リクエスト数／１５分 : 15
+                    - 超過した場合は15分の待機時間が発生する
+
+    References:
+        - エンドポイント
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/mute-block-report-users/overview
+            - https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/mute-block-report-users/api-reference/get-blocks-ids
+    """  # noqa: E501
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    # 認証方式の確認
+    if isinstance(api.auth, (tweepy.OAuth1UserHandler)) is False:
+        raise (pyl.CustomError(f"この認証方式ではTwitterAPIにアクセスできません。(Auth:{type(api.auth)})"))
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # リクエスト数の算出
+        num_of_requests = math.ceil(num_of_data / EnumOfBlockedUserId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_REQUEST)
+
+        # ブロックユーザIDページの取得
+        blocked_user_id_pagination: tweepy.Cursor = tweepy.Cursor(
+            api.get_blocked_ids,
+        )
+        for blocked_user_id_page in blocked_user_id_pagination.pages(num_of_requests):
+            yield blocked_user_id_page
+
+        clg.log_inf(f"ブロックユーザIDページ取得に成功しました。")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"ブロックユーザIDページ取得に失敗しました。")
+        raise (e)
+
+    return None
+
+
+def get_blocked_user_ids(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    num_of_data: int = EnumOfBlockedUserId.EnumOfOauth1User.MAX_NUM_OF_DATA_PER_15MIN.value,
+) -> set[int]:
+    """
+    ブロックユーザIDの取得
+
+    Args:
+        use_debug_mode (bool)       : デバッグモード使用有無
+        api (tweepy.API)            : API
+        num_of_data (int, optional) : データ数
+
+    Returns:
+        set[int] : ブロックユーザID (set[ブロックユーザの数値ID])
+
+    Notes:
+        - 包含判定を定数時間で行えるよう、集合で返却する
+        - 認証
+            - ユーザ認証(OAuth 1.0a)
+        - エンドポイント
+            - GET blocks/ids
+    """  # noqa: E501
+
+    blocked_user_ids: set[int] = set()
+
+    try:
+        # ブロックユーザIDの取得
+        for blocked_user_id_page in iter_blocked_user_id_pages(use_debug_mode, api, num_of_data):
+            blocked_user_ids.update(blocked_user_id_page)
+    except Exception as e:
+        raise (e)
+
+    return blocked_user_ids
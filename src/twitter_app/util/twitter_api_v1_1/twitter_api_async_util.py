@@ -0,0 +1,386 @@
+import asyncio
+import time
+from types import TracebackType
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import quote, urlencode
+
+import aiohttp
+import python_lib_for_me as pyl
+import tweepy
+from oauthlib.oauth1 import Client as OAuthClient
+from tweepy.parsers import ModelParser
+from yarl import URL
+
+from twitter_app.util.twitter_api_v1_1 import twitter_rate_limit_util, twitter_rate_limiter_util
+
+
+class AsyncTwitterApi:
+    """
+    非同期TwitterAPI
+
+    Notes:
+        - 同期API(`tweepy.API`)の認証情報を引き継ぎ、aiohttpでリクエストする
+            - 1つのスレッドで複数のリクエストを並行できる(同時リクエスト数はセマフォで制限する)
+            - 戻り値は同期APIと同じモデル(`tweepy.models`)とする
+        - リクエスト前にリミッターから予約し、イベントループを止めずに待機する
+        - レスポンスヘッダのレート制限をレート制限レジストリに記録する
+        - `async with`で使用し、終了時にセッションを閉じる
+
+    References:
+        - aiohttp
+            - https://docs.aiohttp.org/en/stable/client_reference.html
+    """
+
+    # レート制限超過時の最大再試行回数
+    __MAX_NUM_OF_RETRIES_ON_RATE_LIMIT: int = 3
+
+    def __init__(
+        self,
+        api: tweepy.API,
+        num_of_concurrent_requests: int = 8,
+        rate_limiter: Optional[twitter_rate_limiter_util.RateLimiter] = None,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            api (tweepy.API)                                : API(認証情報とホストを引き継ぐ)
+            num_of_concurrent_requests (int, optional)      : 同時リクエスト数
+            rate_limiter (Optional[RateLimiter], optional)  : リミッター(未指定の場合は共有のリミッター)
+        """
+
+        if not (isinstance(api.auth, tweepy.OAuth1UserHandler) or isinstance(api.auth, tweepy.OAuth2AppHandler)):
+            raise (pyl.CustomError(f"非同期TwitterAPIが対応していない認証方式です。(auth:{type(api.auth).__name__})"))
+
+        self.__api: tweepy.API = api
+        self.__auth_context: str = twitter_rate_limit_util.generate_auth_context_of_api(api)
+        self.__rate_limiter: twitter_rate_limiter_util.RateLimiter = (
+            rate_limiter if rate_limiter is not None else twitter_rate_limiter_util.get_rate_limiter()
+        )
+        self.__num_of_concurrent_requests: int = num_of_concurrent_requests
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__parser: ModelParser = ModelParser()
+
+    async def __aenter__(self) -> "AsyncTwitterApi":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """セッション終了"""
+
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+        return None
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any],
+        payload_type: str,
+        payload_list: bool = False,
+        return_cursors: bool = False,
+    ) -> Any:
+        """
+        リクエスト
+
+        Args:
+            method (str)                    : HTTPメソッド
+            endpoint (str)                  : エンドポイント(例：/friends/list)
+            params (dict[str, Any])         : パラメータ(値がNoneのものは送信しない)
+            payload_type (str)              : ペイロード種類(例：user)(`tweepy.models.ModelFactory`の属性名)
+            payload_list (bool, optional)   : ペイロードリスト有無
+            return_cursors (bool, optional) : カーソル返却有無
+
+        Returns:
+            Any: 結果 (カーソル返却有無がTrueの場合は結果とカーソルのタプル)
+
+        Notes:
+            - パラメータのリストはカンマ区切り、真偽値は小文字の文字列に変換する(署名のためRFC 3986でエンコードする)
+            - レート制限を超過した場合は同期APIの`wait_on_rate_limit`に従い、待機して再試行するか例外を発生させる
+                - リセット時刻がレスポンスヘッダにない場合はレート制限の期間(15分)待機する
+                - 再試行は最大3回とし、超過した場合は例外を発生させる
+        """  # noqa: E501
+
+        for num_of_retries in range(AsyncTwitterApi.__MAX_NUM_OF_RETRIES_ON_RATE_LIMIT + 1):
+            # 待機(リミッター)
+            wait_sec: float = self.__rate_limiter.reserve(self.__auth_context, endpoint)
+            if wait_sec > 0:
+                await asyncio.sleep(wait_sec)
+
+            # リクエスト
+            semaphore, session = self.__get_semaphore_and_session()
+            url, headers = self.__generate_url_and_headers(method, endpoint, params)
+            async with semaphore:
+                async with session.request(method, url, headers=headers) as response:
+                    payload: bytes = await response.read()
+
+            # レート制限の記録
+            self.__record_rate_limit(endpoint, response)
+
+            # レート制限超過時の再試行
+            if (
+                response.status == 429
+                and self.__api.wait_on_rate_limit is True
+                and num_of_retries < AsyncTwitterApi.__MAX_NUM_OF_RETRIES_ON_RATE_LIMIT
+            ):
+                reset: Optional[str] = response.headers.get("x-rate-limit-reset")
+                if reset is not None:
+                    await asyncio.sleep(max(int(reset) - time.time(), 0) + 1)
+                else:
+                    await asyncio.sleep(twitter_rate_limit_util.RATE_LIMIT_WINDOW_SEC)
+                continue
+            break
+
+        # ステータスの確認
+        self.__raise_for_status(response, payload)
+
+        return self.__parser.parse(
+            payload.decode(),
+            api=self.__api,
+            payload_list=payload_list,
+            payload_type=payload_type,
+            return_cursors=return_cursors,
+        )
+
+    def __get_semaphore_and_session(self) -> tuple[asyncio.Semaphore, aiohttp.ClientSession]:
+        """セマフォ・セッション取得(イベントループ内で初めて使用する時に生成する)(コネクション数は同時リクエスト数に合わせる)"""
+
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.__num_of_concurrent_requests)
+        if self.__session is None:
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.__num_of_concurrent_requests, keepalive_timeout=60),
+                headers={"Accept-Encoding": "gzip, deflate"},
+                timeout=aiohttp.ClientTimeout(total=self.__api.timeout),
+            )
+
+        return self.__semaphore, self.__session
+
+    def __generate_url_and_headers(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any],
+    ) -> tuple[URL, dict[str, str]]:
+        """URL・ヘッダ生成(認証情報による署名)"""
+
+        query_params: list[tuple[str, str]] = []
+        for key, value in sorted(params.items()):
+            if value is None:
+                continue
+            elif isinstance(value, bool):
+                query_params.append((key, str(value).lower()))
+            elif isinstance(value, list) or isinstance(value, tuple):
+                query_params.append((key, ",".join(map(str, value))))
+            else:
+                query_params.append((key, str(value)))
+        url: str = f"https://{self.__api.host}/1.1{endpoint}.json"
+        if len(query_params) > 0:
+            url += "?" + urlencode(query_params, quote_via=quote)
+        headers: dict[str, str] = {"User-Agent": self.__api.user_agent}
+
+        auth: Any = self.__api.auth
+        if isinstance(auth, tweepy.OAuth1UserHandler):
+            oauth_client: OAuthClient = OAuthClient(
+                auth.consumer_key,
+                auth.consumer_secret,
+                auth.access_token,
+                auth.access_token_secret,
+            )
+            url, headers, _ = oauth_client.sign(url, method, headers=headers)
+        else:
+            headers["Authorization"] = f"Bearer {auth.apply_auth().bearer_token}"
+
+        return URL(url, encoded=True), headers
+
+    def __record_rate_limit(
+        self,
+        endpoint: str,
+        response: aiohttp.ClientResponse,
+    ) -> None:
+        """レート制限記録(レスポンスヘッダ)"""
+
+        headers: Any = response.headers
+        if "x-rate-limit-remaining" in headers and "x-rate-limit-reset" in headers:
+            twitter_rate_limit_util.get_rate_limit_registry().record(
+                self.__auth_context,
+                endpoint,
+                twitter_rate_limit_util.RateLimit(
+                    int(headers.get("x-rate-limit-limit", 0)),
+                    int(headers["x-rate-limit-remaining"]),
+                    int(headers["x-rate-limit-reset"]),
+                    time.time(),
+                ),
+            )
+
+        return None
+
+    def __raise_for_status(
+        self,
+        response: aiohttp.ClientResponse,
+        payload: bytes,
+    ) -> None:
+        """ステータス確認(同期APIと同じ例外を発生させる)"""
+
+        if 200 <= response.status < 300:
+            return None
+
+        # レスポンスがJSONでない場合(503のHTML等)は空の辞書とする(tweepyが非同期のレスポンスからJSONを取得しないようにする)
+        response_json: Any = {}
+        try:
+            response_json = tweepy.parsers.JSONParser().parse(payload.decode()) or {}
+        except Exception:
+            pass
+
+        if response.status == 400:
+            raise (tweepy.BadRequest(response, response_json=response_json))
+        elif response.status == 401:
+            raise (tweepy.Unauthorized(response, response_json=response_json))
+        elif response.status == 403:
+            raise (tweepy.Forbidden(response, response_json=response_json))
+        elif response.status == 404:
+            raise (tweepy.NotFound(response, response_json=response_json))
+        elif response.status == 429:
+            raise (tweepy.TooManyRequests(response, response_json=response_json))
+        elif response.status >= 500:
+            raise (tweepy.TwitterServerError(response, response_json=response_json))
+        else:
+            raise (tweepy.HTTPException(response, response_json=response_json))
+
+    async def iter_cursor_pages(
+        self,
+        method_name: str,
+        **params: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        カーソルページ取得イテレータ
+
+        Args:
+            method_name (str)   : メソッド名(例：get_friends)(カーソルでページングするもの)
+            params (Any)        : パラメータ
+
+        Yields:
+            Any : 結果ページ (ResultSet等)
+
+        Notes:
+            - 同期APIの`tweepy.Cursor(...).pages()`に相当する
+        """
+
+        cursor: int = params.pop("cursor", -1)
+        while cursor != 0:
+            page, cursors = await getattr(self, method_name)(cursor=cursor, return_cursors=True, **params)
+            if len(page) == 0:
+                break
+            yield page
+            cursor = cursors[1] if isinstance(cursors, tuple) else cursors
+
+    async def get_friends(self, return_cursors: bool = False, **params: Any) -> Any:
+        """フォロイー取得(friends/list)"""
+        return await self.request("GET", "/friends/list", params, "user", True, return_cursors)
+
+    async def get_followers(self, return_cursors: bool = False, **params: Any) -> Any:
+        """フォロワー取得(followers/list)"""
+        return await self.request("GET", "/followers/list", params, "user", True, return_cursors)
+
+    async def get_friend_ids(self, return_cursors: bool = False, **params: Any) -> Any:
+        """フォロイーID取得(friends/ids)"""
+        return await self.request("GET", "/friends/ids", params, "ids", False, return_cursors)
+
+    async def get_follower_ids(self, return_cursors: bool = False, **params: Any) -> Any:
+        """フォロワーID取得(followers/ids)"""
+        return await self.request("GET", "/followers/ids", params, "ids", False, return_cursors)
+
+    async def get_list_members(self, return_cursors: bool = False, **params: Any) -> Any:
+        """リストメンバー取得(lists/members)"""
+        return await self.request("GET", "/lists/members", params, "user", True, return_cursors)
+
+    async def lookup_users(self, **params: Any) -> Any:
+        """ユーザ検索(users/lookup)"""
+        return await self.request("GET", "/users/lookup", params, "user", True)
+
+    async def search_tweets(self, **params: Any) -> Any:
+        """ツイート検索(search/tweets)"""
+        return await self.request("GET", "/search/tweets", params, "search_results")
+
+    async def get_friendship(self, **params: Any) -> Any:
+        """交友関係取得(friendships/show)"""
+        return await self.request("GET", "/friendships/show", params, "friendship")
+
+    async def lookup_friendships(self, **params: Any) -> Any:
+        """交友関係検索(friendships/lookup)"""
+        return await self.request("GET", "/friendships/lookup", params, "relationship", True)
+
+    async def get_blocks(self, return_cursors: bool = False, **params: Any) -> Any:
+        """ブロックユーザ取得(blocks/list)"""
+        return await self.request("GET", "/blocks/list", params, "user", True, return_cursors)
+
+    async def get_blocked_ids(self, return_cursors: bool = False, **params: Any) -> Any:
+        """ブロックユーザID取得(blocks/ids)"""
+        return await self.request("GET", "/blocks/ids", params, "ids", False, return_cursors)
+
+    async def rate_limit_status(self, **params: Any) -> Any:
+        """レート制限取得(application/rate_limit_status)"""
+        return await self.request("GET", "/application/rate_limit_status", params, "json")
+
+    @property
+    def api(self) -> tweepy.API:
+        return self.__api
+
+
+async def lookup_users_concurrently(
+    use_debug_mode: bool,
+    async_api: AsyncTwitterApi,
+    user_ids: list[str],
+    num_of_data_per_request: int = 100,
+    params: Optional[dict[str, Any]] = None,
+) -> list[Any]:
+    """
+    ユーザ検索(並行)
+
+    Args:
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        async_api (AsyncTwitterApi)                 : 非同期API
+        user_ids (list[str])                        : ユーザID(複数)
+        num_of_data_per_request (int, optional)     : リクエストごとのデータ数
+        params (Optional[dict[str, Any]], optional) : 追加のパラメータ(例：include_entities)
+
+    Returns:
+        list[Any]: ユーザ検索結果ページ (list[ResultSet[tweepy.models.User]])
+
+    Notes:
+        - 100人ごとの検索を1つのイベントループで並行にリクエストする
+        - 検索結果ページは指定したユーザIDの順序(100人ごと)で返却する
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        # ロガーの取得
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # ユーザIDリストの分割(100人ごと)
+        user_ids_list: list[list[str]] = pyl.split_list(user_ids, num_of_data_per_request)
+
+        # ユーザ(100人ごと)の検索
+        user_pages: list[Any] = await asyncio.gather(
+            *[
+                async_api.lookup_users(screen_name=user_ids_by_element, **(params if params is not None else {}))
+                for user_ids_by_element in user_ids_list
+            ]
+        )
+        clg.log_dbg(f"ユーザ検索(並行)：{len(user_ids)}人、{len(user_pages)}ページ")
+    except Exception as e:
+        raise (e)
+
+    return user_pages
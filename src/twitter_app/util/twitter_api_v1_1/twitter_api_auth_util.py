@@ -1,12 +1,20 @@
 import webbrowser
-from typing import Optional
+from typing import Any, Optional
 
 import python_lib_for_me as pyl
 import tweepy
 
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util, twitter_api_transport_util
+
 
 class TwitterApiAuthInfo:
-    """TwitterAPI認証情報"""
+    """
+    TwitterAPI認証情報
+
+    Notes:
+        - 任意の`credential_pool`には追加の認証情報を同じ形式(consumer_keys、authentication_tokens)で複数指定できる
+            - 読み取り中心の処理でリクエストを分散するために使用する(`generate_api_pool`)
+    """
 
     def __init__(
         self,
@@ -30,6 +38,12 @@ class TwitterApiAuthInfo:
         access_token: str = authentication_tokens["access_token"]
         access_token_secret: str = authentication_tokens["access_token_secret"]
 
+        # 認証情報プールの取得
+        credential_dicts: Any = twitter_api_auth_info_dict.get("credential_pool", [])
+        credential_pool: list[TwitterApiAuthInfo] = [
+            TwitterApiAuthInfo(credential_dict) for credential_dict in credential_dicts
+        ]
+
         # インスタンス変数への格納
         self.__twitter_api_auth_info_dict = twitter_api_auth_info_dict
         self.__api_key = api_key
@@ -37,6 +51,7 @@ class TwitterApiAuthInfo:
         self.__bearer_token = bearer_token
         self.__access_token = access_token
         self.__access_token_secret = access_token_secret
+        self.__credential_pool = credential_pool
 
     @property
     def twitter_api_auth_info_dict(self) -> dict[str, dict]:
@@ -89,6 +104,10 @@ class TwitterApiAuthInfo:
         self.__twitter_api_auth_info_dict["authentication_tokens"]["access_token_secret"] = access_token_secret
         self.__access_token_secret = access_token_secret
 
+    @property
+    def credential_pool(self) -> list["TwitterApiAuthInfo"]:
+        return self.__credential_pool
+
 
 def generate_api_by_oauth_1_user(
     use_debug_mode: bool,
@@ -130,6 +149,7 @@ def generate_api_by_oauth_1_user(
             twitter_api_auth_info.access_token_secret,
         )
         api: tweepy.API = tweepy.API(auth, wait_on_rate_limit=wait_on_rate_limit)
+        twitter_api_transport_util.install_http_transport(api)
         api.verify_credentials()
 
         clg.log_inf(f"API生成(OAuth 1.0a - User Access Tokens)に成功しました。")
@@ -193,6 +213,7 @@ def generate_api_by_oauth_1_user_using_pin(
 
         # APIの生成
         api: tweepy.API = tweepy.API(auth, wait_on_rate_limit=wait_on_rate_limit)
+        twitter_api_transport_util.install_http_transport(api)
         api.verify_credentials()
 
         clg.log_inf(f"API生成(OAuth 1.0a - User Access Tokens (PIN-Based OAuth flow))に成功しました。")
@@ -241,6 +262,7 @@ def generate_api_by_oauth_2_app(
             twitter_api_auth_info.api_secret,
         )
         api: tweepy.API = tweepy.API(auth, wait_on_rate_limit=wait_on_rate_limit)
+        twitter_api_transport_util.install_http_transport(api)
 
         clg.log_inf(f"API生成(OAuth 2.0 - Bearer Token (App-Only))に成功しました。")
     except Exception as e:
@@ -249,3 +271,61 @@ def generate_api_by_oauth_2_app(
         raise (e)
 
     return api
+
+
+def generate_api_pool(
+    use_debug_mode: bool,
+    api: tweepy.API,
+    twitter_api_auth_info: TwitterApiAuthInfo,
+    wait_on_rate_limit: bool,
+    use_app_context: bool = False,
+) -> twitter_api_pool_util.TwitterApiPool:
+    """
+    APIプール生成
+
+    Args:
+        use_debug_mode (bool)                       : デバッグモード使用有無
+        api (tweepy.API)                            : API(主API)
+        twitter_api_auth_info (TwitterApiAuthInfo)  : TwitterAPI認証情報
+        wait_on_rate_limit (bool)                   : レート制限時待機有無
+        use_app_context (bool, optional)            : アプリ認証併用有無
+
+    Returns:
+        TwitterApiPool: APIプール
+
+    Notes:
+        - 主APIと認証情報プールの各認証情報から生成したAPIを保持する
+            - アクセストークンがある場合はユーザ認証(OAuth 1.0a)、ない場合はアプリ認証(OAuth 2.0)を使用する
+        - アプリ認証を併用する場合は、ユーザ認証の各認証情報からアプリ認証(OAuth 2.0)のAPIも生成する
+            - レート制限は認証方式ごとに別枠であるため、読み取り専用の処理の上限が概ね倍になる
+        - 認証情報プールがなく、アプリ認証も併用しない場合は主APIのみを保持する(従来と同じ動作となる)
+    """
+
+    clg: Optional[pyl.CustomLogger] = None
+
+    try:
+        clg = pyl.CustomLogger(__name__, use_debug_mode=use_debug_mode)
+
+        # 主APIのアプリ認証のAPIの生成
+        apis: list[tweepy.API] = [api]
+        if use_app_context is True:
+            apis.append(generate_api_by_oauth_2_app(use_debug_mode, twitter_api_auth_info, wait_on_rate_limit))
+
+        # 認証情報プールのAPIの生成
+        for credential in twitter_api_auth_info.credential_pool:
+            if credential.access_token != "" and credential.access_token_secret != "":
+                apis.append(generate_api_by_oauth_1_user(use_debug_mode, credential, wait_on_rate_limit))
+                if use_app_context is True:
+                    apis.append(generate_api_by_oauth_2_app(use_debug_mode, credential, wait_on_rate_limit))
+            else:
+                apis.append(generate_api_by_oauth_2_app(use_debug_mode, credential, wait_on_rate_limit))
+
+        api_pool: twitter_api_pool_util.TwitterApiPool = twitter_api_pool_util.TwitterApiPool(apis)
+
+        clg.log_inf(f"APIプール生成に成功しました。(API数：{len(apis)})")
+    except Exception as e:
+        if clg is not None:
+            clg.log_err(f"APIプール生成に失敗しました。")
+        raise (e)
+
+    return api_pool
@@ -0,0 +1,156 @@
+import threading
+from typing import Any, Optional
+
+import python_lib_for_me as pyl
+import tweepy
+
+from twitter_app.util.twitter_api_v1_1 import twitter_rate_limit_util, twitter_rate_limiter_util
+
+
+class TwitterApiPool:
+    """
+    TwitterAPIプール
+
+    Notes:
+        - 複数の認証情報から生成したAPIを保持し、リクエストごとに分散する
+            - 待機時間が最も短いAPIを選択する(同じ場合は順番に選択する)
+            - 待機時間はリミッターの見積もりを使用する(レスポンスヘッダの記録で補正される)
+        - 読み取り中心の処理(users/lookup、search/tweets、lists/members)のスループットを認証情報の数に比例させる
+        - ユーザ認証(OAuth 1.0a)とアプリ認証(OAuth 2.0)のAPIを混在できる
+            - レート制限は認証方式ごとに別枠であるため、両方を使用すると読み取りの上限が概ね倍になる
+            - ユーザ認証でのみ取得できるもの(非公開リスト等)は認証方式を限定して選択する
+    """
+
+    def __init__(
+        self,
+        apis: list[tweepy.API],
+        rate_limiter: Optional[twitter_rate_limiter_util.RateLimiter] = None,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            apis (list[tweepy.API])                         : API(複数)(先頭を主APIとする)
+            rate_limiter (Optional[RateLimiter], optional)  : リミッター(未指定の場合は共有のリミッター)
+        """
+
+        if len(apis) == 0:
+            raise (pyl.CustomError(f"APIが指定されていません。"))
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__apis: list[tweepy.API] = apis
+        self.__auth_contexts: list[str] = [twitter_rate_limit_util.generate_auth_context_of_api(api) for api in apis]
+        self.__auth_types: list[str] = [auth_context.split(":")[0] for auth_context in self.__auth_contexts]
+        self.__rate_limiter: twitter_rate_limiter_util.RateLimiter = (
+            rate_limiter if rate_limiter is not None else twitter_rate_limiter_util.get_rate_limiter()
+        )
+        self.__next_index: int = 0
+
+    def select_api(
+        self,
+        endpoint: str,
+        auth_types: Optional[list[str]] = None,
+    ) -> tweepy.API:
+        """
+        API選択
+
+        Args:
+            endpoint (str)                              : エンドポイント(例：/users/lookup)
+            auth_types (Optional[list[str]], optional)  : 認証方式(例：["oauth1"])(未指定の場合は全て)
+
+        Returns:
+            tweepy.API: API
+        """
+
+        with self.__lock:
+            # 待機時間が最も短いAPIの選択(前回選択したAPIの次から探す)
+            selected_index: Optional[int] = None
+            min_wait_sec: Optional[float] = None
+            for offset in range(len(self.__apis)):
+                index: int = (self.__next_index + offset) % len(self.__apis)
+                if auth_types is not None and not (self.__auth_types[index] in auth_types):
+                    continue
+                wait_sec: float = self.__rate_limiter.estimate_wait_sec(self.__auth_contexts[index], endpoint)
+                if min_wait_sec is None or wait_sec < min_wait_sec:
+                    selected_index = index
+                    min_wait_sec = wait_sec
+            if selected_index is None:
+                raise (pyl.CustomError(f"指定した認証方式のAPIがありません。(auth_types:{auth_types})"))
+            self.__next_index = (selected_index + 1) % len(self.__apis)
+
+        return self.__apis[selected_index]
+
+    def generate_dispatch_method(
+        self,
+        method_name: str,
+        endpoint: str,
+        auth_types: Optional[list[str]] = None,
+    ) -> "DispatchMethod":
+        """
+        分散メソッド生成
+
+        Args:
+            method_name (str)                           : メソッド名(例：get_list_members)
+            endpoint (str)                              : エンドポイント(例：/lists/members)
+            auth_types (Optional[list[str]], optional)  : 認証方式(例：["oauth1"])(未指定の場合は全て)
+
+        Returns:
+            DispatchMethod: 分散メソッド(`tweepy.Cursor`に指定できる)
+        """
+
+        return DispatchMethod(self, method_name, endpoint, auth_types)
+
+    @property
+    def apis(self) -> list[tweepy.API]:
+        return self.__apis
+
+    @property
+    def primary_api(self) -> tweepy.API:
+        return self.__apis[0]
+
+    @property
+    def auth_contexts(self) -> list[str]:
+        return self.__auth_contexts
+
+
+class DispatchMethod:
+    """
+    分散メソッド
+
+    Notes:
+        - 呼び出しごとにAPIプールからAPIを選択し、そのAPIのメソッドを呼び出す
+        - `tweepy.Cursor`がページングに使用する属性(pagination_mode等)を元のメソッドから引き継ぐ
+    """
+
+    def __init__(
+        self,
+        api_pool: TwitterApiPool,
+        method_name: str,
+        endpoint: str,
+        auth_types: Optional[list[str]] = None,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            api_pool (TwitterApiPool)                   : APIプール
+            method_name (str)                           : メソッド名(例：get_list_members)
+            endpoint (str)                              : エンドポイント(例：/lists/members)
+            auth_types (Optional[list[str]], optional)  : 認証方式(例：["oauth1"])(未指定の場合は全て)
+        """
+
+        method: Any = getattr(api_pool.primary_api, method_name)
+
+        self.__api_pool: TwitterApiPool = api_pool
+        self.__method_name: str = method_name
+        self.__endpoint: str = endpoint
+        self.__auth_types: Optional[list[str]] = auth_types
+        self.__self__: tweepy.API = api_pool.primary_api
+        if hasattr(method, "pagination_mode") is True:
+            self.pagination_mode: str = method.pagination_mode
+        self.payload_list: bool = getattr(method, "payload_list", False)
+        self.payload_type: Optional[str] = getattr(method, "payload_type", None)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        api: tweepy.API = self.__api_pool.select_api(self.__endpoint, self.__auth_types)
+        return getattr(api, self.__method_name)(*args, **kwargs)
@@ -0,0 +1,307 @@
+import socket
+import threading
+from typing import Any, Optional
+
+import requests
+import tweepy
+from urllib3.connection import HTTPConnection
+
+from twitter_app.util.twitter_api_v1_1 import twitter_rate_limit_util, twitter_rate_limiter_util
+
+
+def generate_keep_alive_socket_options(
+    keep_alive_idle_sec: int,
+    keep_alive_interval_sec: int,
+    keep_alive_count: int,
+) -> list[tuple[int, int, int]]:
+    """
+    キープアライブソケットオプション生成
+
+    Args:
+        keep_alive_idle_sec (int)       : キープアライブ開始までのアイドル時間(秒)
+        keep_alive_interval_sec (int)   : キープアライブ送信間隔(秒)
+        keep_alive_count (int)          : キープアライブ送信回数(応答がない場合に切断するまで)
+
+    Returns:
+        list[tuple[int, int, int]]: ソケットオプション
+
+    Notes:
+        - 既定のソケットオプション(TCP_NODELAY)に加えてTCPキープアライブを有効にする
+        - OSが対応していないオプションは指定しない
+    """
+
+    socket_options: list[tuple[int, int, int]] = list(HTTPConnection.default_socket_options)
+    socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE") is True:
+        socket_options.append((socket.IPPROTO_TCP, getattr(socket, "TCP_KEEPIDLE"), keep_alive_idle_sec))
+    elif hasattr(socket, "TCP_KEEPALIVE") is True:
+        socket_options.append((socket.IPPROTO_TCP, getattr(socket, "TCP_KEEPALIVE"), keep_alive_idle_sec))
+    if hasattr(socket, "TCP_KEEPINTVL") is True:
+        socket_options.append((socket.IPPROTO_TCP, getattr(socket, "TCP_KEEPINTVL"), keep_alive_interval_sec))
+    if hasattr(socket, "TCP_KEEPCNT") is True:
+        socket_options.append((socket.IPPROTO_TCP, getattr(socket, "TCP_KEEPCNT"), keep_alive_count))
+
+    return socket_options
+
+
+class KeepAliveHTTPAdapter(twitter_rate_limiter_util.RateLimitedHTTPAdapter):
+    """
+    キープアライブHTTPアダプタ
+
+    Notes:
+        - レート制限HTTPアダプタのコネクションにTCPキープアライブのソケットオプションを指定する
+            - レート制限による待機中もコネクションを維持し、待機後のTLSハンドシェイクを省く
+    """
+
+    def __init__(
+        self,
+        rate_limiter: twitter_rate_limiter_util.RateLimiter,
+        socket_options: list[tuple[int, int, int]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            rate_limiter (RateLimiter)                      : リミッター
+            socket_options (list[tuple[int, int, int]])     : ソケットオプション
+        """
+
+        self.__socket_options: list[tuple[int, int, int]] = socket_options
+        super().__init__(rate_limiter, *args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """プールマネージャ初期化"""
+        kwargs["socket_options"] = self.__socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class SharedSession(requests.Session):
+    """
+    共有セッション
+
+    Notes:
+        - `tweepy.API`はリクエストごとにセッションを閉じるため、`close`ではコネクションプールを破棄しない
+            - 閉じるとキープアライブ中のコネクションが切断され、次のリクエストで再度TLSハンドシェイクが発生する
+            - 他のスレッドが使用中のコネクションも切断される
+        - コネクションプールを破棄する場合は`close_pool`を使用する
+    """
+
+    def close(self) -> None:
+        """セッション終了(何もしない)"""
+        return None
+
+    def close_pool(self) -> None:
+        """コネクションプール破棄"""
+        super().close()
+
+
+class HttpTransport:
+    """
+    HTTPトランスポート
+
+    Notes:
+        - プロセス内の全てのAPIが共有するセッション(`requests.Session`)を保持する
+            - コネクションプールをAPI間で共有し、認証情報が異なるAPIでもコネクションを再利用する
+            - プールの大きさは同時リクエスト数に合わせる
+        - レスポンスの圧縮(gzip)を要求する
+        - TCPキープアライブでアイドル中のコネクションを維持する
+        - リミッターとレート制限フックは共有のセッションに1回だけ導入する
+
+    References:
+        - requests
+            - https://requests.readthedocs.io/en/latest/user/advanced/#transport-adapters
+    """
+
+    def __init__(
+        self,
+        num_of_connections: int = 10,
+        keep_alive_idle_sec: int = 60,
+        keep_alive_interval_sec: int = 30,
+        keep_alive_count: int = 4,
+        rate_limiter: Optional[twitter_rate_limiter_util.RateLimiter] = None,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            num_of_connections (int, optional)              : ホストごとのコネクション数(同時リクエスト数)
+            keep_alive_idle_sec (int, optional)             : キープアライブ開始までのアイドル時間(秒)
+            keep_alive_interval_sec (int, optional)         : キープアライブ送信間隔(秒)
+            keep_alive_count (int, optional)                : キープアライブ送信回数
+            rate_limiter (Optional[RateLimiter], optional)  : リミッター(未指定の場合は共有のリミッター)
+        """
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__num_of_connections: int = num_of_connections
+        self.__socket_options: list[tuple[int, int, int]] = generate_keep_alive_socket_options(
+            keep_alive_idle_sec, keep_alive_interval_sec, keep_alive_count
+        )
+        self.__rate_limiter: twitter_rate_limiter_util.RateLimiter = (
+            rate_limiter if rate_limiter is not None else twitter_rate_limiter_util.get_rate_limiter()
+        )
+        self.__session: SharedSession = self.__generate_session()
+        self.__warmed_up_hosts: set[str] = set()
+
+    def __generate_session(self) -> SharedSession:
+        """セッション生成"""
+
+        session: SharedSession = SharedSession()
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        session.mount(
+            "https://",
+            KeepAliveHTTPAdapter(
+                self.__rate_limiter,
+                self.__socket_options,
+                pool_connections=self.__num_of_connections,
+                pool_maxsize=self.__num_of_connections,
+            ),
+        )
+        session.hooks.setdefault("response", []).append(twitter_rate_limit_util.record_rate_limit_of_response)
+
+        return session
+
+    def install(
+        self,
+        api: tweepy.API,
+    ) -> None:
+        """
+        導入
+
+        Args:
+            api (tweepy.API) : API
+
+        Returns:
+            -
+
+        Notes:
+            - APIのセッションを共有のセッションに置き換える(元のセッションは閉じる)
+        """
+
+        if api.session is not self.__session:
+            api.session.close()
+            api.session = self.__session
+
+        return None
+
+    def warm_up(
+        self,
+        host: str,
+    ) -> None:
+        """
+        ウォームアップ
+
+        Args:
+            host (str) : ホスト(例：api.twitter.com)
+
+        Returns:
+            -
+
+        Notes:
+            - 認証なしのHEADリクエストでコネクションを確立し、最初のAPIリクエストのTLSハンドシェイクを省く
+                - 認証なしのためレート制限を消費しない
+            - ホストごとに1回だけ実行し、失敗した場合は無視する(APIリクエスト時に改めて接続する)
+        """  # noqa: E501
+
+        with self.__lock:
+            if host in self.__warmed_up_hosts:
+                return None
+            self.__warmed_up_hosts.add(host)
+
+        try:
+            self.__session.head(f"https://{host}/", timeout=10)
+        except requests.RequestException:
+            pass
+
+        return None
+
+    def close(self) -> None:
+        """セッション終了"""
+        self.__session.close_pool()
+
+    @property
+    def session(self) -> SharedSession:
+        return self.__session
+
+    @property
+    def num_of_connections(self) -> int:
+        return self.__num_of_connections
+
+
+# トランスポート(プロセス全体で共有する)
+__http_transport: Optional[HttpTransport] = None
+__http_transport_lock: threading.Lock = threading.Lock()
+
+
+def get_http_transport() -> HttpTransport:
+    """トランスポート取得(初めて使用する時に既定の設定で生成する)"""
+
+    global __http_transport
+
+    with __http_transport_lock:
+        if __http_transport is None:
+            __http_transport = HttpTransport()
+
+    return __http_transport
+
+
+def configure_http_transport(
+    num_of_connections: int = 10,
+    keep_alive_idle_sec: int = 60,
+    keep_alive_interval_sec: int = 30,
+    keep_alive_count: int = 4,
+) -> HttpTransport:
+    """
+    トランスポート設定
+
+    Args:
+        num_of_connections (int, optional)      : ホストごとのコネクション数(同時リクエスト数)
+        keep_alive_idle_sec (int, optional)     : キープアライブ開始までのアイドル時間(秒)
+        keep_alive_interval_sec (int, optional) : キープアライブ送信間隔(秒)
+        keep_alive_count (int, optional)        : キープアライブ送信回数
+
+    Returns:
+        HttpTransport: トランスポート
+
+    Notes:
+        - 共有のトランスポートを指定した設定で生成し直す(API生成前に実行する)
+    """
+
+    global __http_transport
+
+    with __http_transport_lock:
+        if __http_transport is not None:
+            __http_transport.close()
+        __http_transport = HttpTransport(
+            num_of_connections,
+            keep_alive_idle_sec,
+            keep_alive_interval_sec,
+            keep_alive_count,
+        )
+
+    return __http_transport
+
+
+def install_http_transport(
+    api: tweepy.API,
+) -> None:
+    """
+    トランスポート導入
+
+    Args:
+        api (tweepy.API) : API
+
+    Returns:
+        -
+
+    Notes:
+        - APIのセッションを共有のトランスポートのセッションに置き換え、APIのホストへの接続をウォームアップする
+        - リミッターとレート制限フックはトランスポートが導入済みのため、`install_rate_limiter`等の呼び出しは不要である
+    """  # noqa: E501
+
+    http_transport: HttpTransport = get_http_transport()
+    http_transport.install(api)
+    http_transport.warm_up(api.host)
+
+    return None
@@ -0,0 +1,187 @@
+import math
+import statistics
+import time
+from collections import deque
+from typing import Optional
+
+import python_lib_for_me as pyl
+import tweepy
+
+from twitter_app.util.twitter_api_v1_1 import twitter_api_pool_util, twitter_rate_limit_util
+
+
+class ProgressReporter:
+    """
+    進捗報告
+
+    Notes:
+        - ページ取得のイテレータがページの到着ごとに`update`を呼び出し、進捗をログに出力する
+            - 取得件数、スループット(件／秒)、時間枠の残りリクエスト数、制限リセットまでの時間、残り時間
+        - 残りリクエスト数と制限リセット時刻はレート制限レジストリ(レスポンスヘッダ)の最新の値を使用する
+        - 残り時間は実際のページサイズと直近のページ間隔から算出し、レート制限による待機を加算する
+        - APIプールを指定した場合は、プール内の全ての認証情報のレート制限を合算する
+            - 残りリクエスト数と上限は合計、制限リセット時刻は最も早い時刻とする
+            - レスポンスを受信していない認証情報は合算に含めない(残り時間は長めに算出される)
+    """
+
+    def __init__(
+        self,
+        use_debug_mode: bool,
+        api: tweepy.API,
+        endpoint: str,
+        num_of_data: int = 0,
+        num_of_pages_for_rolling: int = 10,
+        api_pool: Optional[twitter_api_pool_util.TwitterApiPool] = None,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            use_debug_mode (bool)                       : デバッグモード使用有無
+            api (tweepy.API)                            : API
+            endpoint (str)                              : エンドポイント(1ページ1リクエストで取得するもの)(例：/friends/list)
+            num_of_data (int, optional)                 : データ数(0の場合は残り時間を算出しない)
+            num_of_pages_for_rolling (int, optional)    : 残り時間の算出に使用する直近のページ数
+            api_pool (Optional[TwitterApiPool])         : APIプール(リクエストを分散する場合に指定する)
+        """  # noqa: E501
+
+        self.__use_debug_mode: bool = use_debug_mode
+        self.__auth_contexts: list[str] = (
+            list(dict.fromkeys(api_pool.auth_contexts))
+            if api_pool is not None
+            else [twitter_rate_limit_util.generate_auth_context_of_api(api)]
+        )
+        self.__endpoint: str = endpoint
+        self.__num_of_data: int = num_of_data
+        self.__num_of_items: int = 0
+        self.__num_of_pages: int = 0
+        self.__started_at: float = time.time()
+        self.__page_arrived_ats: deque[float] = deque([self.__started_at], maxlen=num_of_pages_for_rolling + 1)
+
+    def update(
+        self,
+        num_of_items_by_page: int,
+    ) -> None:
+        """
+        更新
+
+        Args:
+            num_of_items_by_page (int) : ページの件数
+
+        Returns:
+            -
+        """
+
+        clg: Optional[pyl.CustomLogger] = None
+
+        try:
+            # ロガーの取得
+            clg = pyl.CustomLogger(__name__, use_debug_mode=self.__use_debug_mode)
+
+            # 進捗の更新
+            now: float = time.time()
+            self.__num_of_items += num_of_items_by_page
+            self.__num_of_pages += 1
+            self.__page_arrived_ats.append(now)
+
+            # 進捗の表示
+            progress_msg: str = f"取得件数：{self.__num_of_items}"
+            if self.__num_of_data > 0:
+                progress_msg += f"/{self.__num_of_data}"
+            progress_msg += f"件、スループット：{self.items_per_sec:.1f}件/秒"
+            rate_limit: Optional[twitter_rate_limit_util.RateLimit] = self.__get_rate_limit()
+            if rate_limit is not None:
+                progress_msg += (
+                    f"、残りリクエスト数(15分間隔)：{rate_limit.remaining}/{rate_limit.limit}"
+                    + f"、制限リセットまで：{max(math.ceil(rate_limit.reset - now), 0)}秒"
+                )
+            eta_sec: Optional[float] = self.calc_eta_sec(now)
+            if eta_sec is not None:
+                progress_msg += f"、残り時間：約{math.ceil(eta_sec / 60)}分"
+            clg.log_inf(f"{progress_msg} (endpoint:{self.__endpoint})")
+        except Exception as e:
+            raise (e)
+
+        return None
+
+    def calc_eta_sec(
+        self,
+        now: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        残り時間算出
+
+        Args:
+            now (Optional[float], optional) : 現在時刻(エポック秒)
+
+        Returns:
+            Optional[float]: 残り時間(秒)(算出できない場合はNone)
+
+        Notes:
+            - 残りページ数は実際の1ページあたりの件数から算出する
+            - 1ページあたりの時間は直近のページ間隔の中央値とする(待機による外れ値の影響を抑える)
+            - 残りページ数が時間枠の残りリクエスト数を超える場合は、制限リセットまでの時間と以降の時間枠の分を加算する
+        """  # noqa: E501
+
+        if self.__num_of_data <= 0 or self.__num_of_pages == 0 or self.__num_of_items == 0:
+            return None
+
+        now = now if now is not None else time.time()
+        num_of_remaining_items: int = max(self.__num_of_data - self.__num_of_items, 0)
+        num_of_remaining_pages: int = math.ceil(num_of_remaining_items / (self.__num_of_items / self.__num_of_pages))
+        page_arrived_ats: list[float] = list(self.__page_arrived_ats)
+        sec_per_page: float = statistics.median(
+            [
+                arrived_at - prev_arrived_at
+                for prev_arrived_at, arrived_at in zip(page_arrived_ats, page_arrived_ats[1:])
+            ]
+        )
+
+        eta_sec: float = num_of_remaining_pages * sec_per_page
+        rate_limit: Optional[twitter_rate_limit_util.RateLimit] = self.__get_rate_limit()
+        if rate_limit is not None and rate_limit.limit > 0 and num_of_remaining_pages > rate_limit.remaining:
+            num_of_overflow_pages: int = num_of_remaining_pages - rate_limit.remaining
+            num_of_windows: int = math.ceil(num_of_overflow_pages / rate_limit.limit)
+            eta_sec = (
+                max(rate_limit.reset - now, 0)
+                + (num_of_windows - 1) * twitter_rate_limit_util.RATE_LIMIT_WINDOW_SEC
+                + (num_of_overflow_pages - (num_of_windows - 1) * rate_limit.limit) * sec_per_page
+            )
+
+        return eta_sec
+
+    def __get_rate_limit(self) -> Optional[twitter_rate_limit_util.RateLimit]:
+        """レート制限取得(レート制限レジストリ)(認証情報が複数の場合は合算する)"""
+
+        rate_limits: list[twitter_rate_limit_util.RateLimit] = []
+        for auth_context in self.__auth_contexts:
+            rate_limit: Optional[
+                twitter_rate_limit_util.RateLimit
+            ] = twitter_rate_limit_util.get_rate_limit_registry().get(auth_context, self.__endpoint)
+            if rate_limit is not None:
+                rate_limits.append(rate_limit)
+
+        if len(rate_limits) == 0:
+            return None
+        elif len(rate_limits) == 1:
+            return rate_limits[0]
+
+        return twitter_rate_limit_util.RateLimit(
+            sum([rate_limit.limit for rate_limit in rate_limits]),
+            sum([rate_limit.remaining for rate_limit in rate_limits]),
+            min([rate_limit.reset for rate_limit in rate_limits]),
+            max([rate_limit.observed_at for rate_limit in rate_limits]),
+        )
+
+    @property
+    def num_of_items(self) -> int:
+        return self.__num_of_items
+
+    @property
+    def num_of_pages(self) -> int:
+        return self.__num_of_pages
+
+    @property
+    def items_per_sec(self) -> float:
+        elapsed_sec: float = time.time() - self.__started_at
+        return self.__num_of_items / elapsed_sec if elapsed_sec > 0 else 0.0
@@ -0,0 +1,330 @@
+import hashlib
+import re
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import unquote, urlparse
+
+import tweepy
+
+# レート制限の時間枠(秒)(Twitter API Standard v1.1 は15分間隔)
+RATE_LIMIT_WINDOW_SEC: int = 15 * 60
+
+
+class RateLimit:
+    """
+    レート制限
+
+    Notes:
+        - レスポンスヘッダ(x-rate-limit-*)から取得した1エンドポイント分のレート制限を保持する
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        remaining: int,
+        reset: int,
+        observed_at: float,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            limit (int)         : リクエスト数の上限(15分間隔)
+            remaining (int)     : 残りのリクエスト数
+            reset (int)         : 制限リセット時刻(エポック秒)
+            observed_at (float) : 取得時刻(エポック秒)
+        """
+
+        self.__limit: int = limit
+        self.__remaining: int = remaining
+        self.__reset: int = reset
+        self.__observed_at: float = observed_at
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """鮮度確認(制限リセット時刻を過ぎていない場合は最新とみなす)"""
+        return (now if now is not None else time.time()) < self.__reset
+
+    @property
+    def limit(self) -> int:
+        return self.__limit
+
+    @property
+    def remaining(self) -> int:
+        return self.__remaining
+
+    @property
+    def reset(self) -> int:
+        return self.__reset
+
+    @property
+    def observed_at(self) -> float:
+        return self.__observed_at
+
+
+class RateLimitRegistry:
+    """
+    レート制限レジストリ
+
+    Notes:
+        - 認証コンテキストとエンドポイントごとに最新のレート制限を保持する(プロセス全体で共有する)
+        - 認証コンテキストは認証情報のハッシュ値であり、認証情報そのものは保持しない
+        - 複数のスレッドから更新されても整合性を保つ
+    """
+
+    def __init__(self) -> None:
+        """コンストラクタ"""
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__rate_limits: dict[tuple[str, str], RateLimit] = {}
+
+    def record(
+        self,
+        auth_context: str,
+        endpoint: str,
+        rate_limit: RateLimit,
+    ) -> None:
+        """
+        レート制限記録
+
+        Args:
+            auth_context (str)      : 認証コンテキスト
+            endpoint (str)          : エンドポイント(例：/friends/list)
+            rate_limit (RateLimit)  : レート制限
+
+        Returns:
+            -
+
+        Notes:
+            - 順序が前後したレスポンスで新しい値を上書きしないよう、取得時刻が古い場合は記録しない
+        """
+
+        with self.__lock:
+            recorded_rate_limit: Optional[RateLimit] = self.__rate_limits.get((auth_context, endpoint))
+            if recorded_rate_limit is None or recorded_rate_limit.observed_at <= rate_limit.observed_at:
+                self.__rate_limits[(auth_context, endpoint)] = rate_limit
+
+        return None
+
+    def get(
+        self,
+        auth_context: str,
+        endpoint: str,
+        only_fresh: bool = True,
+    ) -> Optional[RateLimit]:
+        """
+        レート制限取得
+
+        Args:
+            auth_context (str)          : 認証コンテキスト
+            endpoint (str)              : エンドポイント(例：/friends/list)
+            only_fresh (bool, optional) : 最新のみ(制限リセット時刻を過ぎた場合はNoneを返却する)
+
+        Returns:
+            Optional[RateLimit]: レート制限
+        """
+
+        with self.__lock:
+            rate_limit: Optional[RateLimit] = self.__rate_limits.get((auth_context, endpoint))
+
+        if rate_limit is not None and only_fresh is True and rate_limit.is_fresh() is False:
+            rate_limit = None
+
+        return rate_limit
+
+    def clear(self) -> None:
+        """レート制限消去"""
+
+        with self.__lock:
+            self.__rate_limits.clear()
+
+        return None
+
+
+# レート制限レジストリ(プロセス全体で共有する)
+__rate_limit_registry: RateLimitRegistry = RateLimitRegistry()
+
+
+def get_rate_limit_registry() -> RateLimitRegistry:
+    """レート制限レジストリ取得"""
+    return __rate_limit_registry
+
+
+def generate_auth_context(
+    authorization: str,
+) -> str:
+    """
+    認証コンテキスト生成
+
+    Args:
+        authorization (str) : Authorizationヘッダ
+
+    Returns:
+        str: 認証コンテキスト (認証方式とハッシュ値)(判別できない場合は空文字)
+
+    Notes:
+        - ユーザ認証(OAuth 1.0a)の場合はコンシューマーキーとアクセストークンから生成する
+        - アプリ認証(OAuth 2.0)の場合はベアラートークンから生成する
+    """
+
+    auth_context: str = ""
+
+    if authorization.startswith("OAuth "):
+        oauth_params: dict[str, str] = {
+            key: unquote(value) for key, value in re.findall(r'(oauth_[a-z_]+)="([^"]*)"', authorization)
+        }
+        auth_context = __hash_auth_context(
+            "oauth1",
+            oauth_params.get("oauth_consumer_key", ""),
+            oauth_params.get("oauth_token", ""),
+        )
+    elif authorization.startswith("Bearer "):
+        auth_context = __hash_auth_context("oauth2", unquote(authorization[len("Bearer ") :]))
+
+    return auth_context
+
+
+def generate_auth_context_of_api(
+    api: tweepy.API,
+) -> str:
+    """
+    認証コンテキスト生成(API)
+
+    Args:
+        api (tweepy.API) : API
+
+    Returns:
+        str: 認証コンテキスト (認証方式とハッシュ値)(判別できない場合は空文字)
+
+    Notes:
+        - `generate_auth_context`でAuthorizationヘッダから生成した値と一致する
+    """
+
+    auth_context: str = ""
+
+    if isinstance(api.auth, tweepy.OAuth1UserHandler):
+        auth_context = __hash_auth_context("oauth1", str(api.auth.consumer_key), str(api.auth.access_token))
+    elif isinstance(api.auth, tweepy.OAuth2AppHandler):
+        auth_context = __hash_auth_context("oauth2", str(api.auth.apply_auth().bearer_token))
+
+    return auth_context
+
+
+def __hash_auth_context(auth_type: str, *credentials: str) -> str:
+    """認証コンテキストハッシュ化"""
+    return f"{auth_type}:" + hashlib.sha256(":".join(credentials).encode()).hexdigest()[:16]
+
+
+def convert_url_to_endpoint(
+    url: str,
+) -> str:
+    """
+    URLエンドポイント変換
+
+    Args:
+        url (str) : URL(例：https://api.twitter.com/1.1/friends/list.json?cursor=-1)
+
+    Returns:
+        str: エンドポイント (例：/friends/list)
+
+    Notes:
+        - `application/rate_limit_status`のリソースのキーと同じ形式に変換する
+    """
+
+    path: str = urlparse(url).path
+    path = re.sub(r"^/1\.1", "", path)
+    path = re.sub(r"\.json$", "", path)
+
+    return path
+
+
+def record_rate_limit_of_response(
+    response: Any,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    レート制限記録(レスポンス)
+
+    Args:
+        response (Any) : レスポンス (requests.Response)
+
+    Returns:
+        Any: レスポンス (requests.Response)(変更しない)
+
+    Notes:
+        - `requests.Session`のレスポンスフックとして使用する
+        - レート制限ヘッダを含まないレスポンスは記録しない
+    """
+
+    headers: Any = response.headers
+    if "x-rate-limit-remaining" in headers and "x-rate-limit-reset" in headers:
+        authorization: Any = response.request.headers.get("Authorization", "")
+        if isinstance(authorization, bytes):
+            authorization = authorization.decode()
+        get_rate_limit_registry().record(
+            generate_auth_context(str(authorization)),
+            convert_url_to_endpoint(str(response.request.url)),
+            RateLimit(
+                int(headers.get("x-rate-limit-limit", 0)),
+                int(headers["x-rate-limit-remaining"]),
+                int(headers["x-rate-limit-reset"]),
+                time.time(),
+            ),
+        )
+
+    return response
+
+
+def install_rate_limit_hook(
+    api: tweepy.API,
+) -> None:
+    """
+    レート制限フック導入
+
+    Args:
+        api (tweepy.API) : API
+
+    Returns:
+        -
+
+    Notes:
+        - APIが受信する全てのレスポンスのレート制限をレート制限レジストリに記録する
+    """
+
+    response_hooks: list[Any] = api.session.hooks.setdefault("response", [])
+    if not (record_rate_limit_of_response in response_hooks):
+        response_hooks.append(record_rate_limit_of_response)
+
+    return None
+
+
+def record_rate_limit_status(
+    api: tweepy.API,
+    rate_limit_status: dict[str, Any],
+) -> None:
+    """
+    レート制限記録(application/rate_limit_status)
+
+    Args:
+        api (tweepy.API)                    : API
+        rate_limit_status (dict[str, Any])  : レート制限(application/rate_limit_statusのレスポンス)
+
+    Returns:
+        -
+
+    Notes:
+        - 1回の取得で全てのエンドポイントのレート制限をレート制限レジストリに記録する
+    """
+
+    auth_context: str = generate_auth_context_of_api(api)
+    observed_at: float = time.time()
+    for resources_by_family in rate_limit_status.get("resources", {}).values():
+        for endpoint, rate_limit in resources_by_family.items():
+            get_rate_limit_registry().record(
+                auth_context,
+                endpoint,
+                RateLimit(rate_limit["limit"], rate_limit["remaining"], rate_limit["reset"], observed_at),
+            )
+
+    return None
@@ -0,0 +1,420 @@
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+import tweepy
+from requests.adapters import HTTPAdapter
+
+from twitter_app.util.twitter_api_v1_1 import twitter_rate_limit_util
+
+
+def generate_default_rate_limits() -> dict[tuple[str, str], int]:
+    """
+    既定レート制限生成
+
+    Args:
+        -
+
+    Returns:
+        dict[tuple[str, str], int]: レート制限 (キー：(認証方式, エンドポイント)、値：リクエスト数／１５分)
+
+    Notes:
+        - 各ユーティリティの列挙型に定義済みのリクエスト数を使用する
+        - 定義されていないエンドポイントはレスポンスヘッダから記録したレート制限のみで制御する
+        - 各ユーティリティはこのモジュールを(APIプール経由で)インポートするため、関数内でインポートする
+            - モジュールの先頭でインポートすると循環インポートになり、初期化中のモジュールを参照してしまう
+    """
+
+    from twitter_app.util.twitter_api_v1_1.standard import twitter_tweets_util, twitter_users_util
+
+    users_util = twitter_users_util
+    tweets_util = twitter_tweets_util
+
+    rate_limits: dict[tuple[str, str], int] = {
+        ("oauth1", "/friends/list"): users_util.EnumOfFollowee.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth2", "/friends/list"): users_util.EnumOfFollowee.EnumOfOauth2App.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/friends/ids"): users_util.EnumOfFolloweeId.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth2", "/friends/ids"): users_util.EnumOfFolloweeId.EnumOfOauth2App.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/followers/list"): users_util.EnumOfFollower.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth2", "/followers/list"): users_util.EnumOfFollower.EnumOfOauth2App.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/followers/ids"): users_util.EnumOfFollowerId.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth2", "/followers/ids"): users_util.EnumOfFollowerId.EnumOfOauth2App.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/lists/members"): users_util.EnumOfListMember.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth2", "/lists/members"): users_util.EnumOfListMember.EnumOfOauth2App.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/users/lookup"): users_util.EnumOfUserForLookup.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/friendships/lookup"): users_util.EnumOfFriendshipForLookup.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/blocks/list"): users_util.EnumOfBlockedUser.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/blocks/ids"): users_util.EnumOfBlockedUserId.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth1", "/search/tweets"): tweets_util.EnumOfTweetsInPast7Day.EnumOfOauth1User.MAX_NUM_OF_REQUESTS_PER_15MIN,
+        ("oauth2", "/search/tweets"): tweets_util.EnumOfTweetsInPast7Day.EnumOfOauth2App.MAX_NUM_OF_REQUESTS_PER_15MIN,
+    }
+
+    return rate_limits
+
+
+class RateLimitBucket:
+    """
+    レート制限バケット
+
+    Notes:
+        - 1つの認証コンテキストとエンドポイントに対するトークンバケット
+        - 時間枠ごとに上限数のトークンを補充する(Twitter API の固定時間枠に合わせる)
+        - トークンが枯渇した場合は次の時間枠のトークンを予約し、制限リセット時刻までの待機時間を返却する
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_sec: int = twitter_rate_limit_util.RATE_LIMIT_WINDOW_SEC,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            limit (int)                 : リクエスト数の上限(時間枠ごと)
+            window_sec (int, optional)  : 時間枠(秒)
+        """
+
+        self.__limit: int = limit
+        self.__window_sec: int = window_sec
+        self.__tokens: int = limit
+        self.__window_start: float = 0.0
+        self.__reset: float = 0.0
+        self.__synced_at: float = 0.0
+
+    def sync(
+        self,
+        rate_limit: twitter_rate_limit_util.RateLimit,
+    ) -> None:
+        """
+        同期(レスポンスヘッダのレート制限)
+
+        Args:
+            rate_limit (RateLimit) : レート制限
+
+        Returns:
+            -
+
+        Notes:
+            - サーバ側の値を正とし、残りのトークン数と制限リセット時刻を補正する
+            - 次の時間枠のトークンを予約済みの場合は補正しない
+        """
+
+        if rate_limit.observed_at <= self.__synced_at:
+            return None
+        self.__synced_at = rate_limit.observed_at
+
+        if rate_limit.reset < self.__reset and self.__window_start > rate_limit.observed_at:
+            return None
+
+        if rate_limit.limit > 0:
+            self.__limit = rate_limit.limit
+        if rate_limit.reset == self.__reset:
+            self.__tokens = min(self.__tokens, rate_limit.remaining)
+        else:
+            self.__tokens = rate_limit.remaining
+            self.__window_start = rate_limit.reset - self.__window_sec
+            self.__reset = rate_limit.reset
+
+        return None
+
+    def reserve(
+        self,
+        now: float,
+    ) -> float:
+        """
+        予約
+
+        Args:
+            now (float) : 現在時刻(エポック秒)
+
+        Returns:
+            float: 待機時間(秒)
+        """
+
+        # 時間枠の更新
+        if now >= self.__reset:
+            self.__tokens = self.__limit
+            self.__window_start = now
+            self.__reset = now + self.__window_sec
+
+        # 次の時間枠の予約
+        if self.__tokens <= 0:
+            self.__tokens = self.__limit
+            self.__window_start = self.__reset
+            self.__reset = self.__reset + self.__window_sec
+
+        self.__tokens -= 1
+
+        return max(self.__window_start - now, 0.0)
+
+    def estimate_wait_sec(
+        self,
+        now: float,
+    ) -> float:
+        """
+        待機時間見積もり
+
+        Args:
+            now (float) : 現在時刻(エポック秒)
+
+        Returns:
+            float: 待機時間(秒)
+
+        Notes:
+            - `reserve`と同じ待機時間を返却するが、トークンは消費しない
+        """
+
+        wait_sec: float = 0.0
+
+        if now >= self.__reset:
+            wait_sec = 0.0
+        elif self.__tokens > 0:
+            wait_sec = max(self.__window_start - now, 0.0)
+        else:
+            wait_sec = self.__reset - now
+
+        return wait_sec
+
+    @property
+    def limit(self) -> int:
+        return self.__limit
+
+    @property
+    def tokens(self) -> int:
+        return self.__tokens
+
+    @property
+    def reset(self) -> float:
+        return self.__reset
+
+
+class RateLimiter:
+    """
+    レート制限リミッター
+
+    Notes:
+        - 認証コンテキストとエンドポイントごとにバケットを保持する
+            - エンドポイントごとに独立して待機するため、複数エンドポイントを使用する処理が1つの制限で停滞しない
+        - 上限数は認証方式とエンドポイントから決定する(`generate_default_rate_limits`)
+            - 既定のレート制限は初めて使用する時に生成する(ユーティリティの読み込み順序に依存しないため)
+        - レート制限レジストリにレスポンスヘッダの記録がある場合はその値で補正する
+        - 複数のスレッドから使用されても整合性を保つ
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[dict[tuple[str, str], int]] = None,
+        rate_limit_registry: Optional[twitter_rate_limit_util.RateLimitRegistry] = None,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            rate_limits (Optional[dict[tuple[str, str], int]], optional)    : レート制限 (キー：(認証方式, エンドポイント))
+            rate_limit_registry (Optional[RateLimitRegistry], optional)     : レート制限レジストリ
+        """  # noqa: E501
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__rate_limits: Optional[dict[tuple[str, str], int]] = rate_limits
+        self.__rate_limit_registry: twitter_rate_limit_util.RateLimitRegistry = (
+            rate_limit_registry
+            if rate_limit_registry is not None
+            else twitter_rate_limit_util.get_rate_limit_registry()
+        )
+        self.__buckets: dict[tuple[str, str], RateLimitBucket] = {}
+
+    def reserve(
+        self,
+        auth_context: str,
+        endpoint: str,
+    ) -> float:
+        """
+        予約
+
+        Args:
+            auth_context (str)  : 認証コンテキスト
+            endpoint (str)      : エンドポイント(例：/friends/list)
+
+        Returns:
+            float: 待機時間(秒)(予約済みのため、待機後は必ずリクエストする必要がある)
+
+        Notes:
+            - 上限数が不明なエンドポイントはレスポンスヘッダの記録から初めてバケットを生成する
+        """
+
+        with self.__lock:
+            bucket: Optional[RateLimitBucket] = self.__get_bucket(auth_context, endpoint, True)
+            if bucket is None:
+                return 0.0
+
+            wait_sec: float = bucket.reserve(time.time())
+
+        return wait_sec
+
+    def estimate_wait_sec(
+        self,
+        auth_context: str,
+        endpoint: str,
+    ) -> float:
+        """
+        待機時間見積もり
+
+        Args:
+            auth_context (str)  : 認証コンテキスト
+            endpoint (str)      : エンドポイント(例：/friends/list)
+
+        Returns:
+            float: 待機時間(秒)
+
+        Notes:
+            - 予約せずに`reserve`の待機時間を見積もる(複数の認証情報からの選択に使用する)
+        """
+
+        with self.__lock:
+            bucket: Optional[RateLimitBucket] = self.__get_bucket(auth_context, endpoint, False)
+            if bucket is None:
+                return 0.0
+
+            wait_sec: float = bucket.estimate_wait_sec(time.time())
+
+        return wait_sec
+
+    def __get_bucket(
+        self,
+        auth_context: str,
+        endpoint: str,
+        keep_bucket: bool,
+    ) -> Optional[RateLimitBucket]:
+        """バケット取得(レスポンスヘッダの記録で補正する)(ロック取得済みであること)"""
+
+        rate_limit: Optional[twitter_rate_limit_util.RateLimit] = self.__rate_limit_registry.get(auth_context, endpoint)
+
+        bucket: Optional[RateLimitBucket] = self.__buckets.get((auth_context, endpoint))
+        if bucket is None:
+            if self.__rate_limits is None:
+                self.__rate_limits = generate_default_rate_limits()
+            auth_type: str = auth_context.split(":")[0]
+            limit: Optional[int] = self.__rate_limits.get((auth_type, endpoint))
+            if limit is None and rate_limit is not None and rate_limit.limit > 0:
+                limit = rate_limit.limit
+            if limit is None:
+                return None
+            bucket = RateLimitBucket(limit)
+            if keep_bucket is True:
+                self.__buckets[(auth_context, endpoint)] = bucket
+
+        if rate_limit is not None:
+            bucket.sync(rate_limit)
+
+        return bucket
+
+    def acquire(
+        self,
+        auth_context: str,
+        endpoint: str,
+    ) -> float:
+        """
+        取得
+
+        Args:
+            auth_context (str)  : 認証コンテキスト
+            endpoint (str)      : エンドポイント(例：/friends/list)
+
+        Returns:
+            float: 待機した時間(秒)
+
+        Notes:
+            - 予約し、制限リセット時刻まで待機する
+        """
+
+        wait_sec: float = self.reserve(auth_context, endpoint)
+        if wait_sec > 0:
+            time.sleep(wait_sec)
+
+        return wait_sec
+
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """
+    レート制限HTTPアダプタ
+
+    Notes:
+        - 送信前にリミッターからトークンを取得する
+        - 認証コンテキストとエンドポイントは送信するリクエストのヘッダとURLから決定する
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            rate_limiter (RateLimiter) : リミッター
+        """
+
+        super().__init__(*args, **kwargs)
+        self.__rate_limiter: RateLimiter = rate_limiter
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """送信"""
+
+        authorization: Any = request.headers.get("Authorization", "")
+        if isinstance(authorization, bytes):
+            authorization = authorization.decode()
+        auth_context: str = twitter_rate_limit_util.generate_auth_context(str(authorization))
+        if auth_context != "":
+            endpoint: str = twitter_rate_limit_util.convert_url_to_endpoint(str(request.url))
+            self.__rate_limiter.acquire(auth_context, endpoint)
+
+        return super().send(request, *args, **kwargs)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self.__rate_limiter
+
+
+# リミッター(プロセス全体で共有する)
+__rate_limiter: RateLimiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """リミッター取得"""
+    return __rate_limiter
+
+
+def install_rate_limiter(
+    api: tweepy.API,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> None:
+    """
+    リミッター導入
+
+    Args:
+        api (tweepy.API)                        : API
+        rate_limiter (Optional[RateLimiter])    : リミッター(未指定の場合は共有のリミッター)
+
+    Returns:
+        -
+
+    Notes:
+        - API が送信する全てのリクエストをエンドポイントごとのレート制限に合わせて待機させる
+        - `tweepy.API`の`wait_on_rate_limit`は予期しない超過に対する予備として併用する
+    """
+
+    adapter: RateLimitedHTTPAdapter = RateLimitedHTTPAdapter(
+        rate_limiter if rate_limiter is not None else get_rate_limiter()
+    )
+    api.session.mount(f"https://{api.host}/", adapter)
+
+    return None
@@ -0,0 +1,92 @@
+from typing import Any, Optional
+
+import orjson
+import python_lib_for_me as pyl
+import tweepy
+
+from twitter_app.util.twitter_api_v1_1 import twitter_record_util
+
+
+class RawJsonParser(tweepy.parsers.Parser):
+    """
+    生JSONパーサー
+
+    Notes:
+        - `tweepy.API`のメソッドの引数`parser`に指定し、レスポンスをモデルに変換せずにレコードに射影する
+            - ユーザは`UserRecord`、ツイートは`TweetRecord`に射影し、参照しない項目と入れ子のモデルを生成しない
+            - レコードは属性名で参照できるため、モデルを参照していた処理をそのまま使用できる
+        - JSONの解析は標準のjsonより高速なorjsonを使用する
+        - カーソルを返却する場合は`tweepy.Cursor`が期待する形式(結果, (前カーソル, 次カーソル))で返却する
+        - 射影できるペイロード種類はuser、status、search_resultsのみである
+    """  # noqa: E501
+
+    def parse(
+        self,
+        payload: Any,
+        *args: Any,
+        api: Optional[tweepy.API] = None,
+        payload_list: bool = False,
+        payload_type: Optional[str] = None,
+        return_cursors: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        解析
+
+        Args:
+            payload (Any)                           : ペイロード(レスポンスの本文)
+            api (Optional[tweepy.API], optional)    : API
+            payload_list (bool, optional)           : ペイロードリスト有無
+            payload_type (Optional[str], optional)  : ペイロード種類(例：user)
+            return_cursors (bool, optional)         : カーソル返却有無
+
+        Returns:
+            Any: 結果 (list[UserRecord]、list[TweetRecord]、UserRecord、TweetRecord)
+        """
+
+        json_obj: Any = orjson.loads(payload)
+
+        # 射影対象の取得
+        items: Any = json_obj
+        if isinstance(json_obj, dict) is True:
+            if payload_type == "search_results":
+                items = json_obj["statuses"]
+            elif payload_list is True:
+                items = json_obj["users"]
+
+        # 射影
+        result: Any = None
+        if payload_type == "user":
+            if isinstance(items, list) is True:
+                result = [twitter_record_util.UserRecord.from_json(item) for item in items]
+            else:
+                result = twitter_record_util.UserRecord.from_json(items)
+        elif payload_type in ("status", "search_results"):
+            if isinstance(items, list) is True:
+                result = [twitter_record_util.TweetRecord.from_json(item) for item in items]
+            else:
+                result = twitter_record_util.TweetRecord.from_json(items)
+        else:
+            raise (pyl.CustomError(f"生JSONパーサーが対応していないペイロード種類です。(payload_type:{payload_type})"))
+
+        # カーソルの返却
+        if return_cursors is True and isinstance(json_obj, dict) is True and "next_cursor" in json_obj:
+            return result, (json_obj.get("previous_cursor", 0), json_obj["next_cursor"])
+
+        return result
+
+
+def select_parser(
+    use_raw_json_parser: bool,
+) -> Optional[RawJsonParser]:
+    """
+    パーサー選択
+
+    Args:
+        use_raw_json_parser (bool) : 生JSONパーサー使用有無
+
+    Returns:
+        Optional[RawJsonParser]: パーサー (使用しない場合はNone(APIの既定のパーサーを使用する))
+    """
+
+    return RawJsonParser() if use_raw_json_parser is True else None
@@ -0,0 +1,208 @@
+from typing import Any, Iterable
+
+import tweepy
+
+
+class UserRecord:
+    """
+    ユーザレコード
+
+    Notes:
+        - ユーザ(tweepy.models.User)のうち、ロジックが参照する項目のみを保持する
+        - `__slots__`により`__dict__`を持たず、レスポンスのJSON(`_json`)も保持しない
+            - 数千〜数十万人を保持する処理(エクスポート、ストリームの対象等)のメモリ使用量を抑える
+        - 属性名はモデルと同じであるため、モデルを参照していた処理をそのまま使用できる
+    """
+
+    __slots__ = ("__id", "__screen_name", "__name", "__friends_count", "__followers_count", "__protected")
+
+    def __init__(
+        self,
+        id: int,
+        screen_name: str,
+        name: str,
+        friends_count: int = 0,
+        followers_count: int = 0,
+        protected: bool = False,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            id (int)                        : 数値ID
+            screen_name (str)               : ユーザID
+            name (str)                      : ユーザ名
+            friends_count (int, optional)   : フォロイー数
+            followers_count (int, optional) : フォロワー数
+            protected (bool, optional)      : 非公開有無
+        """
+
+        self.__id: int = id
+        self.__screen_name: str = screen_name
+        self.__name: str = name
+        self.__friends_count: int = friends_count
+        self.__followers_count: int = followers_count
+        self.__protected: bool = protected
+
+    @classmethod
+    def from_json(cls, user_json: dict[str, Any]) -> "UserRecord":
+        """生成(レスポンスのJSON)"""
+        return cls(
+            user_json["id"],
+            user_json["screen_name"],
+            user_json["name"],
+            user_json.get("friends_count", 0),
+            user_json.get("followers_count", 0),
+            user_json.get("protected", False),
+        )
+
+    @classmethod
+    def from_model(cls, user: Any) -> "UserRecord":
+        """生成(モデル)(tweepy.models.User)"""
+        return cls(
+            user.id,
+            user.screen_name,
+            user.name,
+            user.friends_count,
+            user.followers_count,
+            user.protected,
+        )
+
+    def __repr__(self) -> str:
+        return f"UserRecord(id={self.__id}, screen_name={self.__screen_name!r}, name={self.__name!r})"
+
+    @property
+    def id(self) -> int:
+        return self.__id
+
+    @property
+    def screen_name(self) -> str:
+        return self.__screen_name
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def friends_count(self) -> int:
+        return self.__friends_count
+
+    @property
+    def followers_count(self) -> int:
+        return self.__followers_count
+
+    @property
+    def protected(self) -> bool:
+        return self.__protected
+
+
+class TweetRecord:
+    """
+    ツイートレコード
+
+    Notes:
+        - ツイート(tweepy.models.Status)のうち、ロジックが参照する項目のみを保持する
+        - `__slots__`により`__dict__`を持たず、レスポンスのJSON(`_json`)も保持しない
+        - 作成日時はタイムゾーン付きの文字列で保持する(JSONの場合はレスポンスの文字列のまま)
+        - 属性名はモデルと同じであるため、モデルを参照していた処理をそのまま使用できる
+    """
+
+    __slots__ = ("__id", "__created_at", "__text", "__retweet_count", "__favorite_count", "__user")
+
+    def __init__(
+        self,
+        id: int,
+        created_at: str,
+        text: str,
+        retweet_count: int,
+        favorite_count: int,
+        user: UserRecord,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            id (int)                : 数値ID
+            created_at (str)        : 作成日時(例：Wed Oct 10 20:19:24 +0000 2018)
+            text (str)              : ツイート本文
+            retweet_count (int)     : リツイート数
+            favorite_count (int)    : いいね数
+            user (UserRecord)       : ユーザ
+        """
+
+        self.__id: int = id
+        self.__created_at: str = created_at
+        self.__text: str = text
+        self.__retweet_count: int = retweet_count
+        self.__favorite_count: int = favorite_count
+        self.__user: UserRecord = user
+
+    @classmethod
+    def from_json(cls, tweet_json: dict[str, Any]) -> "TweetRecord":
+        """生成(レスポンスのJSON)"""
+        return cls(
+            tweet_json["id"],
+            tweet_json["created_at"],
+            tweet_json.get("full_text", tweet_json.get("text", "")),
+            tweet_json.get("retweet_count", 0),
+            tweet_json.get("favorite_count", 0),
+            UserRecord.from_json(tweet_json["user"]),
+        )
+
+    @classmethod
+    def from_model(cls, tweet: Any) -> "TweetRecord":
+        """生成(モデル)(tweepy.models.Status)"""
+        return cls(
+            tweet.id,
+            tweet.created_at.isoformat(),
+            tweet.full_text if hasattr(tweet, "full_text") else tweet.text,
+            tweet.retweet_count,
+            tweet.favorite_count,
+            UserRecord.from_model(tweet.user),
+        )
+
+    def __repr__(self) -> str:
+        return f"TweetRecord(id={self.__id}, created_at={self.__created_at!r}, user={self.__user!r})"
+
+    @property
+    def id(self) -> int:
+        return self.__id
+
+    @property
+    def created_at(self) -> str:
+        return self.__created_at
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @property
+    def retweet_count(self) -> int:
+        return self.__retweet_count
+
+    @property
+    def favorite_count(self) -> int:
+        return self.__favorite_count
+
+    @property
+    def user(self) -> UserRecord:
+        return self.__user
+
+
+def convert_users_to_records(
+    users: Iterable[tweepy.models.User],
+) -> list[UserRecord]:
+    """
+    ユーザレコード変換
+
+    Args:
+        users (Iterable[tweepy.models.User]) : ユーザ(複数)
+
+    Returns:
+        list[UserRecord]: ユーザレコード(複数)
+
+    Notes:
+        - モデルで取得したユーザを長時間保持する場合に使用する(生JSONパーサーを使用する場合は不要)
+    """
+
+    return [UserRecord.from_model(user) for user in users]
@@ -0,0 +1,424 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+from twitter_app.util import const_util
+from twitter_app.util.twitter_api_v1_1 import twitter_record_util
+
+
+class UserStore:
+    """
+    ユーザストア
+
+    Notes:
+        - 取得したユーザをSQLiteに永続化し、有効期限内のユーザはAPIを使用せずに返却する
+            - 同じユーザを繰り返し取得する処理(ユーザ検索、ユーザ情報取得、リスト追加時の確認等)のリクエスト数を減らす
+            - プロセスを再実行しても有効期限内のユーザを再利用できる
+        - ユーザは数値IDとユーザID(大文字小文字を区別しない)で検索できる
+        - 有効期限(TTL)を超過したユーザは返却せず、保存時に削除する
+        - 保持数の上限を超過した場合は最終参照時刻が古いユーザから削除する(LRU)
+        - ユーザはUserRecordで返却する(ロジックが参照する項目のみを保持する)
+        - 問題ありユーザ(ネガティブキャッシュ)
+            - 検索で見つからなかったユーザID(削除・凍結)と保護されたユーザIDを、ユーザとは別の有効期限で保持する
+            - リスト追加時の確認で、有効期限内の問題ありユーザをAPIを使用せずに除外する
+            - 問題の理由
+                - missing   : 削除・凍結(検索で見つからない)
+                - protected : 保護
+    """  # noqa: E501
+
+    REASON_MISSING: str = "missing"
+    REASON_PROTECTED: str = "protected"
+
+    # SQLiteのパラメータ数の上限を超えないように分割する単位
+    __MAX_NUM_OF_PARAMS_PER_QUERY: int = 500
+
+    def __init__(
+        self,
+        user_store_file_path: str = const_util.USER_STORE_FILE_PATH,
+        ttl_sec: int = 24 * 60 * 60,
+        max_num_of_users: int = 100000,
+        problem_ttl_sec: int = 3 * 24 * 60 * 60,
+    ) -> None:
+        """
+        コンストラクタ
+
+        Args:
+            user_store_file_path (str, optional)    : ユーザストアファイルパス
+            ttl_sec (int, optional)                 : 有効期限(秒)(取得してからの経過時間)
+            max_num_of_users (int, optional)        : 最大保持数(ユーザと問題ありユーザのそれぞれ)
+            problem_ttl_sec (int, optional)         : 問題ありユーザの有効期限(秒)(記録してからの経過時間)
+        """
+
+        self.__user_store_file_path: str = user_store_file_path
+        self.__ttl_sec: int = ttl_sec
+        self.__max_num_of_users: int = max_num_of_users
+        self.__problem_ttl_sec: int = problem_ttl_sec
+
+        # テーブルの生成
+        os.makedirs(os.path.dirname(user_store_file_path) or ".", exist_ok=True)
+        with self.__connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS user (
+                    id              INTEGER PRIMARY KEY,
+                    screen_name_key TEXT    NOT NULL,
+                    screen_name     TEXT    NOT NULL,
+                    name            TEXT    NOT NULL,
+                    friends_count   INTEGER NOT NULL,
+                    followers_count INTEGER NOT NULL,
+                    protected       INTEGER NOT NULL,
+                    fetched_at      REAL    NOT NULL,
+                    accessed_at     REAL    NOT NULL
+                )
+                """
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_user_screen_name_key ON user (screen_name_key)")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_user_accessed_at ON user (accessed_at)")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS auth_user (
+                    auth_key        TEXT    PRIMARY KEY,
+                    id              INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS problem_user (
+                    screen_name_key TEXT    PRIMARY KEY,
+                    reason          TEXT    NOT NULL,
+                    recorded_at     REAL    NOT NULL
+                )
+                """
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_problem_user_recorded_at ON problem_user (recorded_at)")
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """接続(トランザクションの終了時にコミットして切断する)"""
+
+        connection: sqlite3.Connection = sqlite3.connect(self.__user_store_file_path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def generate_screen_name_key(screen_name: str) -> str:
+        """ユーザIDキー生成(大文字小文字を区別しない)"""
+        return screen_name.casefold()
+
+    @staticmethod
+    def generate_auth_key(access_token: str) -> str:
+        """認証キー生成(アクセストークンはハッシュ値のみを保存する)"""
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
+    def __get_users(
+        self,
+        column: str,
+        keys: list[Any],
+    ) -> list[twitter_record_util.UserRecord]:
+        """ユーザ取得(有効期限内のみ)(最終参照時刻を更新する)"""
+
+        now: float = time.time()
+        rows: list[sqlite3.Row] = []
+        with self.__connect() as connection:
+            connection.row_factory = sqlite3.Row
+            for index in range(0, len(keys), UserStore.__MAX_NUM_OF_PARAMS_PER_QUERY):
+                keys_by_query: list[Any] = keys[index : index + UserStore.__MAX_NUM_OF_PARAMS_PER_QUERY]
+                rows.extend(
+                    connection.execute(
+                        f"SELECT * FROM user WHERE {column} IN ({', '.join(['?'] * len(keys_by_query))}) "
+                        + "AND fetched_at >= ?",
+                        [*keys_by_query, now - self.__ttl_sec],
+                    ).fetchall()
+                )
+            connection.executemany(
+                "UPDATE user SET accessed_at = ? WHERE id = ?",
+                [(now, row["id"]) for row in rows],
+            )
+
+        return [
+            twitter_record_util.UserRecord(
+                row["id"],
+                row["screen_name"],
+                row["name"],
+                row["friends_count"],
+                row["followers_count"],
+                bool(row["protected"]),
+            )
+            for row in rows
+        ]
+
+    def get_users_by_screen_names(
+        self,
+        screen_names: list[str],
+    ) -> dict[str, twitter_record_util.UserRecord]:
+        """
+        ユーザ取得(ユーザID指定)
+
+        Args:
+            screen_names (list[str]) : ユーザID(複数)
+
+        Returns:
+            dict[str, UserRecord]: ユーザ (dict[ユーザIDキー, ユーザ])(有効期限内のユーザのみ)
+        """
+
+        screen_name_keys: list[str] = list(
+            {UserStore.generate_screen_name_key(screen_name) for screen_name in screen_names}
+        )
+        users: list[twitter_record_util.UserRecord] = self.__get_users("screen_name_key", screen_name_keys)
+
+        return {UserStore.generate_screen_name_key(user.screen_name): user for user in users}
+
+    def get_users_by_ids(
+        self,
+        user_ids: list[int],
+    ) -> dict[int, twitter_record_util.UserRecord]:
+        """
+        ユーザ取得(数値ID指定)
+
+        Args:
+            user_ids (list[int]) : 数値ID(複数)
+
+        Returns:
+            dict[int, UserRecord]: ユーザ (dict[数値ID, ユーザ])(有効期限内のユーザのみ)
+        """
+
+        users: list[twitter_record_util.UserRecord] = self.__get_users("id", list(set(user_ids)))
+
+        return {user.id: user for user in users}
+
+    def get_auth_user(
+        self,
+        access_token: str,
+    ) -> Optional[twitter_record_util.UserRecord]:
+        """
+        認証ユーザ取得
+
+        Args:
+            access_token (str) : アクセストークン
+
+        Returns:
+            Optional[UserRecord]: 認証ユーザ (保存していない場合、または有効期限を超過した場合はNone)
+        """
+
+        with self.__connect() as connection:
+            row: Any = connection.execute(
+                "SELECT id FROM auth_user WHERE auth_key = ?", (UserStore.generate_auth_key(access_token),)
+            ).fetchone()
+        if row is None:
+            return None
+
+        return self.get_users_by_ids([row[0]]).get(row[0])
+
+    def put_users(
+        self,
+        users: Iterable[Any],
+    ) -> list[twitter_record_util.UserRecord]:
+        """
+        ユーザ保存
+
+        Args:
+            users (Iterable[Any]) : ユーザ(複数)(UserRecord、またはtweepy.models.User)
+
+        Returns:
+            list[UserRecord]: 保存したユーザ(指定した順序)
+
+        Notes:
+            - 同じ数値IDのユーザは置き換える
+            - 同じユーザIDの別のユーザ(ユーザIDの変更により別のユーザが使用している場合)は削除する
+            - 保護されていないユーザは問題ありユーザから削除する(再作成や保護の解除に追従する)
+            - 保存後に有効期限を超過したユーザと保持数の上限を超過したユーザを削除する
+        """
+
+        user_records: list[twitter_record_util.UserRecord] = [
+            user
+            if isinstance(user, twitter_record_util.UserRecord)
+            else twitter_record_util.UserRecord.from_model(user)
+            for user in users
+        ]
+        if len(user_records) == 0:
+            return user_records
+
+        now: float = time.time()
+        with self.__connect() as connection:
+            connection.executemany(
+                "DELETE FROM user WHERE screen_name_key = ? AND id != ?",
+                [(UserStore.generate_screen_name_key(user.screen_name), user.id) for user in user_records],
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO user (id, screen_name_key, screen_name, name, friends_count, "
+                + "followers_count, protected, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        user.id,
+                        UserStore.generate_screen_name_key(user.screen_name),
+                        user.screen_name,
+                        user.name,
+                        user.friends_count,
+                        user.followers_count,
+                        int(user.protected),
+                        now,
+                        now,
+                    )
+                    for user in user_records
+                ],
+            )
+            connection.executemany(
+                "DELETE FROM problem_user WHERE screen_name_key = ?",
+                [
+                    (UserStore.generate_screen_name_key(user.screen_name),)
+                    for user in user_records
+                    if user.protected is False
+                ],
+            )
+            self.__evict_users(connection, now)
+
+        return user_records
+
+    def put_auth_user(
+        self,
+        access_token: str,
+        user: Any,
+    ) -> twitter_record_util.UserRecord:
+        """
+        認証ユーザ保存
+
+        Args:
+            access_token (str)  : アクセストークン
+            user (Any)          : 認証ユーザ(UserRecord、またはtweepy.models.User)
+
+        Returns:
+            UserRecord: 保存した認証ユーザ
+        """
+
+        user_record: twitter_record_util.UserRecord = self.put_users([user])[0]
+        with self.__connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO auth_user (auth_key, id) VALUES (?, ?)",
+                (UserStore.generate_auth_key(access_token), user_record.id),
+            )
+
+        return user_record
+
+    def __evict_users(
+        self,
+        connection: sqlite3.Connection,
+        now: float,
+    ) -> None:
+        """ユーザ削除(有効期限を超過したユーザ、保持数の上限を超過したユーザ)"""
+
+        connection.execute("DELETE FROM user WHERE fetched_at < ?", (now - self.__ttl_sec,))
+        connection.execute(
+            "DELETE FROM user WHERE id IN (SELECT id FROM user ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.__max_num_of_users,),
+        )
+        connection.execute("DELETE FROM auth_user WHERE id NOT IN (SELECT id FROM user)")
+        connection.execute("DELETE FROM problem_user WHERE recorded_at < ?", (now - self.__problem_ttl_sec,))
+        connection.execute(
+            "DELETE FROM problem_user WHERE screen_name_key IN "
+            + "(SELECT screen_name_key FROM problem_user ORDER BY recorded_at DESC LIMIT -1 OFFSET ?)",
+            (self.__max_num_of_users,),
+        )
+
+        return None
+
+    def get_problem_users(
+        self,
+        screen_names: list[str],
+    ) -> dict[str, str]:
+        """
+        問題ありユーザ取得
+
+        Args:
+            screen_names (list[str]) : ユーザID(複数)
+
+        Returns:
+            dict[str, str]: 問題ありユーザ (dict[ユーザIDキー, 問題の理由])(有効期限内の問題ありユーザのみ)
+        """
+
+        screen_name_keys: list[str] = list(
+            {UserStore.generate_screen_name_key(screen_name) for screen_name in screen_names}
+        )
+        problem_users: dict[str, str] = {}
+        with self.__connect() as connection:
+            for index in range(0, len(screen_name_keys), UserStore.__MAX_NUM_OF_PARAMS_PER_QUERY):
+                keys_by_query: list[str] = screen_name_keys[index : index + UserStore.__MAX_NUM_OF_PARAMS_PER_QUERY]
+                rows: list[Any] = connection.execute(
+                    "SELECT screen_name_key, reason FROM problem_user "
+                    + f"WHERE screen_name_key IN ({', '.join(['?'] * len(keys_by_query))}) AND recorded_at >= ?",
+                    [*keys_by_query, time.time() - self.__problem_ttl_sec],
+                ).fetchall()
+                problem_users.update({row[0]: row[1] for row in rows})
+
+        return problem_users
+
+    def put_problem_users(
+        self,
+        screen_names: list[str],
+        reason: str,
+    ) -> None:
+        """
+        問題ありユーザ保存
+
+        Args:
+            screen_names (list[str])    : ユーザID(複数)
+            reason (str)                : 問題の理由(REASON_MISSING、REASON_PROTECTED)
+
+        Returns:
+            -
+
+        Notes:
+            - 同じユーザIDの問題ありユーザは置き換える(記録時刻を更新する)
+            - 削除・凍結の場合は同じユーザIDのユーザを削除する
+        """
+
+        if len(screen_names) == 0:
+            return None
+
+        now: float = time.time()
+        screen_name_keys: list[str] = [UserStore.generate_screen_name_key(screen_name) for screen_name in screen_names]
+        with self.__connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO problem_user (screen_name_key, reason, recorded_at) VALUES (?, ?, ?)",
+                [(screen_name_key, reason, now) for screen_name_key in screen_name_keys],
+            )
+            if reason == UserStore.REASON_MISSING:
+                connection.executemany(
+                    "DELETE FROM user WHERE screen_name_key = ?",
+                    [(screen_name_key,) for screen_name_key in screen_name_keys],
+                )
+            self.__evict_users(connection, now)
+
+        return None
+
+    def clear(self) -> None:
+        """全ユーザ削除"""
+
+        with self.__connect() as connection:
+            connection.execute("DELETE FROM user")
+            connection.execute("DELETE FROM auth_user")
+            connection.execute("DELETE FROM problem_user")
+
+        return None
+
+    @property
+    def user_store_file_path(self) -> str:
+        return self.__user_store_file_path
+
+    @property
+    def ttl_sec(self) -> int:
+        return self.__ttl_sec
+
+    @property
+    def max_num_of_users(self) -> int:
+        return self.__max_num_of_users
+
+    @property
+    def problem_ttl_sec(self) -> int:
+        return self.__problem_ttl_sec